@@ -4,43 +4,104 @@ Data fetching utilities for external APIs
 This module provides clients for common data sources used across projects.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .factory import DataFetchingFactory
-from .census_client import CensusClient
-from .arxiv_client import ArxivClient, ArxivPaper, search_arxiv, get_paper_by_id
-from .archive_client import (
-    ArchiveClient,
-    ArchivedSnapshot,
-    ArchiveResult,
-    archive_url,
-    get_latest_archive,
-)
-from .semantic_scholar import (
-    SemanticScholarClient,
-    SemanticScholarPaper,
-    search_papers,
-    get_paper_by_doi,
-)
-from .github_client import GitHubClient
-from .wikipedia_client import WikipediaClient
-from .news_client import NewsClient
-from .weather_client import WeatherClient
-from .openlibrary_client import OpenLibraryClient
-from .nasa_client import NASAClient
-from .youtube_client import YouTubeClient
-from .finance_client import FinanceClient
-from .pubmed_client import (
-    PubMedClient,
-    PubMedArticle,
-    search_pubmed,
-    get_article_by_pmid,
-)
-from .wolfram_client import (
-    WolframAlphaClient,
-    WolframResult,
-    wolfram_query,
-    wolfram_calculate,
-)
-from .archive_client import MultiArchiveClient, get_archive
+
+if TYPE_CHECKING:
+    from .census_client import CensusClient
+    from .arxiv_client import ArxivClient, ArxivPaper, search_arxiv, get_paper_by_id
+    from .archive_client import (
+        ArchiveClient,
+        ArchivedSnapshot,
+        ArchiveResult,
+        archive_url,
+        get_latest_archive,
+        MultiArchiveClient,
+        AsyncArchiveClient,
+        AsyncMultiArchiveClient,
+        get_archive,
+        get_latest_archives,
+    )
+    from .semantic_scholar import (
+        SemanticScholarClient,
+        SemanticScholarPaper,
+        search_papers,
+        get_paper_by_doi,
+    )
+    from .github_client import GitHubClient, AsyncGitHubClient
+    from .wikipedia_client import WikipediaClient
+    from .news_client import NewsClient, AsyncNewsClient
+    from .weather_client import WeatherClient, AsyncWeatherClient
+    from .openlibrary_client import OpenLibraryClient, AsyncOpenLibraryClient
+    from .nasa_client import NASAClient, AsyncNASAClient
+    from .youtube_client import YouTubeClient
+    from .finance_client import FinanceClient, AsyncFinanceClient
+    from .pubmed_client import (
+        PubMedClient,
+        PubMedArticle,
+        search_pubmed,
+        get_article_by_pmid,
+        AsyncPubMedClient,
+    )
+    from .wolfram_client import (
+        WolframAlphaClient,
+        WolframResult,
+        AsyncWolframAlphaClient,
+        wolfram_query,
+        wolfram_calculate,
+    )
+    from .utils import run_many
+
+# Client modules are imported on first attribute access (PEP 562) so that using
+# one client does not pay for importing every other client's dependencies.
+_LAZY_IMPORTS = {
+    "CensusClient": "census_client",
+    "ArxivClient": "arxiv_client",
+    "ArxivPaper": "arxiv_client",
+    "search_arxiv": "arxiv_client",
+    "get_paper_by_id": "arxiv_client",
+    "ArchiveClient": "archive_client",
+    "ArchivedSnapshot": "archive_client",
+    "ArchiveResult": "archive_client",
+    "archive_url": "archive_client",
+    "get_latest_archive": "archive_client",
+    "SemanticScholarClient": "semantic_scholar",
+    "SemanticScholarPaper": "semantic_scholar",
+    "search_papers": "semantic_scholar",
+    "get_paper_by_doi": "semantic_scholar",
+    "GitHubClient": "github_client",
+    "WikipediaClient": "wikipedia_client",
+    "NewsClient": "news_client",
+    "WeatherClient": "weather_client",
+    "OpenLibraryClient": "openlibrary_client",
+    "NASAClient": "nasa_client",
+    "YouTubeClient": "youtube_client",
+    "FinanceClient": "finance_client",
+    "PubMedClient": "pubmed_client",
+    "PubMedArticle": "pubmed_client",
+    "search_pubmed": "pubmed_client",
+    "get_article_by_pmid": "pubmed_client",
+    "WolframAlphaClient": "wolfram_client",
+    "WolframResult": "wolfram_client",
+    "wolfram_query": "wolfram_client",
+    "wolfram_calculate": "wolfram_client",
+    "MultiArchiveClient": "archive_client",
+    "AsyncArchiveClient": "archive_client",
+    "AsyncMultiArchiveClient": "archive_client",
+    "get_archive": "archive_client",
+    "get_latest_archives": "archive_client",
+    "AsyncFinanceClient": "finance_client",
+    "AsyncGitHubClient": "github_client",
+    "AsyncNASAClient": "nasa_client",
+    "AsyncNewsClient": "news_client",
+    "AsyncOpenLibraryClient": "openlibrary_client",
+    "AsyncPubMedClient": "pubmed_client",
+    "AsyncWeatherClient": "weather_client",
+    "AsyncWolframAlphaClient": "wolfram_client",
+    "run_many": "utils",
+}
 
 # Alias for documentation compatibility
 ClientFactory = DataFetchingFactory
@@ -79,5 +140,31 @@ __all__ = [
     "wolfram_query",
     "wolfram_calculate",
     "MultiArchiveClient",
+    "AsyncArchiveClient",
+    "AsyncMultiArchiveClient",
     "get_archive",
+    "get_latest_archives",
+    "AsyncFinanceClient",
+    "AsyncGitHubClient",
+    "AsyncNASAClient",
+    "AsyncNewsClient",
+    "AsyncOpenLibraryClient",
+    "AsyncPubMedClient",
+    "AsyncWeatherClient",
+    "AsyncWolframAlphaClient",
+    "run_many",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,18 +5,57 @@ Programmatic access to the Internet Archive's Wayback Machine.
 Extracted from toollama for reuse across projects.
 """
 
+import asyncio
+import functools
+import random
+import sys
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import time
-from typing import Optional, List, Dict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Iterator, Tuple
+from datetime import datetime, timezone
 from dataclasses import dataclass
 
+from .utils import DATACLASS_SLOTS, json_loads
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from requests_cache import CachedSession
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def _parse_wayback_ts(s: str) -> datetime:
+    """Parse a YYYYMMDDhhmmss Wayback timestamp (much cheaper than strptime)"""
+    return datetime(
+        int(s[0:4]), int(s[4:6]), int(s[6:8]),
+        int(s[8:10]), int(s[10:12]), int(s[12:14])
+    )
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ArchivedSnapshot:
     """Represents an archived snapshot from the Wayback Machine"""
     url: str
@@ -29,8 +68,7 @@ class ArchivedSnapshot:
     def from_api_response(cls, data: Dict, original_url: str) -> 'ArchivedSnapshot':
         """Create ArchivedSnapshot from Wayback API response"""
         timestamp_str = data.get('timestamp', '')
-        # Parse timestamp format: YYYYMMDDhhmmss
-        timestamp = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S') if timestamp_str else datetime.now()
+        timestamp = _parse_wayback_ts(timestamp_str) if timestamp_str else datetime.now()
 
         return cls(
             url=data.get('url', ''),
@@ -40,8 +78,26 @@ class ArchivedSnapshot:
             archive_url=data.get('url', '')
         )
 
+    @classmethod
+    def from_cdx_row(cls, row: List[str], original_url: str) -> 'ArchivedSnapshot':
+        """Create ArchivedSnapshot from a CDX result row"""
+        # CDX format: [urlkey, timestamp, original, mimetype, statuscode, digest, length]
+        archive_url = f"https://web.archive.org/web/{row[1]}/{row[2]}"
+        return cls(
+            url=archive_url,
+            timestamp=_parse_wayback_ts(row[1]),
+            status_code=int(row[4]),
+            original_url=original_url,
+            archive_url=archive_url
+        )
+
+
+def _is_after(snapshot: 'ArchivedSnapshot', moment: datetime) -> bool:
+    """Whether a snapshot's (naive, UTC) Wayback timestamp is at or after an aware moment"""
+    return snapshot.timestamp.replace(tzinfo=timezone.utc) >= moment
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ArchiveResult:
     """Result of an archive operation"""
     success: bool
@@ -50,37 +106,190 @@ class ArchiveResult:
     error: Optional[str] = None
 
 
-class ArchiveClient:
+def _create_session(
+    headers: Dict[str, str],
+    cache_backend: Optional[str] = None
+) -> requests.Session:
+    """Build a pooled session, optionally backed by requests-cache"""
+    if cache_backend:
+        if not REQUESTS_CACHE_AVAILABLE:
+            raise ImportError(
+                "requests-cache library required. Install with: pip install requests-cache"
+            )
+        session = CachedSession(
+            cache_name='wayback_cache',
+            backend=cache_backend,
+            expire_after=300,
+            cache_control=True
+        )
+    else:
+        session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(headers)
+    return session
+
+
+# Status codes worth retrying; 429/503 may carry a Retry-After header
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class _RetryMixin:
+    """Retry helper shared by the sync archive clients (expects self.session and self.headers)"""
+
+    session: requests.Session
+    headers: Dict[str, str]
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    jitter: bool = True
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to wait before the next attempt, honoring Retry-After when present"""
+        if response is not None and response.status_code in (429, 503):
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass  # HTTP-date form; fall back to backoff
+
+        # Full jitter: sleep = random() * min(cap, base * 2**attempt)
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return random.random() * delay if self.jitter else delay
+
+    def _poll_delay(self, retry_delay: float, attempt: int) -> float:
+        """Seconds to wait before completion check number `attempt`"""
+        delay = min(self.max_delay, retry_delay * 2 ** attempt)
+        return random.random() * delay if self.jitter else delay
+
+    def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        fresh: bool = False,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Send a request, retrying connection errors, timeouts, 429 and 5xx responses.
+
+        The final response is returned even if its status is retryable, so
+        callers can still use raise_for_status(). With fresh=True a
+        requests-cache session goes to the network instead of answering
+        from its HTTP cache.
+        """
+        # Sent per request: a shared session passed in lacks this client's headers
+        kwargs.setdefault('headers', self.headers)
+        if fresh and REQUESTS_CACHE_AVAILABLE and isinstance(self.session, CachedSession):
+            kwargs['force_refresh'] = True
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.debug(f"{method} {url} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+                delay = self._retry_delay(attempt, response)
+                # Hand the connection back to the pool (stream=True holds it open)
+                response.close()
+                logger.debug(
+                    f"{method} {url} returned {response.status_code}, retrying in {delay:.1f}s"
+                )
+            time.sleep(delay)
+            attempt += 1
+
+
+class ArchiveClient(_RetryMixin):
     """Client for interacting with the Internet Archive Wayback Machine"""
 
     WAYBACK_SAVE_URL = "https://web.archive.org/save/"
     WAYBACK_AVAIL_URL = "https://archive.org/wayback/available"
     WAYBACK_CDX_URL = "https://web.archive.org/cdx/search/cdx"
 
-    def __init__(self, user_agent: Optional[str] = None):
+    # Shared by every instance using the default UA; never mutated
+    _DEFAULT_HEADERS = {
+        "User-Agent": DEFAULT_USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+    }
+
+    def __init__(
+        self,
+        user_agent: Optional[str] = None,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        cache_ttl: float = 300,
+        cache_backend: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize Archive client.
 
         Args:
             user_agent: Custom user agent string (default: generic browser UA)
+            max_retries: Retries for connection errors, 429 and 5xx responses (default: 3)
+            base_delay: Initial backoff delay in seconds (default: 1.0)
+            max_delay: Maximum backoff delay in seconds (default: 30.0)
+            jitter: Randomize backoff delays to avoid synchronized retries (default: True)
+            cache_ttl: Seconds to cache latest-snapshot lookups; 0 disables (default: 300)
+            cache_backend: requests-cache backend (e.g. "sqlite", "memory") for HTTP-level
+                           caching that honors Cache-Control/ETag; None disables (default)
+            session: Existing session to share with another client. The caller keeps
+                     ownership and close() leaves it open (default: create one)
         """
-        self.user_agent = user_agent or (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.cache_ttl = cache_ttl
+        self._snapshot_cache: Dict[str, Tuple[float, Optional[ArchivedSnapshot]]] = {}
+
+        self.headers = (
+            {**self._DEFAULT_HEADERS, "User-Agent": user_agent}
+            if user_agent else self._DEFAULT_HEADERS
         )
 
-        self.headers = {
-            "User-Agent": self.user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
+        # Reuse connections to web.archive.org / archive.org across calls
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            self.session = _create_session(self.headers, cache_backend)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> 'ArchiveClient':
+        return self
 
-    def get_latest_snapshot(self, url: str) -> Optional[ArchivedSnapshot]:
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def clear_cache(self) -> None:
+        """Drop all cached snapshot lookups."""
+        self._snapshot_cache.clear()
+
+    def get_latest_snapshot(self, url: str, fresh: bool = False) -> Optional[ArchivedSnapshot]:
         """
         Get the most recent archived snapshot of a URL.
 
+        Lookups are cached for cache_ttl seconds; network errors are not cached.
+
         Args:
             url: URL to check for archives
+            fresh: Bypass the cache and query the API (default: False)
 
         Returns:
             ArchivedSnapshot if found, None otherwise
@@ -91,28 +300,37 @@ class ArchiveClient:
             >>> snapshot.archive_url  # doctest: +SKIP
             'https://web.archive.org/web/20231201120000/https://example.com'
         """
+        if not fresh and self.cache_ttl > 0:
+            cached = self._snapshot_cache.get(url)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
         try:
             logger.info(f"Checking for archived snapshots of: {url}")
 
-            response = requests.get(
+            response = self._request_with_retry(
+                'GET',
                 self.WAYBACK_AVAIL_URL,
+                fresh=fresh,
                 params={'url': url},
-                headers=self.headers,
                 timeout=30
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
 
             # Check if we have archived snapshots
             closest = data.get('archived_snapshots', {}).get('closest')
 
             if not closest:
                 logger.info(f"No archived snapshots found for: {url}")
-                return None
+                snapshot = None
+            else:
+                snapshot = ArchivedSnapshot.from_api_response(closest, url)
+                logger.info(f"Found snapshot from {snapshot.timestamp}")
 
-            snapshot = ArchivedSnapshot.from_api_response(closest, url)
-            logger.info(f"Found snapshot from {snapshot.timestamp}")
+            if self.cache_ttl > 0:
+                self._snapshot_cache[url] = (time.monotonic() + self.cache_ttl, snapshot)
             return snapshot
 
         except requests.exceptions.RequestException as e:
@@ -126,7 +344,9 @@ class ArchiveClient:
         self,
         url: str,
         wait_for_completion: bool = True,
-        retry_delay: int = 5
+        retry_delay: int = 5,
+        max_poll_attempts: int = 5,
+        check_existing: bool = True
     ) -> ArchiveResult:
         """
         Archive a URL in the Wayback Machine.
@@ -134,7 +354,11 @@ class ArchiveClient:
         Args:
             url: URL to archive
             wait_for_completion: Whether to wait and verify archiving (default: True)
-            retry_delay: Seconds to wait before checking if archived (default: 5)
+            retry_delay: Base delay in seconds between completion checks; doubles
+                         after each attempt up to max_delay (default: 5)
+            max_poll_attempts: Maximum number of completion checks (default: 5)
+            check_existing: Return an existing snapshot instead of re-archiving;
+                            False always submits a save request (default: True)
 
         Returns:
             ArchiveResult with success status and archive URL
@@ -149,7 +373,7 @@ class ArchiveClient:
         """
         try:
             # First check if already archived
-            existing = self.get_latest_snapshot(url)
+            existing = self.get_latest_snapshot(url) if check_existing else None
             if existing:
                 logger.info(f"URL already archived: {existing.archive_url}")
                 return ArchiveResult(
@@ -161,10 +385,13 @@ class ArchiveClient:
             # Request archiving
             save_url = f"{self.WAYBACK_SAVE_URL}{url}"
             logger.info(f"Requesting archive of: {url}")
+            # Wayback timestamps are UTC with second precision
+            request_start = datetime.now(timezone.utc).replace(microsecond=0)
 
-            response = requests.get(
+            response = self._request_with_retry(
+                'GET',
                 save_url,
-                headers=self.headers,
+                fresh=True,
                 allow_redirects=True,
                 timeout=60
             )
@@ -178,26 +405,26 @@ class ArchiveClient:
                     error=None if response.status_code in [200, 302] else f"Status code: {response.status_code}"
                 )
 
-            # Wait for archiving to complete
-            logger.info(f"Waiting {retry_delay}s for archiving to complete...")
-            time.sleep(retry_delay)
+            # Poll with backoff until a snapshot newer than our request appears
+            for attempt in range(max_poll_attempts):
+                delay = self._poll_delay(retry_delay, attempt)
+                logger.info(f"Waiting {delay:.1f}s for archiving to complete...")
+                time.sleep(delay)
 
-            # Check for archived version
-            snapshot = self.get_latest_snapshot(url)
+                snapshot = self.get_latest_snapshot(url, fresh=True)
+                if snapshot and _is_after(snapshot, request_start):
+                    logger.info(f"Successfully archived: {snapshot.archive_url}")
+                    return ArchiveResult(
+                        success=True,
+                        archive_url=snapshot.archive_url,
+                        snapshot=snapshot
+                    )
 
-            if snapshot:
-                logger.info(f"Successfully archived: {snapshot.archive_url}")
-                return ArchiveResult(
-                    success=True,
-                    archive_url=snapshot.archive_url,
-                    snapshot=snapshot
-                )
-            else:
-                logger.warning("Archive request submitted but snapshot not found")
-                return ArchiveResult(
-                    success=False,
-                    error="Archive request submitted but snapshot not yet available"
-                )
+            logger.warning("Archive request submitted but snapshot not found")
+            return ArchiveResult(
+                success=False,
+                error="Archive request submitted but snapshot not yet available"
+            )
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error archiving URL: {e}")
@@ -233,18 +460,18 @@ class ArchiveClient:
 
             logger.info(f"Getting snapshot of {url} near {timestamp_str}")
 
-            response = requests.get(
+            response = self._request_with_retry(
+                'GET',
                 self.WAYBACK_AVAIL_URL,
                 params={
                     'url': url,
                     'timestamp': timestamp_str
                 },
-                headers=self.headers,
                 timeout=30
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
             closest = data.get('archived_snapshots', {}).get('closest')
 
             if not closest:
@@ -257,6 +484,72 @@ class ArchiveClient:
             logger.error(f"Error getting snapshot at timestamp: {e}")
             return None
 
+    def iter_all_snapshots(
+        self,
+        url: str,
+        limit: int = 100,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None
+    ) -> Iterator[ArchivedSnapshot]:
+        """
+        Stream archived snapshots for a URL as they are downloaded.
+
+        The CDX response is parsed incrementally when ijson is installed, so
+        large result sets never have to be held in memory at once.
+
+        Args:
+            url: URL to get snapshots for
+            limit: Maximum number of snapshots to return (default: 100)
+            from_date: Start date for snapshot range (optional)
+            to_date: End date for snapshot range (optional)
+
+        Yields:
+            ArchivedSnapshot objects in CDX order
+
+        Raises:
+            requests.RequestException: If the CDX request fails
+        """
+        logger.info(f"Getting all snapshots for: {url}")
+
+        params = {
+            'url': url,
+            'output': 'json',
+            'limit': limit
+        }
+
+        if from_date:
+            params['from'] = from_date.strftime('%Y%m%d')
+        if to_date:
+            params['to'] = to_date.strftime('%Y%m%d')
+
+        response = self._request_with_retry(
+            'GET',
+            self.WAYBACK_CDX_URL,
+            params=params,
+            timeout=60,
+            stream=True
+        )
+        try:
+            response.raise_for_status()
+
+            # CDX returns array of arrays; an empty body means no captures
+            if IJSON_AVAILABLE:
+                response.raw.decode_content = True
+                rows = ijson.items(response.raw, 'item')
+                try:
+                    next(rows, None)  # Skip header row
+                except ijson.IncompleteJSONError:
+                    return  # Empty body, before any row was read
+            else:
+                rows = iter(json_loads(response.content) if response.content.strip() else [])
+                next(rows, None)  # Skip header row
+
+            for row in rows:
+                if len(row) >= 5:
+                    yield ArchivedSnapshot.from_cdx_row(row, url)
+        finally:
+            response.close()
+
     def get_all_snapshots(
         self,
         url: str,
@@ -283,54 +576,12 @@ class ArchiveClient:
             10
         """
         try:
-            logger.info(f"Getting all snapshots for: {url}")
-
-            params = {
-                'url': url,
-                'output': 'json',
-                'limit': limit
-            }
-
-            if from_date:
-                params['from'] = from_date.strftime('%Y%m%d')
-            if to_date:
-                params['to'] = to_date.strftime('%Y%m%d')
-
-            response = requests.get(
-                self.WAYBACK_CDX_URL,
-                params=params,
-                headers=self.headers,
-                timeout=60
-            )
-            response.raise_for_status()
-
-            data = response.json()
+            snapshots = list(self.iter_all_snapshots(url, limit, from_date, to_date))
 
-            # CDX returns array of arrays, skip header row
-            if not data or len(data) < 2:
+            if not snapshots:
                 logger.info("No snapshots found")
-                return []
-
-            snapshots = []
-            for row in data[1:]:  # Skip header
-                if len(row) >= 5:
-                    # CDX format: [urlkey, timestamp, original, mimetype, statuscode, digest, length]
-                    snapshot_data = {
-                        'url': f"https://web.archive.org/web/{row[1]}/{row[2]}",
-                        'timestamp': row[1],
-                        'status': row[4] if len(row) > 4 else '200'
-                    }
-
-                    timestamp = datetime.strptime(row[1], '%Y%m%d%H%M%S')
-                    snapshots.append(ArchivedSnapshot(
-                        url=snapshot_data['url'],
-                        timestamp=timestamp,
-                        status_code=int(snapshot_data['status']),
-                        original_url=url,
-                        archive_url=snapshot_data['url']
-                    ))
-
-            logger.info(f"Found {len(snapshots)} snapshots")
+            else:
+                logger.info(f"Found {len(snapshots)} snapshots")
             return snapshots
 
         except Exception as e:
@@ -350,7 +601,7 @@ def archive_url(url: str, wait: bool = True) -> ArchiveResult:
     Returns:
         ArchiveResult with archive URL
     """
-    client = ArchiveClient()
+    client = _get_default_client().wayback_client
     return client.archive_url(url, wait_for_completion=wait)
 
 
@@ -364,12 +615,12 @@ def get_latest_archive(url: str) -> Optional[str]:
     Returns:
         Archive URL string or None
     """
-    client = ArchiveClient()
+    client = _get_default_client().wayback_client
     snapshot = client.get_latest_snapshot(url)
     return snapshot.archive_url if snapshot else None
 
 
-class MultiArchiveClient:
+class MultiArchiveClient(_RetryMixin):
     """
     Client supporting multiple archive providers.
 
@@ -378,51 +629,121 @@ class MultiArchiveClient:
 
     PROVIDERS = ['wayback', 'archiveis', 'memento', '12ft']
 
-    def __init__(self, user_agent: Optional[str] = None):
-        """Initialize multi-archive client"""
-        self.user_agent = user_agent or (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    _DEFAULT_HEADERS = {"User-Agent": DEFAULT_USER_AGENT}
+
+    # Provider name -> handler method; every handler takes (url, capture, fresh)
+    _DISPATCH = {
+        'wayback': '_get_wayback',
+        'archiveis': '_get_archiveis',
+        'memento': '_get_memento',
+        '12ft': '_get_12ft',
+    }
+
+    def __init__(
+        self,
+        user_agent: Optional[str] = None,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        cache_ttl: float = 300,
+        cache_backend: Optional[str] = None
+    ):
+        """
+        Initialize multi-archive client.
+
+        Args:
+            user_agent: Custom user agent string (default: generic browser UA)
+            max_retries: Retries for connection errors, 429 and 5xx responses (default: 3)
+            base_delay: Initial backoff delay in seconds (default: 1.0)
+            max_delay: Maximum backoff delay in seconds (default: 30.0)
+            jitter: Randomize backoff delays to avoid synchronized retries (default: True)
+            cache_ttl: Seconds to cache successful provider lookups; 0 disables (default: 300)
+            cache_backend: requests-cache backend (e.g. "sqlite", "memory") for HTTP-level
+                           caching that honors Cache-Control/ETag; None disables (default)
+        """
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.headers = {"User-Agent": user_agent} if user_agent else self._DEFAULT_HEADERS
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[str, str], Tuple[float, ArchiveResult]] = {}
+
+        # One pool for every provider, including the Wayback client
+        self.session = _create_session(self.headers, cache_backend)
+        self.wayback_client = ArchiveClient(
+            user_agent=user_agent,
+            max_retries=max_retries,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            jitter=jitter,
+            cache_ttl=cache_ttl,
+            session=self.session
         )
-        self.headers = {"User-Agent": self.user_agent}
-        self.wayback_client = ArchiveClient(user_agent=user_agent)
+
+    def close(self) -> None:
+        """Close the HTTP session shared by all providers."""
+        self.session.close()
+
+    def __enter__(self) -> 'MultiArchiveClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def clear_cache(self) -> None:
+        """Drop all cached provider lookups."""
+        self._cache.clear()
+        self.wayback_client.clear_cache()
 
     def get_archive(
         self,
         url: str,
         provider: str = 'wayback',
-        capture: bool = False
+        capture: bool = False,
+        fresh: bool = False
     ) -> ArchiveResult:
         """
         Get archived version of URL from specified provider.
 
+        Successful lookups are cached for cache_ttl seconds.
+
         Args:
             url: URL to find archived version for
             provider: Archive provider (wayback, archiveis, memento, 12ft)
             capture: Whether to capture new snapshot (archiveis only)
+            fresh: Bypass the cache and query the provider (default: False)
 
         Returns:
             ArchiveResult with archived URL
         """
-        provider = provider.lower()
-
-        if provider == 'wayback':
-            return self._get_wayback(url)
-        elif provider == 'archiveis':
-            return self._get_archiveis(url, capture)
-        elif provider == 'memento':
-            return self._get_memento(url)
-        elif provider == '12ft':
-            return self._get_12ft(url)
-        else:
+        provider = sys.intern(provider.lower())
+        method_name = self._DISPATCH.get(provider)
+        if method_name is None:
             return ArchiveResult(
                 success=False,
                 error=f"Unknown provider: {provider}. Use: {', '.join(self.PROVIDERS)}"
             )
 
-    def _get_wayback(self, url: str) -> ArchiveResult:
+        cache_key = (provider, url)
+        use_cache = self.cache_ttl > 0 and not capture
+
+        if use_cache and not fresh:
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+        result = getattr(self, method_name)(url, capture, fresh)
+
+        if use_cache and result.success:
+            self._cache[cache_key] = (time.monotonic() + self.cache_ttl, result)
+        return result
+
+    def _get_wayback(self, url: str, capture: bool = False, fresh: bool = False) -> ArchiveResult:
         """Get from Wayback Machine"""
-        snapshot = self.wayback_client.get_latest_snapshot(url)
+        snapshot = self.wayback_client.get_latest_snapshot(url, fresh=fresh)
         if snapshot:
             return ArchiveResult(
                 success=True,
@@ -431,7 +752,7 @@ class MultiArchiveClient:
             )
         return ArchiveResult(success=False, error="No Wayback snapshot found")
 
-    def _get_archiveis(self, url: str, capture: bool = False) -> ArchiveResult:
+    def _get_archiveis(self, url: str, capture: bool = False, fresh: bool = False) -> ArchiveResult:
         """Get from Archive.is"""
         try:
             if capture:
@@ -448,9 +769,10 @@ class MultiArchiveClient:
 
             # Check existing archive
             archived_url = f"https://archive.is/{url}"
-            response = requests.head(
+            response = self._request_with_retry(
+                'HEAD',
                 archived_url,
-                headers=self.headers,
+                fresh=fresh,
                 timeout=10,
                 allow_redirects=True
             )
@@ -466,7 +788,7 @@ class MultiArchiveClient:
         except Exception as e:
             return ArchiveResult(success=False, error=f"Archive.is error: {e}")
 
-    def _get_memento(self, url: str) -> ArchiveResult:
+    def _get_memento(self, url: str, capture: bool = False, fresh: bool = False) -> ArchiveResult:
         """Get from Memento Aggregator"""
         try:
             # Ensure URL has protocol
@@ -474,10 +796,10 @@ class MultiArchiveClient:
                 url = 'http://' + url
 
             api_url = f"http://timetravel.mementoweb.org/timemap/json/{url}"
-            response = requests.get(api_url, headers=self.headers, timeout=10)
+            response = self._request_with_retry('GET', api_url, fresh=fresh, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
             mementos = data.get("mementos", {}).get("list", [])
 
             if mementos:
@@ -492,13 +814,14 @@ class MultiArchiveClient:
         except Exception as e:
             return ArchiveResult(success=False, error=f"Memento error: {e}")
 
-    def _get_12ft(self, url: str) -> ArchiveResult:
+    def _get_12ft(self, url: str, capture: bool = False, fresh: bool = False) -> ArchiveResult:
         """Get 12ft.io bypass URL"""
         try:
             archived_url = f"https://12ft.io/{url}"
-            response = requests.head(
+            response = self._request_with_retry(
+                'HEAD',
                 archived_url,
-                headers=self.headers,
+                fresh=fresh,
                 timeout=10,
                 allow_redirects=False
             )
@@ -519,7 +842,7 @@ class MultiArchiveClient:
 
     def get_all_archives(self, url: str) -> Dict[str, ArchiveResult]:
         """
-        Try all providers and return results.
+        Try all providers concurrently and return results.
 
         Args:
             url: URL to find archives for
@@ -527,10 +850,19 @@ class MultiArchiveClient:
         Returns:
             Dict mapping provider name to ArchiveResult
         """
-        results = {}
-        for provider in self.PROVIDERS:
-            results[provider] = self.get_archive(url, provider)
-        return results
+        # Providers live on different hosts, so query them in parallel
+        with ThreadPoolExecutor(max_workers=len(self.PROVIDERS)) as executor:
+            futures = {
+                provider: executor.submit(self.get_archive, url, provider)
+                for provider in self.PROVIDERS
+            }
+            return {provider: future.result() for provider, future in futures.items()}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_client() -> MultiArchiveClient:
+    """Shared client for the convenience functions so they reuse one connection pool"""
+    return MultiArchiveClient()
 
 
 # Convenience function for multi-provider
@@ -545,6 +877,450 @@ def get_archive(url: str, provider: str = 'wayback') -> Optional[str]:
     Returns:
         Archived URL or None
     """
-    client = MultiArchiveClient()
+    client = _get_default_client()
     result = client.get_archive(url, provider)
     return result.archive_url if result.success else None
+
+
+class AsyncArchiveClient:
+    """
+    Asynchronous Wayback Machine client.
+
+    Uses a single aiohttp session for all requests so many URLs can be looked up
+    concurrently. Use as an async context manager or call close() when done.
+
+    Example:
+        >>> async with AsyncArchiveClient() as client:  # doctest: +SKIP
+        ...     snapshots = await client.get_latest_snapshots(urls)
+    """
+
+    WAYBACK_SAVE_URL = ArchiveClient.WAYBACK_SAVE_URL
+    WAYBACK_AVAIL_URL = ArchiveClient.WAYBACK_AVAIL_URL
+    WAYBACK_CDX_URL = ArchiveClient.WAYBACK_CDX_URL
+    _DEFAULT_HEADERS = ArchiveClient._DEFAULT_HEADERS
+
+    def __init__(self, user_agent: Optional[str] = None, concurrency: int = 20):
+        """
+        Initialize async Archive client.
+
+        Args:
+            user_agent: Custom user agent string (default: generic browser UA)
+            concurrency: Maximum number of simultaneous connections (default: 20)
+
+        Raises:
+            ImportError: If aiohttp library not available
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp library required. Install with: pip install aiohttp")
+
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.headers = (
+            {**self._DEFAULT_HEADERS, "User-Agent": user_agent}
+            if user_agent else self._DEFAULT_HEADERS
+        )
+        self.concurrency = concurrency
+        self._session: Optional['aiohttp.ClientSession'] = None
+
+    async def _get_session(self) -> 'aiohttp.ClientSession':
+        """Create the shared session on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncArchiveClient':
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def _get_json(self, url: str, params: Optional[Dict] = None, timeout: int = 30):
+        """GET a URL and decode the JSON body"""
+        session = await self._get_session()
+        async with session.get(
+            url,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            return json_loads(await response.read())
+
+    async def get_latest_snapshot(self, url: str) -> Optional[ArchivedSnapshot]:
+        """
+        Get the most recent archived snapshot of a URL.
+
+        Args:
+            url: URL to check for archives
+
+        Returns:
+            ArchivedSnapshot if found, None otherwise
+        """
+        try:
+            logger.info(f"Checking for archived snapshots of: {url}")
+
+            data = await self._get_json(self.WAYBACK_AVAIL_URL, params={'url': url})
+            closest = data.get('archived_snapshots', {}).get('closest')
+
+            if not closest:
+                logger.info(f"No archived snapshots found for: {url}")
+                return None
+
+            return ArchivedSnapshot.from_api_response(closest, url)
+
+        except Exception as e:
+            logger.error(f"Error checking archives: {e}")
+            return None
+
+    async def get_latest_snapshots(self, urls: List[str]) -> Dict[str, Optional[ArchivedSnapshot]]:
+        """
+        Get the most recent snapshot for many URLs concurrently.
+
+        Args:
+            urls: URLs to check for archives
+
+        Returns:
+            Dict mapping each URL to its ArchivedSnapshot (or None)
+        """
+        snapshots = await asyncio.gather(*(self.get_latest_snapshot(url) for url in urls))
+        return dict(zip(urls, snapshots))
+
+    async def archive_url(
+        self,
+        url: str,
+        wait_for_completion: bool = True,
+        retry_delay: int = 5,
+        max_poll_attempts: int = 5,
+        check_existing: bool = True
+    ) -> ArchiveResult:
+        """
+        Archive a URL in the Wayback Machine.
+
+        Args:
+            url: URL to archive
+            wait_for_completion: Whether to wait and verify archiving (default: True)
+            retry_delay: Base delay in seconds between completion checks; doubles
+                         after each attempt up to 30s (default: 5)
+            max_poll_attempts: Maximum number of completion checks (default: 5)
+            check_existing: Return an existing snapshot instead of re-archiving;
+                            False always submits a save request (default: True)
+
+        Returns:
+            ArchiveResult with success status and archive URL
+        """
+        try:
+            existing = await self.get_latest_snapshot(url) if check_existing else None
+            if existing:
+                logger.info(f"URL already archived: {existing.archive_url}")
+                return ArchiveResult(
+                    success=True,
+                    archive_url=existing.archive_url,
+                    snapshot=existing
+                )
+
+            logger.info(f"Requesting archive of: {url}")
+            request_start = datetime.now(timezone.utc).replace(microsecond=0)
+            session = await self._get_session()
+            async with session.get(
+                f"{self.WAYBACK_SAVE_URL}{url}",
+                allow_redirects=True,
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                status = response.status
+
+            if not wait_for_completion:
+                return ArchiveResult(
+                    success=status in [200, 302],
+                    archive_url=None,
+                    error=None if status in [200, 302] else f"Status code: {status}"
+                )
+
+            for attempt in range(max_poll_attempts):
+                await asyncio.sleep(random.random() * min(30, retry_delay * 2 ** attempt))
+
+                snapshot = await self.get_latest_snapshot(url)
+                if snapshot and _is_after(snapshot, request_start):
+                    return ArchiveResult(
+                        success=True,
+                        archive_url=snapshot.archive_url,
+                        snapshot=snapshot
+                    )
+            return ArchiveResult(
+                success=False,
+                error="Archive request submitted but snapshot not yet available"
+            )
+
+        except Exception as e:
+            logger.error(f"Error archiving URL: {e}")
+            return ArchiveResult(success=False, error=str(e))
+
+    async def get_snapshot_at_timestamp(
+        self,
+        url: str,
+        timestamp: datetime
+    ) -> Optional[ArchivedSnapshot]:
+        """
+        Get an archived snapshot closest to a specific timestamp.
+
+        Args:
+            url: URL to get snapshot for
+            timestamp: Desired timestamp
+
+        Returns:
+            ArchivedSnapshot if found, None otherwise
+        """
+        try:
+            timestamp_str = timestamp.strftime('%Y%m%d%H%M%S')
+            data = await self._get_json(
+                self.WAYBACK_AVAIL_URL,
+                params={'url': url, 'timestamp': timestamp_str}
+            )
+            closest = data.get('archived_snapshots', {}).get('closest')
+
+            if not closest:
+                logger.info(f"No snapshot found near {timestamp_str}")
+                return None
+
+            return ArchivedSnapshot.from_api_response(closest, url)
+
+        except Exception as e:
+            logger.error(f"Error getting snapshot at timestamp: {e}")
+            return None
+
+    async def get_all_snapshots(
+        self,
+        url: str,
+        limit: int = 100,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None
+    ) -> List[ArchivedSnapshot]:
+        """
+        Get all archived snapshots for a URL.
+
+        Args:
+            url: URL to get snapshots for
+            limit: Maximum number of snapshots to return (default: 100)
+            from_date: Start date for snapshot range (optional)
+            to_date: End date for snapshot range (optional)
+
+        Returns:
+            List of ArchivedSnapshot objects
+        """
+        try:
+            params = {
+                'url': url,
+                'output': 'json',
+                'limit': str(limit)
+            }
+            if from_date:
+                params['from'] = from_date.strftime('%Y%m%d')
+            if to_date:
+                params['to'] = to_date.strftime('%Y%m%d')
+
+            data = await self._get_json(self.WAYBACK_CDX_URL, params=params, timeout=60)
+
+            if not data or len(data) < 2:
+                logger.info("No snapshots found")
+                return []
+
+            rows = iter(data)
+            next(rows)  # Skip header without copying the list
+            return [
+                ArchivedSnapshot.from_cdx_row(row, url)
+                for row in rows
+                if len(row) >= 5
+            ]
+
+        except Exception as e:
+            logger.error(f"Error getting all snapshots: {e}")
+            return []
+
+
+class AsyncMultiArchiveClient:
+    """
+    Asynchronous client supporting multiple archive providers.
+
+    get_all_archives() queries every provider concurrently, so total latency is
+    that of the slowest provider rather than the sum of all of them.
+    """
+
+    PROVIDERS = MultiArchiveClient.PROVIDERS
+    _DISPATCH = MultiArchiveClient._DISPATCH
+
+    def __init__(self, user_agent: Optional[str] = None, concurrency: int = 20):
+        """Initialize async multi-archive client"""
+        self.wayback_client = AsyncArchiveClient(user_agent=user_agent, concurrency=concurrency)
+
+    async def close(self) -> None:
+        """Close the shared aiohttp session."""
+        await self.wayback_client.close()
+
+    async def __aenter__(self) -> 'AsyncMultiArchiveClient':
+        await self.wayback_client._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def get_archive(
+        self,
+        url: str,
+        provider: str = 'wayback',
+        capture: bool = False
+    ) -> ArchiveResult:
+        """
+        Get archived version of URL from specified provider.
+
+        Args:
+            url: URL to find archived version for
+            provider: Archive provider (wayback, archiveis, memento, 12ft)
+            capture: Whether to capture new snapshot (archiveis only)
+
+        Returns:
+            ArchiveResult with archived URL
+        """
+        method_name = self._DISPATCH.get(provider.lower())
+        if method_name is None:
+            return ArchiveResult(
+                success=False,
+                error=f"Unknown provider: {provider}. Use: {', '.join(self.PROVIDERS)}"
+            )
+
+        return await getattr(self, method_name)(url, capture)
+
+    async def _get_wayback(self, url: str, capture: bool = False) -> ArchiveResult:
+        """Get from Wayback Machine"""
+        snapshot = await self.wayback_client.get_latest_snapshot(url)
+        if snapshot:
+            return ArchiveResult(
+                success=True,
+                archive_url=snapshot.archive_url,
+                snapshot=snapshot
+            )
+        return ArchiveResult(success=False, error="No Wayback snapshot found")
+
+    async def _get_archiveis(self, url: str, capture: bool = False) -> ArchiveResult:
+        """Get from Archive.is"""
+        try:
+            if capture:
+                try:
+                    import archiveis
+                except ImportError:
+                    return ArchiveResult(
+                        success=False,
+                        error="archiveis package required for capture: pip install archiveis"
+                    )
+                archived_url = await asyncio.to_thread(archiveis.capture, url)
+                return ArchiveResult(success=True, archive_url=archived_url)
+
+            archived_url = f"https://archive.is/{url}"
+            session = await self.wayback_client._get_session()
+            async with session.head(
+                archived_url,
+                allow_redirects=True,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                status = response.status
+
+            if status == 200:
+                return ArchiveResult(success=True, archive_url=archived_url)
+
+            return ArchiveResult(
+                success=False,
+                error="No Archive.is snapshot found. Use capture=True to create one."
+            )
+
+        except Exception as e:
+            return ArchiveResult(success=False, error=f"Archive.is error: {e}")
+
+    async def _get_memento(self, url: str, capture: bool = False) -> ArchiveResult:
+        """Get from Memento Aggregator"""
+        try:
+            if not url.startswith(('http://', 'https://')):
+                url = 'http://' + url
+
+            data = await self.wayback_client._get_json(
+                f"http://timetravel.mementoweb.org/timemap/json/{url}",
+                timeout=10
+            )
+            mementos = data.get("mementos", {}).get("list", [])
+
+            if mementos:
+                return ArchiveResult(
+                    success=True,
+                    archive_url=mementos[-1].get("uri")
+                )
+
+            return ArchiveResult(success=False, error="No Memento snapshots found")
+
+        except Exception as e:
+            return ArchiveResult(success=False, error=f"Memento error: {e}")
+
+    async def _get_12ft(self, url: str, capture: bool = False) -> ArchiveResult:
+        """Get 12ft.io bypass URL"""
+        try:
+            archived_url = f"https://12ft.io/{url}"
+            session = await self.wayback_client._get_session()
+            async with session.head(
+                archived_url,
+                allow_redirects=False,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                status = response.status
+
+            if status in [200, 302]:
+                return ArchiveResult(success=True, archive_url=archived_url)
+
+            return ArchiveResult(
+                success=False,
+                error=f"12ft.io returned status {status}"
+            )
+
+        except Exception as e:
+            return ArchiveResult(success=False, error=f"12ft.io error: {e}")
+
+    async def get_all_archives(self, url: str) -> Dict[str, ArchiveResult]:
+        """
+        Query all providers concurrently and return results.
+
+        Args:
+            url: URL to find archives for
+
+        Returns:
+            Dict mapping provider name to ArchiveResult
+        """
+        results = await asyncio.gather(
+            *(self.get_archive(url, provider) for provider in self.PROVIDERS),
+            return_exceptions=True
+        )
+        return {
+            provider: (
+                result if isinstance(result, ArchiveResult)
+                else ArchiveResult(success=False, error=str(result))
+            )
+            for provider, result in zip(self.PROVIDERS, results)
+        }
+
+
+def get_latest_archives(urls: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Convenience function to get latest archive URLs for many URLs concurrently.
+
+    Args:
+        urls: URLs to check
+
+    Returns:
+        Dict mapping each URL to its archive URL string or None
+    """
+    async def _run() -> Dict[str, Optional[ArchivedSnapshot]]:
+        async with AsyncArchiveClient() as client:
+            return await client.get_latest_snapshots(urls)
+
+    snapshots = asyncio.run(_run())
+    return {url: snapshot.archive_url if snapshot else None for url, snapshot in snapshots.items()}
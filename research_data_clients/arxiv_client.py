@@ -6,10 +6,14 @@ This module offers a clean interface for searching and retrieving papers from ar
 extracted from the standalone arxiv_search.py tool for reuse across projects.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import functools
 import logging
+import re
+
+from .utils import DATACLASS_SLOTS
 
 try:
     import arxiv
@@ -19,8 +23,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Trailing version on an arXiv ID, e.g. the "v2" in "2301.07041v2"
+_VERSION_SUFFIX = re.compile(r'v\d+$')
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ArxivPaper:
     """Dataclass representing an arXiv paper"""
     title: str
@@ -36,6 +43,9 @@ class ArxivPaper:
     comment: Optional[str] = None
     journal_ref: Optional[str] = None
     primary_category: Optional[str] = None
+    # Memoized as_dict result; a plain field because frozen slotted classes
+    # cannot use functools.cached_property
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_arxiv_result(cls, paper: 'arxiv.Result') -> 'ArxivPaper':
@@ -56,8 +66,19 @@ class ArxivPaper:
             primary_category=getattr(paper, 'primary_category', None)
         )
 
+    @property
+    def as_dict(self) -> Dict:
+        """Dictionary form, built once per paper; each access returns a shallow copy"""
+        if self._dict_cache is None:
+            object.__setattr__(self, '_dict_cache', self._build_dict())
+        return dict(self._dict_cache)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
+        return self.as_dict
+
+    def _build_dict(self) -> Dict:
+        """Build the dictionary form"""
         return {
             'title': self.title,
             'authors': self.authors,
@@ -82,6 +103,50 @@ class ArxivClient:
         """Initialize the arXiv client"""
         self.client = arxiv.Client()
 
+    def _build_search(self, query: str, max_results: int, sort_by: str) -> 'arxiv.Search':
+        """Validate sort_by and build an arxiv.Search"""
+        if sort_by not in ["relevance", "date"]:
+            raise ValueError(f"Invalid sort_by: {sort_by}. Must be 'relevance' or 'date'")
+
+        # Map sort_by string to arxiv.SortCriterion
+        sort_criterion = (
+            arxiv.SortCriterion.Relevance
+            if sort_by == "relevance"
+            else arxiv.SortCriterion.LastUpdatedDate
+        )
+
+        return arxiv.Search(
+            query=query,
+            max_results=max_results,
+            sort_by=sort_criterion
+        )
+
+    def iter_search(
+        self,
+        query: str,
+        max_results: int = 5,
+        sort_by: str = "relevance"
+    ) -> Iterator[ArxivPaper]:
+        """
+        Lazily search arXiv, yielding papers as result pages arrive.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return (default: 5)
+            sort_by: Sort order - "relevance" or "date" (default: "relevance")
+
+        Yields:
+            ArxivPaper objects
+
+        Raises:
+            ValueError: If sort_by is invalid
+        """
+        search = self._build_search(query, max_results, sort_by)
+
+        logger.info(f"Searching arXiv for: '{query}' (max: {max_results}, sort: {sort_by})")
+        for result in self.client.results(search):
+            yield ArxivPaper.from_arxiv_result(result)
+
     def search(
         self,
         query: str,
@@ -107,25 +172,7 @@ class ArxivClient:
             raise ValueError(f"Invalid sort_by: {sort_by}. Must be 'relevance' or 'date'")
 
         try:
-            logger.info(f"Searching arXiv for: '{query}' (max: {max_results}, sort: {sort_by})")
-
-            # Map sort_by string to arxiv.SortCriterion
-            sort_criterion = (
-                arxiv.SortCriterion.Relevance
-                if sort_by == "relevance"
-                else arxiv.SortCriterion.LastUpdatedDate
-            )
-
-            # Create search
-            search = arxiv.Search(
-                query=query,
-                max_results=max_results,
-                sort_by=sort_criterion
-            )
-
-            # Execute search and convert results
-            results = list(self.client.results(search))
-            papers = [ArxivPaper.from_arxiv_result(paper) for paper in results]
+            papers = list(self.iter_search(query, max_results, sort_by))
 
             logger.info(f"Found {len(papers)} papers for query: '{query}'")
             return papers
@@ -153,15 +200,15 @@ class ArxivClient:
 
             logger.info(f"Fetching arXiv paper: {clean_id}")
 
-            # Search for specific paper
+            # Search for specific paper; stop after the first result
             search = arxiv.Search(id_list=[clean_id])
-            results = list(self.client.results(search))
+            result = next(self.client.results(search), None)
 
-            if not results:
+            if result is None:
                 logger.warning(f"Paper not found: {clean_id}")
                 return None
 
-            paper = ArxivPaper.from_arxiv_result(results[0])
+            paper = ArxivPaper.from_arxiv_result(result)
             logger.info(f"Retrieved paper: {paper.title}")
             return paper
 
@@ -169,15 +216,16 @@ class ArxivClient:
             logger.error(f"Error fetching arXiv paper {paper_id}: {e}")
             raise
 
-    def get_by_ids(self, paper_ids: List[str]) -> List[ArxivPaper]:
+    def get_by_ids(self, paper_ids: List[str]) -> List[Optional[ArxivPaper]]:
         """
-        Get multiple papers by their arXiv IDs.
+        Get multiple papers by their arXiv IDs in a single batched query.
 
         Args:
             paper_ids: List of arXiv paper IDs
 
         Returns:
-            List of ArxivPaper objects (may be shorter than input if some not found)
+            List aligned with paper_ids: the ArxivPaper for each ID, or None
+            where the paper was not found
 
         Raises:
             Exception: If retrieval fails
@@ -190,10 +238,19 @@ class ArxivClient:
 
             # Search for papers
             search = arxiv.Search(id_list=clean_ids)
-            results = list(self.client.results(search))
 
-            papers = [ArxivPaper.from_arxiv_result(paper) for paper in results]
-            logger.info(f"Retrieved {len(papers)}/{len(clean_ids)} papers")
+            # Index by ID (with and without version) so results map back to
+            # the caller's order even when arXiv drops or reorders entries
+            papers_by_id: Dict[str, ArxivPaper] = {}
+            for result in self.client.results(search):
+                paper = ArxivPaper.from_arxiv_result(result)
+                full_id = paper.entry_id.split('/abs/')[-1]
+                papers_by_id[full_id] = paper
+                papers_by_id.setdefault(_VERSION_SUFFIX.sub('', full_id), paper)
+
+            papers = [papers_by_id.get(clean_id) for clean_id in clean_ids]
+            found = sum(paper is not None for paper in papers)
+            logger.info(f"Retrieved {found}/{len(clean_ids)} papers")
             return papers
 
         except Exception as e:
@@ -280,6 +337,12 @@ class ArxivClient:
         return '\n'.join(output)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_default_client() -> ArxivClient:
+    """Shared client for the convenience functions so they reuse one arxiv.Client"""
+    return ArxivClient()
+
+
 # Convenience functions for backward compatibility and ease of use
 def search_arxiv(query: str, max_results: int = 5, sort_by: str = "relevance") -> List[Dict]:
     """
@@ -293,7 +356,7 @@ def search_arxiv(query: str, max_results: int = 5, sort_by: str = "relevance") -
     Returns:
         List of paper dictionaries
     """
-    client = ArxivClient()
+    client = _get_default_client()
     papers = client.search(query, max_results, sort_by)
     return [paper.to_dict() for paper in papers]
 
@@ -308,6 +371,6 @@ def get_paper_by_id(paper_id: str) -> Optional[Dict]:
     Returns:
         Paper dictionary if found, None otherwise
     """
-    client = ArxivClient()
+    client = _get_default_client()
     paper = client.get_by_id(paper_id)
     return paper.to_dict() if paper else None
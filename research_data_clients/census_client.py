@@ -33,15 +33,113 @@ Example:
 """
 
 import os
-import json
 import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import requests
 
+from .utils import create_session, json_dumps, json_loads
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Census tables are published yearly, so a month-old cache is still fresh
+DEFAULT_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Geography codes must keep their leading zeros when read back from CSV
+_CSV_STRING_COLUMNS = (
+    {'state': pa.string(), 'county': pa.string(), 'fips': pa.string()}
+    if PYARROW_AVAILABLE else {}
+)
+
+# Friendly names for the non-variable columns Census returns
+_BASE_COLUMN_NAMES = {'NAME': 'name'}
+
+# ACS vintage used to build the county name -> FIPS lookup table
+FIPS_REFERENCE_YEAR = 2022
+
+# County-equivalent suffixes dropped when matching names ("Los Angeles County" -> "los angeles")
+_COUNTY_SUFFIXES = (
+    ' city and borough', ' census area', ' municipality', ' municipio',
+    ' borough', ' parish', ' county'
+)
+
+
+def _parse_float(value) -> float:
+    """Parse a Census cell as float, mapping blanks and junk to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _normalize_place(name: str) -> str:
+    """Lowercase and strip a place name, dropping a county-equivalent suffix."""
+    name = name.strip().lower()
+    for suffix in _COUNTY_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def _frame_from_json(data: list, variables: Dict[str, str]) -> pd.DataFrame:
+    """
+    Build a DataFrame from a Census list-of-lists response column by column.
+
+    Variable columns are converted to float64 once while building, instead of
+    materializing object columns and coercing them afterwards, and every
+    column gets its final name up front so no rename copy is needed.
+
+    Args:
+        data: Census API response (header row followed by data rows)
+        variables: Dict mapping Census variable codes to column names;
+                   these columns are parsed as numbers
+
+    Returns:
+        DataFrame with one column per header entry
+    """
+    header = data[0]
+    columns = list(zip(*data[1:])) if len(data) > 1 else [()] * len(header)
+
+    frame = {}
+    for code, values in zip(header, columns):
+        if code in variables:
+            try:
+                frame[variables[code]] = np.array(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                # Blank cells can't be cast directly; parse into a preallocated buffer
+                frame[variables[code]] = np.fromiter(
+                    map(_parse_float, values), dtype=np.float64, count=len(values)
+                )
+        else:
+            frame[_BASE_COLUMN_NAMES.get(code, code)] = np.array(values, dtype=object)
+    return pd.DataFrame(frame)
+
+
+def _county_fips(df: pd.DataFrame) -> pd.Categorical:
+    """Concatenate 2-digit state and 3-digit county codes into categorical 5-digit FIPS."""
+    state = df['state'].to_numpy(dtype='<U2')
+    county = df['county'].to_numpy(dtype='<U3')
+    return pd.Categorical(np.char.add(state, county))
+
 
 class CensusClient:
     """
@@ -59,7 +157,9 @@ class CensusClient:
         api_key: Optional[str] = None,
         cache_dir: Optional[Path] = None,
         use_cache: bool = True,
-        timeout: int = 30
+        timeout: int = 30,
+        lru_max: int = 128,
+        cache_ttl_seconds: Optional[int] = DEFAULT_CACHE_TTL
     ):
         """
         Initialize Census API client.
@@ -69,10 +169,28 @@ class CensusClient:
             cache_dir: Directory for caching API responses. Defaults to ./cache
             use_cache: Whether to use cached data when available
             timeout: Request timeout in seconds (default: 30)
+            lru_max: Maximum number of DataFrames kept in memory (default: 128)
+            cache_ttl_seconds: Age after which cached files are refetched
+                              (default: 30 days). None disables expiry.
         """
         self.api_key = api_key or os.getenv('CENSUS_API_KEY')
         self.use_cache = use_cache
         self.timeout = timeout
+        self.lru_max = lru_max
+        self.cache_ttl_seconds = cache_ttl_seconds
+
+        # Pooled session so repeated fetches reuse TCP/TLS connections
+        self.session = create_session(pool_connections=16, pool_maxsize=16)
+
+        # In-process LRU in front of the disk cache, keyed by cache_key
+        self._mem_cache: OrderedDict = OrderedDict()
+        self._mem_lock = threading.Lock()
+
+        # (path, digest) of the last metadata write, to skip unchanged rewrites
+        self._last_metadata_save: Optional[tuple] = None
+
+        # (state, county) -> FIPS table, built on the first get_county_fips call
+        self._fips_lookup: Optional[Dict[tuple, str]] = None
 
         # Set up cache directory
         if cache_dir is None:
@@ -81,37 +199,184 @@ class CensusClient:
             self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True, parents=True)
 
-        # Metadata tracking
+        # Metadata tracking; the collection timestamp is fixed per run
+        self._collection_ts = datetime.now().isoformat()
         self.metadata = {
-            'collection_date': datetime.now().isoformat(),
+            'collection_date': self._collection_ts,
             'sources': {},
             'record_counts': {}
         }
 
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self) -> 'CensusClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _get_cache_path(self, cache_key: str) -> Path:
         """Generate cache file path from key."""
-        # Use hash of key for filesystem safety
-        key_hash = hashlib.md5(cache_key.encode()).hexdigest()
-        return self.cache_dir / f"{cache_key}_{key_hash}.csv"
+        # Use hash of key for filesystem safety; it is not security-sensitive,
+        # so a short non-cryptographic digest is enough
+        if XXHASH_AVAILABLE:
+            key_hash = xxhash.xxh3_64_hexdigest(cache_key.encode())
+        else:
+            key_hash = hashlib.md5(cache_key.encode()).hexdigest()[:16]
+        # Parquet keeps dtypes and loads columnar; CSV only when pyarrow is missing
+        suffix = '.parquet' if PYARROW_AVAILABLE else '.csv'
+        return self.cache_dir / f"{cache_key}_{key_hash}{suffix}"
 
-    def _load_from_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
-        """Load DataFrame from cache if available and use_cache is True."""
-        if self.use_cache and cache_path.exists():
-            try:
-                df = pd.read_csv(cache_path)
-                return df
-            except Exception as e:
-                print(f"   ⚠️  Cache read error: {e}")
+    @staticmethod
+    def _legacy_cache_paths(cache_path: Path) -> List[Path]:
+        """
+        Older files that may hold the same data as cache_path.
+
+        That is a CSV under the current hash (written without pyarrow) and
+        a CSV named with the key's full md5, as earlier releases wrote.
+        """
+        cache_key = cache_path.name.rsplit('_', 1)[0]
+        legacy_hash = hashlib.md5(cache_key.encode()).hexdigest()
+        return [
+            cache_path.with_suffix('.csv'),
+            cache_path.with_name(f"{cache_key}_{legacy_hash}.csv"),
+        ]
+
+    def _cache_ttl(self, year: int) -> Optional[int]:
+        """
+        TTL for a given data year.
+
+        Tables for past years are final, so they never expire; the current
+        and previous year can still be revised and use cache_ttl_seconds.
+        """
+        if year < datetime.now().year - 1:
+            return None
+        return self.cache_ttl_seconds
+
+    def _load_from_cache(
+        self,
+        cache_path: Path,
+        ttl: Optional[int] = None
+    ) -> Optional[pd.DataFrame]:
+        """Load DataFrame from cache if available, fresh, and use_cache is True."""
+        if not self.use_cache:
+            return None
+
+        # Fall back to CSV files written before the switch to Parquet / xxh3 names
+        if not cache_path.exists():
+            cache_path = next(
+                (path for path in self._legacy_cache_paths(cache_path) if path.exists()),
+                None
+            )
+            if cache_path is None:
                 return None
-        return None
+
+        if ttl is not None and time.time() - cache_path.stat().st_mtime > ttl:
+            return None
+
+        try:
+            if cache_path.suffix == '.parquet':
+                return pd.read_parquet(cache_path, engine='pyarrow')
+            if PYARROW_AVAILABLE:
+                # Legacy CSV cache: pyarrow's multithreaded reader beats pd.read_csv
+                convert = pa_csv.ConvertOptions(column_types=_CSV_STRING_COLUMNS)
+                return pa_csv.read_csv(cache_path, convert_options=convert).to_pandas()
+            return pd.read_csv(cache_path, dtype={'state': str, 'county': str, 'fips': str})
+        except Exception as e:
+            print(f"   ⚠️  Cache read error: {e}")
+            return None
+
+    def _memory_get(self, cache_key: str) -> Optional[pd.DataFrame]:
+        """Return a copy of an in-memory cached DataFrame, if present."""
+        if not self.use_cache:
+            return None
+        with self._mem_lock:
+            df = self._mem_cache.get(cache_key)
+            if df is None:
+                return None
+            self._mem_cache.move_to_end(cache_key)
+        return df.copy()
+
+    def _memory_put(self, cache_key: str, df: pd.DataFrame):
+        """Store a DataFrame in the in-memory LRU, evicting the oldest entry."""
+        if not self.use_cache or self.lru_max <= 0:
+            return
+        df = df.copy()
+        with self._mem_lock:
+            self._mem_cache[cache_key] = df
+            self._mem_cache.move_to_end(cache_key)
+            while len(self._mem_cache) > self.lru_max:
+                self._mem_cache.popitem(last=False)
 
     def _save_to_cache(self, df: pd.DataFrame, cache_path: Path):
         """Save DataFrame to cache."""
         try:
-            df.to_csv(cache_path, index=False)
+            if cache_path.suffix == '.parquet':
+                df.to_parquet(cache_path, engine='pyarrow', compression='zstd', index=False)
+            else:
+                df.to_csv(cache_path, index=False)
         except Exception as e:
             print(f"   ⚠️  Cache write error: {e}")
 
+    @staticmethod
+    def _validators_path(cache_path: Path) -> Path:
+        """Sidecar file holding the HTTP validators for a cache file."""
+        return cache_path.with_suffix('.meta.json')
+
+    def _cache_validators(self, cache_path: Optional[Path]) -> Dict[str, str]:
+        """Conditional request headers for an existing (stale) cache file."""
+        if cache_path is None or not self.use_cache or not cache_path.exists():
+            return {}
+        try:
+            validators = json_loads(self._validators_path(cache_path).read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def _save_validators(self, cache_path: Path, validators: Dict[str, str]):
+        """Store ETag/Last-Modified next to a cache file for later revalidation."""
+        if not validators:
+            return
+        try:
+            self._validators_path(cache_path).write_bytes(json_dumps(validators))
+        except OSError as e:
+            print(f"   ⚠️  Cache write error: {e}")
+
+    def _get_json(
+        self,
+        url: str,
+        params: Dict[str, str],
+        cache_path: Optional[Path] = None
+    ) -> Tuple[Optional[list], Dict[str, str]]:
+        """
+        GET a Census endpoint, revalidating a stale cache file when possible.
+
+        Returns:
+            (data, validators). data is None when the server answered 304 Not
+            Modified, in which case the cache file's mtime has been refreshed.
+        """
+        headers = self._cache_validators(cache_path)
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and headers:
+            cache_path.touch()
+            return None, {}
+        response.raise_for_status()
+
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['last_modified'] = response.headers['Last-Modified']
+        return json_loads(response.content), validators
+
     def fetch_acs(
         self,
         year: int,
@@ -139,13 +404,20 @@ class CensusClient:
         cache_key = f"acs_{year}_{dataset}_{geography.replace(':', '_')}_{'-'.join(var_codes)}"
         if state:
             cache_key += f"_state{state}"
+
+        cached_df = self._memory_get(cache_key)
+        if cached_df is not None:
+            self.metadata['sources'][cache_key] = 'cached'
+            return cached_df
+
         cache_path = self._get_cache_path(cache_key)
 
         # Try cache first
-        cached_df = self._load_from_cache(cache_path)
+        cached_df = self._load_from_cache(cache_path, self._cache_ttl(year))
         if cached_df is not None:
             print(f"   Using cached ACS data from {cache_path.name}")
             self.metadata['sources'][cache_key] = 'cached'
+            self._memory_put(cache_key, cached_df)
             return cached_df
 
         # Build API request
@@ -166,29 +438,27 @@ class CensusClient:
 
         # Make API request
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-
-            # Convert to DataFrame
-            df = pd.DataFrame(data[1:], columns=data[0])
+            data, validators = self._get_json(url, params, cache_path)
+            if data is None:
+                cached_df = self._load_from_cache(cache_path)
+                if cached_df is not None:
+                    print(f"   Using revalidated ACS data from {cache_path.name}")
+                    self.metadata['sources'][cache_key] = 'cached'
+                    self._memory_put(cache_key, cached_df)
+                    return cached_df
+                data, validators = self._get_json(url, params)
+
+            # Convert to DataFrame with friendly names, parsing variable columns as numbers
+            df = _frame_from_json(data, variables)
 
             # Create FIPS code if geography is county
             if 'county' in geography and 'state' in df.columns and 'county' in df.columns:
-                df['fips'] = df['state'] + df['county']
-
-            # Rename variables to friendly names
-            rename_map = {'NAME': 'name'}
-            rename_map.update(variables)
-            df = df.rename(columns=rename_map)
-
-            # Convert numeric columns
-            for orig_code, col_name in variables.items():
-                if col_name in df.columns:
-                    df[col_name] = pd.to_numeric(df[col_name], errors='coerce')
+                df['fips'] = _county_fips(df)
 
             # Save to cache
             self._save_to_cache(df, cache_path)
+            self._save_validators(cache_path, validators)
+            self._memory_put(cache_key, df)
 
             # Update metadata
             self.metadata['sources'][cache_key] = f"Census ACS {dataset} {year}"
@@ -197,7 +467,7 @@ class CensusClient:
             print(f"   ✓ Fetched ACS data for {len(df)} geographies")
             return df
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"   ✗ Error fetching ACS data: {e}")
             return pd.DataFrame()
 
@@ -221,13 +491,20 @@ class CensusClient:
         cache_key = f"saipe_{year}_{geography}"
         if state:
             cache_key += f"_state{state}"
+
+        cached_df = self._memory_get(cache_key)
+        if cached_df is not None:
+            self.metadata['sources'][cache_key] = 'cached'
+            return cached_df
+
         cache_path = self._get_cache_path(cache_key)
 
         # Try cache
-        cached_df = self._load_from_cache(cache_path)
+        cached_df = self._load_from_cache(cache_path, self._cache_ttl(year))
         if cached_df is not None:
             print(f"   Using cached SAIPE data from {cache_path.name}")
             self.metadata['sources'][cache_key] = 'cached'
+            self._memory_put(cache_key, cached_df)
             return cached_df
 
         # Build API request
@@ -251,29 +528,33 @@ class CensusClient:
             params['key'] = self.api_key
 
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-
-            df = pd.DataFrame(data[1:], columns=data[0])
+            data, validators = self._get_json(url, params, cache_path)
+            if data is None:
+                cached_df = self._load_from_cache(cache_path)
+                if cached_df is not None:
+                    print(f"   Using revalidated SAIPE data from {cache_path.name}")
+                    self.metadata['sources'][cache_key] = 'cached'
+                    self._memory_put(cache_key, cached_df)
+                    return cached_df
+                data, validators = self._get_json(url, params)
+
+            df = _frame_from_json(data, variables)
 
             # Create FIPS for counties
             if geography == 'county' and 'state' in df.columns and 'county' in df.columns:
-                df['fips'] = df['state'] + df['county']
-
-            df = df.rename(columns={
-                'NAME': 'name',
-                **variables
-            })
-
-            # Convert numeric
-            df['total_pop'] = pd.to_numeric(df['total_pop'], errors='coerce')
-            df['poverty_pop'] = pd.to_numeric(df['poverty_pop'], errors='coerce')
+                df['fips'] = _county_fips(df)
 
             # Calculate poverty rate
-            df['poverty_rate'] = (df['poverty_pop'] / df['total_pop'] * 100).round(2)
+            total = df['total_pop'].to_numpy(dtype=np.float64)
+            poverty = df['poverty_pop'].to_numpy(dtype=np.float64)
+            rate = np.full_like(total, np.nan)
+            np.divide(poverty, total, out=rate, where=total > 0)
+            np.multiply(rate, 100.0, out=rate)
+            df['poverty_rate'] = np.round(rate, 2, out=rate)
 
             self._save_to_cache(df, cache_path)
+            self._save_validators(cache_path, validators)
+            self._memory_put(cache_key, df)
 
             self.metadata['sources'][cache_key] = f"Census ACS {year} (SAIPE proxy)"
             self.metadata['record_counts'][cache_key] = len(df)
@@ -281,10 +562,90 @@ class CensusClient:
             print(f"   ✓ Fetched SAIPE data for {len(df)} geographies")
             return df
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"   ✗ Error fetching SAIPE data: {e}")
             return pd.DataFrame()
 
+    def _fetch_states(
+        self,
+        fetch: Callable[..., pd.DataFrame],
+        states: List[str],
+        max_workers: int,
+        **kwargs
+    ) -> pd.DataFrame:
+        """Run a per-state fetch concurrently and concatenate the results in state order."""
+        if not states:
+            return pd.DataFrame()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(states))) as executor:
+            dfs = list(executor.map(lambda st: fetch(state=st, **kwargs), states))
+
+        dfs = [df for df in dfs if not df.empty]
+        if not dfs:
+            return pd.DataFrame()
+        return pd.concat(dfs, ignore_index=True)
+
+    def fetch_acs_multi(
+        self,
+        year: int,
+        variables: Dict[str, str],
+        states: List[str],
+        geography: str = 'county:*',
+        dataset: str = 'acs5',
+        max_workers: int = 8
+    ) -> pd.DataFrame:
+        """
+        Fetch ACS data for several states concurrently.
+
+        Each state is fetched (and cached) through fetch_acs on a thread pool
+        sharing this client's session.
+
+        Args:
+            year: Year of data (e.g., 2022)
+            variables: Dict mapping Census variable codes to column names
+            states: State FIPS codes to fetch (e.g., ['06', '36'])
+            geography: Geographic level (default: 'county:*')
+            dataset: ACS dataset (default: 'acs5')
+            max_workers: Maximum concurrent requests (default: 8)
+
+        Returns:
+            Combined DataFrame for all states; states that failed are omitted
+        """
+        return self._fetch_states(
+            self.fetch_acs,
+            states,
+            max_workers,
+            year=year,
+            variables=variables,
+            geography=geography,
+            dataset=dataset
+        )
+
+    def fetch_saipe_multi(
+        self,
+        year: int,
+        states: List[str],
+        max_workers: int = 8
+    ) -> pd.DataFrame:
+        """
+        Fetch county-level SAIPE data for several states concurrently.
+
+        Args:
+            year: Year of data (e.g., 2022)
+            states: State FIPS codes to fetch
+            max_workers: Maximum concurrent requests (default: 8)
+
+        Returns:
+            Combined DataFrame for all states; states that failed are omitted
+        """
+        return self._fetch_states(
+            self.fetch_saipe,
+            states,
+            max_workers,
+            year=year,
+            geography='county'
+        )
+
     def fetch_population(
         self,
         year: int,
@@ -309,23 +670,50 @@ class CensusClient:
             state=state
         )
 
+    def _load_fips_lookup(self) -> Dict[tuple, str]:
+        """Build the (state, county) -> FIPS table from the ACS county list."""
+        df = self.fetch_acs(year=FIPS_REFERENCE_YEAR, variables={}, geography='county:*')
+        lookup: Dict[tuple, str] = {}
+        if df.empty:
+            return lookup
+
+        for name, state_code, fips in zip(df['name'], df['state'], df['fips'].astype(str)):
+            county, _, state = name.rpartition(', ')
+            for state_key in (state.lower(), state_code):
+                # Full name first so "Richmond city" and "Richmond County" stay distinct
+                lookup.setdefault((state_key, county.lower()), fips)
+                lookup.setdefault((state_key, _normalize_place(county)), fips)
+        return lookup
+
     def get_county_fips(self, state_name: str, county_name: str) -> Optional[str]:
         """
         Look up FIPS code for a county.
 
-        Note: This requires a pre-loaded FIPS code table. For now, returns None.
-        Future enhancement: Load from Census geocoding API.
+        The lookup table is built once per client from the ACS county list
+        (cached like any other fetch) and then queried in O(1).
 
         Args:
-            state_name: State name (e.g., "California")
-            county_name: County name (e.g., "Los Angeles")
+            state_name: State name (e.g., "California") or 2-digit state FIPS code
+            county_name: County name (e.g., "Los Angeles" or "Los Angeles County")
 
         Returns:
             5-digit FIPS code or None
         """
-        # TODO: Implement geocoding or load from reference table
-        print(f"   ⚠️  FIPS lookup not yet implemented for {county_name}, {state_name}")
-        return None
+        if self._fips_lookup is None:
+            lookup = self._load_fips_lookup()
+            if not lookup:
+                # Don't memoize a failed download
+                return None
+            self._fips_lookup = lookup
+
+        state_key = state_name.strip().lower()
+        county = county_name.strip().lower()
+        fips = self._fips_lookup.get((state_key, county))
+        if fips is None:
+            fips = self._fips_lookup.get((state_key, _normalize_place(county)))
+        if fips is None:
+            print(f"   ⚠️  No FIPS code found for {county_name}, {state_name}")
+        return fips
 
     def generate_metadata(self, source: str, dataset: str) -> Dict:
         """
@@ -341,12 +729,23 @@ class CensusClient:
         return {
             'source': source,
             'dataset': dataset,
-            'collection_date': datetime.now().isoformat(),
+            'collection_date': self._collection_ts,
             'api_key_used': bool(self.api_key),
             'cache_enabled': self.use_cache,
             'cache_directory': str(self.cache_dir)
         }
 
+    def refresh_collection_timestamp(self) -> str:
+        """
+        Reset the collection timestamp used in metadata to the current time.
+
+        Returns:
+            The new ISO-format timestamp
+        """
+        self._collection_ts = datetime.now().isoformat()
+        self.metadata['collection_date'] = self._collection_ts
+        return self._collection_ts
+
     def get_metadata(self) -> Dict:
         """
         Get metadata for all fetches performed by this client instance.
@@ -361,11 +760,17 @@ class CensusClient:
         Save metadata to JSON file.
 
         Args:
-            filepath: Path to save metadata JSON
+            filepath: Path to save metadata JSON. The write is skipped when
+                     the metadata is unchanged since the last save to this path.
         """
         filepath = Path(filepath)
-        with open(filepath, 'w') as f:
-            json.dump(self.metadata, f, indent=2)
+        payload = json_dumps(self.metadata, indent=True)
+        fingerprint = (filepath.resolve(), hashlib.md5(payload).digest())
+        if fingerprint == self._last_metadata_save and filepath.exists():
+            return
+
+        filepath.write_bytes(payload)
+        self._last_metadata_save = fingerprint
         print(f"   ✓ Metadata saved to {filepath}")
 
     def clear_cache(self, pattern: Optional[str] = None):
@@ -374,12 +779,17 @@ class CensusClient:
 
         Args:
             pattern: Optional glob pattern to match specific files (e.g., "acs_2022*")
-                    If None, clears all cache files.
+                    If None, clears all cache files and the in-memory cache.
         """
         if pattern:
             files = list(self.cache_dir.glob(f"{pattern}"))
         else:
-            files = list(self.cache_dir.glob("*.csv"))
+            self.clear_memory_cache()
+            files = [
+                *self.cache_dir.glob("*.parquet"),
+                *self.cache_dir.glob("*.csv"),
+                *self.cache_dir.glob("*.meta.json"),
+            ]
 
         count = 0
         for file in files:
@@ -391,6 +801,11 @@ class CensusClient:
 
         print(f"   ✓ Cleared {count} cached file(s)")
 
+    def clear_memory_cache(self):
+        """Drop all DataFrames held in the in-memory cache."""
+        with self._mem_lock:
+            self._mem_cache.clear()
+
 
 # Convenience function for quick access
 def create_census_client(
@@ -6,12 +6,50 @@ Factory pattern for creating data fetching clients.
 Author: Luke Steuber
 """
 
-from typing import Any, List
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Source name (and aliases) -> (module, class name); modules are imported on first use
+_REGISTRY = {
+    "census": ("census_client", "CensusClient"),
+    "arxiv": ("arxiv_client", "ArxivClient"),
+    "semantic_scholar": ("semantic_scholar", "SemanticScholarClient"),
+    "semanticscholar": ("semantic_scholar", "SemanticScholarClient"),
+    "archive": ("archive_client", "ArchiveClient"),
+    "wayback": ("archive_client", "ArchiveClient"),
+    "github": ("github_client", "GitHubClient"),
+    "wikipedia": ("wikipedia_client", "WikipediaClient"),
+    "wiki": ("wikipedia_client", "WikipediaClient"),
+    "news": ("news_client", "NewsClient"),
+    "weather": ("weather_client", "WeatherClient"),
+    "noaa": ("weather_client", "WeatherClient"),
+    "openlibrary": ("openlibrary_client", "OpenLibraryClient"),
+    "books": ("openlibrary_client", "OpenLibraryClient"),
+    "nasa": ("nasa_client", "NASAClient"),
+    "youtube": ("youtube_client", "YouTubeClient"),
+    "finance": ("finance_client", "FinanceClient"),
+    "alphavantage": ("finance_client", "FinanceClient"),
+    "alpha_vantage": ("finance_client", "FinanceClient"),
+    "pubmed": ("pubmed_client", "PubMedClient"),
+    "wolfram": ("wolfram_client", "WolframAlphaClient"),
+    "wolframalpha": ("wolfram_client", "WolframAlphaClient"),
+    "wolfram_alpha": ("wolfram_client", "WolframAlphaClient"),
+}
+
+
+@lru_cache(maxsize=None)
+def _load_client_class(target: Tuple[str, str]) -> type:
+    """Import a client module once and return its client class."""
+    module_name, class_name = target
+    module = import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)
+
+
 class DataFetchingFactory:
     """Factory for creating data fetching clients."""
 
@@ -32,68 +70,15 @@ class DataFetchingFactory:
         """
         source = source.lower()
 
-        if source == "census":
-            from .census_client import CensusClient
-            return CensusClient(**kwargs)
-
-        elif source == "arxiv":
-            from .arxiv_client import ArxivClient
-            return ArxivClient(**kwargs)
-
-        elif source == "semantic_scholar" or source == "semanticscholar":
-            from .semantic_scholar import SemanticScholarClient
-            return SemanticScholarClient(**kwargs)
-
-        elif source == "archive" or source == "wayback":
-            from .archive_client import ArchiveClient
-            return ArchiveClient(**kwargs)
-
-        elif source == "github":
-            from .github_client import GitHubClient
-            return GitHubClient(**kwargs)
-
-        elif source == "wikipedia" or source == "wiki":
-            from .wikipedia_client import WikipediaClient
-            return WikipediaClient(**kwargs)
-
-        elif source == "news":
-            from .news_client import NewsClient
-            return NewsClient(**kwargs)
-
-        elif source == "weather" or source == "noaa":
-            from .weather_client import WeatherClient
-            return WeatherClient(**kwargs)
-
-        elif source == "openlibrary" or source == "books":
-            from .openlibrary_client import OpenLibraryClient
-            return OpenLibraryClient(**kwargs)
-
-        elif source == "nasa":
-            from .nasa_client import NASAClient
-            return NASAClient(**kwargs)
-
-        elif source == "youtube":
-            from .youtube_client import YouTubeClient
-            return YouTubeClient(**kwargs)
-
-        elif source in {"finance", "alphavantage", "alpha_vantage"}:
-            from .finance_client import FinanceClient
-            return FinanceClient(**kwargs)
-
-        elif source == "pubmed":
-            from .pubmed_client import PubMedClient
-            return PubMedClient(**kwargs)
-
-        elif source in {"wolfram", "wolframalpha", "wolfram_alpha"}:
-            from .wolfram_client import WolframAlphaClient
-            return WolframAlphaClient(**kwargs)
-
-        else:
+        try:
+            target = _REGISTRY[source]
+        except KeyError:
             raise ValueError(
                 f"Unknown data source: {source}. "
-                f"Available: census, arxiv, semantic_scholar, archive, github, "
-                f"wikipedia, news, weather, openlibrary, nasa, youtube, finance, pubmed, wolfram"
-            )
+                f"Available: {', '.join(DataFetchingFactory.list_sources())}"
+            ) from None
+
+        return _load_client_class(target)(**kwargs)
 
     @staticmethod
     def list_sources() -> List[str]:
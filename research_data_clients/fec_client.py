@@ -15,29 +15,266 @@ Author: Luke Steuber
 
 import os
 import requests
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, List
 import logging
 
+from .utils import ACCEPT_ENCODING, TTLCache, json_loads
+
 logger = logging.getLogger(__name__)
 
+# (output key, FEC field, default) for each single-record endpoint
+_CANDIDATE_TOTALS_FIELDS = (
+    ("cycle", "cycle", None),
+    ("receipts", "receipts", 0),
+    ("disbursements", "disbursements", 0),
+    ("cash_on_hand", "cash_on_hand_end_period", 0),
+    ("debts", "debts_owed_by_committee", 0),
+    ("individual_contributions", "individual_contributions", 0),
+    ("pac_contributions", "political_party_committee_contributions", 0),
+)
+
+_COMMITTEE_INFO_FIELDS = (
+    ("committee_id", "committee_id", None),
+    ("name", "name", None),
+    ("designation", "designation_full", None),
+    ("type", "committee_type_full", None),
+    ("party", "party_full", None),
+    ("treasurer_name", "treasurer_name", None),
+    ("state", "state", None),
+    ("filing_frequency", "filing_frequency", None),
+)
+
+_COMMITTEE_TOTALS_FIELDS = (
+    ("cycle", "cycle", None),
+    ("receipts", "receipts", 0),
+    ("disbursements", "disbursements", 0),
+    ("cash_on_hand", "cash_on_hand_end_period", 0),
+    ("debts", "debts_owed", 0),
+)
+
+
+def _first_result(data: Dict[str, Any], fields: tuple) -> Optional[Dict[str, Any]]:
+    """
+    Map the first record of an FEC response through a field table.
+
+    Args:
+        data: Decoded FEC response
+        fields: Tuple of (output key, FEC field, default)
+
+    Returns:
+        Mapped dict, or None if the response has no results
+    """
+    results = data.get("results")
+    if not results:
+        return None
+    record = results[0]
+    get = record.get
+    return {out_key: get(in_key, default) for out_key, in_key, default in fields}
+
 
 class FECClient:
     """Client for Federal Election Commission API."""
 
     BASE_URL = "https://api.open.fec.gov/v1"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_ttl: float = 3600,
+        cache_maxsize: int = 1024
+    ):
         """
         Initialize FEC client.
 
         Args:
             api_key: FEC API key (defaults to FEC_API_KEY env var)
+            cache_ttl: Seconds to cache API responses; 0 disables (default: 3600)
+            cache_maxsize: Maximum number of cached responses (default: 1024)
         """
         self.api_key = api_key or os.getenv('FEC_API_KEY')
         if not self.api_key:
             raise ValueError("FEC_API_KEY required. Get one at https://api.open.fec.gov/developers/")
         self.session = requests.Session()
-        self.session.headers.update({'X-Api-Key': self.api_key})
+        self.session.headers.update({
+            'X-Api-Key': self.api_key,
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+        self._cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+
+    def clear_cache(self) -> None:
+        """Drop all cached API responses."""
+        self._cache.clear()
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        GET an FEC endpoint and decode the JSON body, serving repeats from cache.
+
+        Args:
+            path: Endpoint path relative to BASE_URL (e.g., '/candidates/search/')
+            params: Query parameters
+
+        Returns:
+            Decoded response
+
+        Raises:
+            requests.RequestException: On network or HTTP errors (not cached)
+        """
+        params = params or {}
+        cache_key = (path, tuple(sorted(params.items())))
+        data = self._cache.get(cache_key)
+        if data is not None:
+            return data
+
+        response = self.session.get(f"{self.BASE_URL}{path}", params=params, timeout=30)
+        response.raise_for_status()
+        data = json_loads(response.content)
+        self._cache.set(cache_key, data)
+        return data
+
+    @staticmethod
+    def _next_page_params(
+        params: Dict[str, Any],
+        pagination: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Params for the page after this one, or None on the last page."""
+        if "last_indexes" in pagination or "last_index" in params:
+            # Schedule A/B use keyset pagination; the last page has null last_indexes
+            last_indexes = pagination.get("last_indexes")
+            return {**params, **last_indexes} if last_indexes else None
+        page = pagination.get("page", 1)
+        if page < pagination.get("pages", 0):
+            return {**params, "page": page + 1}
+        return None
+
+    def iter_results(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_results: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every result of a paginated FEC endpoint.
+
+        The next page is fetched on a background thread while the caller
+        consumes the current one. Handles both page-numbered endpoints and
+        the keyset (last_indexes) pagination used by Schedule A/B.
+
+        Args:
+            path: Endpoint path relative to BASE_URL (e.g., '/schedules/schedule_b/')
+            params: Query parameters (per_page defaults to 100)
+            max_results: Stop after this many results (default: all)
+
+        Yields:
+            Raw result dicts
+
+        Raises:
+            requests.RequestException: If a page request fails
+        """
+        params = {'per_page': 100, **(params or {})}
+        yielded = 0
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(self._get, path, params)
+            while future is not None:
+                data = future.result()
+                results = data.get("results") or []
+                params = self._next_page_params(params, data.get("pagination") or {})
+                future = executor.submit(self._get, path, params) if results and params else None
+
+                for item in results:
+                    yield item
+                    yielded += 1
+                    if max_results is not None and yielded >= max_results:
+                        return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_candidates(
+        self,
+        name: Optional[str] = None,
+        office: Optional[str] = None,
+        state: Optional[str] = None,
+        party: Optional[str] = None,
+        cycle: Optional[int] = None,
+        max_results: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all candidates matching a search, across pages.
+
+        Args:
+            name: Candidate name (partial match)
+            office: Office sought (H=House, S=Senate, P=President)
+            state: Two-letter state code
+            party: Party affiliation (DEM, REP, etc.)
+            cycle: Election cycle year (e.g., 2024)
+            max_results: Stop after this many candidates (default: all)
+
+        Yields:
+            Candidate dicts
+        """
+        params = {
+            key: value for key, value in (
+                ('name', name), ('office', office), ('state', state),
+                ('party', party), ('cycle', cycle)
+            ) if value
+        }
+        return self.iter_results("/candidates/search/", params, max_results)
+
+    def iter_disbursements(
+        self,
+        committee_id: str,
+        min_amount: Optional[float] = None,
+        max_date: Optional[str] = None,
+        max_results: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all disbursements for a committee, across pages.
+
+        Args:
+            committee_id: FEC committee ID
+            min_amount: Minimum disbursement amount
+            max_date: Maximum date (YYYY-MM-DD)
+            max_results: Stop after this many disbursements (default: all)
+
+        Yields:
+            Disbursement dicts
+        """
+        params = {'committee_id': committee_id}
+        if min_amount:
+            params['min_amount'] = min_amount
+        if max_date:
+            params['max_date'] = max_date
+        return self.iter_results("/schedules/schedule_b/", params, max_results)
+
+    def iter_individual_contributions(
+        self,
+        contributor_name: Optional[str] = None,
+        committee_id: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_date: Optional[str] = None,
+        max_results: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all matching individual contributions, across pages.
+
+        Args:
+            contributor_name: Name of contributor
+            committee_id: Recipient committee ID
+            min_amount: Minimum contribution amount
+            max_date: Maximum date (YYYY-MM-DD)
+            max_results: Stop after this many contributions (default: all)
+
+        Yields:
+            Contribution dicts
+        """
+        params = {
+            key: value for key, value in (
+                ('contributor_name', contributor_name), ('committee_id', committee_id),
+                ('min_amount', min_amount), ('max_date', max_date)
+            ) if value
+        }
+        return self.iter_results("/schedules/schedule_a/", params, max_results)
 
     def search_candidates(
         self,
@@ -76,13 +313,7 @@ class FECClient:
             if cycle:
                 params['cycle'] = cycle
 
-            response = self.session.get(
-                f"{self.BASE_URL}/candidates/search/",
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._get("/candidates/search/", params)
 
             return {
                 "candidates": data.get("results", []),
@@ -113,30 +344,13 @@ class FECClient:
             if cycle:
                 params['cycle'] = cycle
 
-            response = self.session.get(
-                f"{self.BASE_URL}/candidate/{candidate_id}/totals/",
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(f"/candidate/{candidate_id}/totals/", params)
 
-            results = data.get("results", [])
-            if not results:
+            totals = _first_result(data, _CANDIDATE_TOTALS_FIELDS)
+            if totals is None:
                 return {"error": "No financial data found"}
 
-            totals = results[0]
-
-            return {
-                "candidate_id": candidate_id,
-                "cycle": totals.get("cycle"),
-                "receipts": totals.get("receipts", 0),
-                "disbursements": totals.get("disbursements", 0),
-                "cash_on_hand": totals.get("cash_on_hand_end_period", 0),
-                "debts": totals.get("debts_owed_by_committee", 0),
-                "individual_contributions": totals.get("individual_contributions", 0),
-                "pac_contributions": totals.get("political_party_committee_contributions", 0)
-            }
+            return {"candidate_id": candidate_id, **totals}
         except Exception as e:
             logger.error(f"FEC candidate totals error: {e}")
             return {"error": str(e)}
@@ -152,29 +366,13 @@ class FECClient:
             Dict with committee information
         """
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/committee/{committee_id}/",
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            results = data.get("results", [])
-            if not results:
-                return {"error": "Committee not found"}
+            data = self._get(f"/committee/{committee_id}/")
 
-            committee = results[0]
+            committee = _first_result(data, _COMMITTEE_INFO_FIELDS)
+            if committee is None:
+                return {"error": "Committee not found"}
 
-            return {
-                "committee_id": committee.get("committee_id"),
-                "name": committee.get("name"),
-                "designation": committee.get("designation_full"),
-                "type": committee.get("committee_type_full"),
-                "party": committee.get("party_full"),
-                "treasurer_name": committee.get("treasurer_name"),
-                "state": committee.get("state"),
-                "filing_frequency": committee.get("filing_frequency")
-            }
+            return committee
         except Exception as e:
             logger.error(f"FEC committee info error: {e}")
             return {"error": str(e)}
@@ -199,28 +397,13 @@ class FECClient:
             if cycle:
                 params['cycle'] = cycle
 
-            response = self.session.get(
-                f"{self.BASE_URL}/committee/{committee_id}/totals/",
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(f"/committee/{committee_id}/totals/", params)
 
-            results = data.get("results", [])
-            if not results:
+            totals = _first_result(data, _COMMITTEE_TOTALS_FIELDS)
+            if totals is None:
                 return {"error": "No financial data found"}
 
-            totals = results[0]
-
-            return {
-                "committee_id": committee_id,
-                "cycle": totals.get("cycle"),
-                "receipts": totals.get("receipts", 0),
-                "disbursements": totals.get("disbursements", 0),
-                "cash_on_hand": totals.get("cash_on_hand_end_period", 0),
-                "debts": totals.get("debts_owed", 0)
-            }
+            return {"committee_id": committee_id, **totals}
         except Exception as e:
             logger.error(f"FEC committee totals error: {e}")
             return {"error": str(e)}
@@ -255,13 +438,7 @@ class FECClient:
             if max_date:
                 params['max_date'] = max_date
 
-            response = self.session.get(
-                f"{self.BASE_URL}/schedules/schedule_b/",
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._get("/schedules/schedule_b/", params)
 
             return {
                 "disbursements": data.get("results", []),
@@ -305,13 +482,7 @@ class FECClient:
             if max_date:
                 params['max_date'] = max_date
 
-            response = self.session.get(
-                f"{self.BASE_URL}/schedules/schedule_a/",
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._get("/schedules/schedule_a/", params)
 
             return {
                 "contributions": data.get("results", []),
@@ -11,12 +11,295 @@ financial analytics and reporting:
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from .utils import (
+    AsyncHTTPClient,
+    CachedSessionMixin,
+    ResponseCache,
+    TokenBucket,
+    cache_key,
+    get_shared_session,
+    json_loads,
+    resolve_cache,
+)
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Alpha Vantage free-tier request budget
+FREE_TIER_RATE_PER_MINUTE = 5
+
+# Cache lifetimes (seconds), matched to how often each series updates
+DAILY_SERIES_CACHE_TTL = 12 * 3600
+FX_CACHE_TTL = 60
+CRYPTO_CACHE_TTL = 3600
+
+# Series at least this long are parsed through pandas when it is installed
+VECTORIZE_MIN_ROWS = 500
+
+# Alpha Vantage field -> (column name, dtype) for TIME_SERIES_DAILY_ADJUSTED
+_DAILY_COLUMNS = {
+    "1. open": ("open", "float64"),
+    "2. high": ("high", "float64"),
+    "3. low": ("low", "float64"),
+    "4. close": ("close", "float64"),
+    "5. adjusted close": ("adjusted_close", "float64"),
+    "6. volume": ("volume", "int64"),
+}
+
+
+# Keys found on every successful payload, checked first so the common case is one lookup
+_SUCCESS_KEYS = ("Meta Data", "Realtime Currency Exchange Rate")
+# Rate-limit, usage and error messages (Alpha Vantage sends these as HTTP 200)
+_ERROR_KEYS = ("Note", "Error Message", "Information")
+
+
+def _check_response(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn Alpha Vantage rate-limit/error payloads into the error convention."""
+    for key in _SUCCESS_KEYS:
+        if key in data:
+            return data
+    for key in _ERROR_KEYS:
+        message = data.get(key)
+        if message:
+            return {"error": message}
+    return data
+
+
+def _parse_daily_series(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a TIME_SERIES_DAILY_ADJUSTED response."""
+    series = data.get("Time Series (Daily)", {})
+    return {"metadata": data.get("Meta Data", {}), "prices": _series_rows(series, _DAILY_COLUMNS)}
+
+
+def _crypto_columns(market: str) -> Dict[str, tuple]:
+    """Alpha Vantage field -> (column name, dtype) for DIGITAL_CURRENCY_DAILY."""
+    return {
+        f"1a. open ({market})": ("open", "float64"),
+        f"2a. high ({market})": ("high", "float64"),
+        f"3a. low ({market})": ("low", "float64"),
+        f"4a. close ({market})": ("close", "float64"),
+        "5. volume": ("volume", "float64"),
+        "6. market cap (USD)": ("market_cap", "float64"),
+    }
+
+
+def _series_frame(series: Dict[str, Dict[str, str]], columns: Dict[str, tuple]) -> "pd.DataFrame":
+    """
+    Build a date-indexed DataFrame from an Alpha Vantage time series.
+
+    All columns are parsed in one vectorized pass; missing fields become 0 as
+    in the dict parsers. Rows are sorted most recent first.
+
+    Raises:
+        ImportError: If pandas is not installed
+    """
+    if not PANDAS_AVAILABLE:
+        raise ImportError("pandas library required. Install with: pip install pandas")
+
+    df = pd.DataFrame.from_dict(series, orient="index", columns=list(columns))
+    df = df.fillna(0).astype({field: dtype for field, (_, dtype) in columns.items()})
+    df.columns = [name for name, _ in columns.values()]
+    df.index.name = "date"
+    return df.sort_index(ascending=False)
+
+
+def _series_rows(
+    series: Dict[str, Dict[str, str]], columns: Dict[str, tuple]
+) -> List[Dict[str, Any]]:
+    """
+    One {"date", <column>...} dict per row, most recent first.
+
+    Fields are converted column-wise (through pandas for long series when it
+    is installed) and zipped back into rows, driven by the column table
+    rather than a hand-written mapper per endpoint.
+    """
+    if PANDAS_AVAILABLE and len(series) >= VECTORIZE_MIN_ROWS:
+        return _series_records(series, columns)
+
+    dates, values = _series_columns(series, columns)
+    names = ["date", *(name for name, _ in columns.values())]
+    return [dict(zip(names, row)) for row in zip(dates, *values)]
+
+
+def _series_records(
+    series: Dict[str, Dict[str, str]], columns: Dict[str, tuple]
+) -> List[Dict[str, Any]]:
+    """
+    The dict parsers' list-of-rows output, built through _series_frame.
+
+    For long series the numeric conversion runs inside pandas instead of one
+    float()/int() call per field; rows come back with native Python values.
+    """
+    return _series_frame(series, columns).reset_index().to_dict("records")
+
+
+def _typecode(dtype: str) -> str:
+    """array typecode for a column dtype: int64 ('q') or float64 ('d')."""
+    return "q" if dtype == "int64" else "d"
+
+
+def _column_array(dtype: str, size: int = 0) -> array:
+    """A zero-filled typed buffer of size items."""
+    return array(_typecode(dtype), bytes(8 * size))
+
+
+def _series_columns(
+    series: Dict[str, Dict[str, str]], columns: Dict[str, tuple]
+) -> Tuple[List[str], List[array]]:
+    """
+    Split a parsed Alpha Vantage time series into a date list and one typed
+    array per column, most recent first. Missing fields become 0.
+
+    Values are unboxed into preallocated C buffers, so no per-value float
+    objects outlive the loop and the arrays hand off to NumPy/Arrow without
+    copying.
+    """
+    dates = sorted(series, reverse=True)
+    fields = list(columns.items())
+    values = [_column_array(dtype, len(dates)) for _, (_, dtype) in fields]
+    for row_index, date in enumerate(dates):
+        row = series[date]
+        for column, (field, (_, dtype)) in zip(values, fields):
+            raw = row.get(field)
+            if raw is not None:
+                column[row_index] = int(raw) if dtype == "int64" else float(raw)
+    return dates, values
+
+
+def _stream_series_columns(
+    stream: Any, series_key: str, columns: Dict[str, tuple]
+) -> Tuple[Dict[str, Any], List[str], List[array]]:
+    """
+    Incrementally parse an Alpha Vantage time series response with ijson.
+
+    Values go straight into per-column typed arrays as the body is read, so
+    the full JSON tree is never held in memory.
+
+    Args:
+        stream: File-like object yielding the (decoded) response body
+        series_key: Top-level key holding the series, e.g. "Time Series (Daily)"
+        columns: Alpha Vantage field -> (column name, dtype)
+
+    Returns:
+        (header, dates, values): header holds "Meta Data" and any top-level
+        Note/Error Message/Information; dates and values are most recent first
+    """
+    index = {field: (i, dtype) for i, (field, (_, dtype)) in enumerate(columns.items())}
+    header: Dict[str, Any] = {}
+    dates: List[str] = []
+    values = [_column_array(dtype) for _, dtype in columns.values()]
+
+    for prefix, event, value in ijson.parse(stream):
+        if prefix == series_key:
+            if event == "map_key":
+                # New row: start every column at the dict parsers' default
+                dates.append(value)
+                for column in values:
+                    column.append(0)
+            continue
+        head, _, rest = prefix.partition(".")
+        if head == series_key:
+            field = rest.partition(".")[2]
+            if field in index and event in ("string", "number"):
+                i, dtype = index[field]
+                values[i][-1] = int(value) if dtype == "int64" else float(value)
+        elif head == "Meta Data" and rest and event in ("string", "number"):
+            header.setdefault("Meta Data", {})[rest] = value
+        elif not rest and event == "string":
+            header[prefix] = value
+
+    if any(a < b for a, b in zip(dates, dates[1:])):
+        order = sorted(range(len(dates)), key=dates.__getitem__, reverse=True)
+        dates = [dates[i] for i in order]
+        values = [array(column.typecode, (column[i] for i in order)) for column in values]
+    return header, dates, values
+
+
+def _columns_frame(
+    dates: List[str], values: List[Any], columns: Dict[str, tuple]
+) -> "pd.DataFrame":
+    """Build a date-indexed DataFrame from per-column value arrays."""
+    if not PANDAS_AVAILABLE:
+        raise ImportError("pandas library required. Install with: pip install pandas")
+
+    return pd.DataFrame(
+        {
+            name: pd.Series(column, dtype=dtype)
+            for (name, dtype), column in zip(columns.values(), values)
+        }
+    ).set_index(pd.Index(dates, name="date"))
+
+
+def _columns_table(
+    dates: List[str], values: List[Any], columns: Dict[str, tuple]
+) -> "pa.Table":
+    """Build a pyarrow Table from per-column value arrays."""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow library required. Install with: pip install pyarrow")
+
+    arrays = {"date": pa.array(dates, pa.string())}
+    for (name, dtype), column in zip(columns.values(), values):
+        arrays[name] = pa.array(column, pa.int64() if dtype == "int64" else pa.float64())
+    return pa.table(arrays)
+
+
+def _series_table(series: Dict[str, Dict[str, str]], columns: Dict[str, tuple]) -> "pa.Table":
+    """
+    Build a pyarrow Table from an Alpha Vantage time series.
+
+    Fills one Python list per column in a single pass over the (date-sorted)
+    rows, then hands each to Arrow as a typed array. Rows are most recent
+    first; missing fields become 0 as in the dict parsers.
 
-class FinanceClient:
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    return _columns_table(*_series_columns(series, columns), columns)
+
+
+def _parse_fx_rate(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a CURRENCY_EXCHANGE_RATE response."""
+    rate = data.get("Realtime Currency Exchange Rate", {})
+    return {
+        "from_currency": rate.get("1. From_Currency Code"),
+        "to_currency": rate.get("3. To_Currency Code"),
+        "exchange_rate": float(rate.get("5. Exchange Rate", 0.0)),
+        "last_refreshed": rate.get("6. Last Refreshed"),
+        "bid_price": float(rate.get("8. Bid Price", 0.0)),
+        "ask_price": float(rate.get("9. Ask Price", 0.0)),
+    }
+
+
+def _parse_crypto_quotes(data: Dict[str, Any], market: str) -> Dict[str, Any]:
+    """Shape a DIGITAL_CURRENCY_DAILY response."""
+    series = data.get("Time Series (Digital Currency Daily)", {})
+    return {
+        "metadata": data.get("Meta Data", {}),
+        "quotes": _series_rows(series, _crypto_columns(market)),
+    }
+
+
+class FinanceClient(CachedSessionMixin):
     """Client for Alpha Vantage financial data."""
 
     BASE_URL = "https://www.alphavantage.co/query"
@@ -25,6 +308,11 @@ class FinanceClient:
         self,
         api_key: Optional[str] = None,
         timeout: int = 30,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        session: Optional[requests.Session] = None,
+        rate_per_minute: Optional[float] = FREE_TIER_RATE_PER_MINUTE,
+        burst: Optional[int] = None,
     ) -> None:
         """
         Initialize finance client.
@@ -32,6 +320,12 @@ class FinanceClient:
         Args:
             api_key: Alpha Vantage API key. Falls back to ALPHAVANTAGE_API_KEY env var.
             timeout: Request timeout in seconds.
+            cache: Response cache backend (default: in-memory TTLCache).
+            use_cache: Whether to cache responses.
+            session: Session to use (default: the process-wide shared session).
+            rate_per_minute: Client-side request budget (default: the free tier's
+                5/min); None disables throttling, e.g. for premium keys.
+            burst: Requests allowed back to back (default: rate_per_minute).
 
         Raises:
             RuntimeError: If the API key is missing.
@@ -44,21 +338,130 @@ class FinanceClient:
             )
 
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = session or get_shared_session()
+        self.cache = resolve_cache(cache, use_cache)
+        if rate_per_minute:
+            self.rate_limiter = TokenBucket.per_minute(rate_per_minute, burst)
+
+    def _request(self, params: Dict[str, Any], ttl: float = 0) -> Dict[str, Any]:
+        """
+        Perform a GET request with the provided parameters.
+
+        Successful responses are cached for ttl seconds; rate-limit and error
+        payloads (which arrive as HTTP 200) are not.
+        """
+        key = cache_key(self.BASE_URL, params) if ttl and self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
 
-    def _request(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Perform a GET request with the provided parameters."""
         params = {**params, "apikey": self.api_key}
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
         response = self.session.get(self.BASE_URL, params=params, timeout=self.timeout)
         response.raise_for_status()
-        data = response.json()
-        if "Note" in data:
-            # Rate limit or usage message from Alpha Vantage
-            return {"error": data["Note"]}
-        if "Error Message" in data:
-            return {"error": data["Error Message"]}
+        data = _check_response(json_loads(response.content))
+
+        if key is not None and "error" not in data:
+            self.cache.set(key, data, ttl)
         return data
 
+    def _stream_series(
+        self,
+        params: Dict[str, Any],
+        series_key: str,
+        columns: Dict[str, tuple],
+        ttl: float = 0,
+    ) -> Dict[str, Any]:
+        """
+        Fetch a large time series, parsing the body with ijson as it downloads.
+
+        Only the columnar result is cached, not the raw payload.
+
+        Returns:
+            Dict with "metadata", "dates" and "values" (one typed array per
+            column), or an error dict.
+        """
+        key = None
+        if ttl and self.cache is not None:
+            key = cache_key(self.BASE_URL, {**params, "stream": series_key})
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                values = [
+                    array(_typecode(dtype), column)
+                    for (_, dtype), column in zip(columns.values(), cached["values"])
+                ]
+                return {**cached, "values": values}
+
+        params = {**params, "apikey": self.api_key}
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response = self.session.get(
+            self.BASE_URL, params=params, timeout=self.timeout, stream=True
+        )
+        with response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            header, dates, values = _stream_series_columns(response.raw, series_key, columns)
+
+        checked = _check_response(header)
+        if "error" in checked:
+            return checked
+
+        result = {"metadata": header.get("Meta Data", {}), "dates": dates, "values": values}
+        if key is not None:
+            # Plain lists so file-backed caches can serialize them
+            self.cache.set(key, {**result, "values": [column.tolist() for column in values]}, ttl)
+        return result
+
+    def get_daily_time_series_columns(
+        self,
+        symbol: str,
+        output_size: str = "compact",
+    ) -> Dict[str, Any]:
+        """
+        Retrieve daily time series data as parallel typed arrays.
+
+        Column-oriented and allocation-light: prices are array('d') and volume
+        is array('q'), ready for zero-copy use with numpy.frombuffer or Arrow.
+        No extra dependencies are needed.
+
+        Args:
+            symbol: Ticker symbol (e.g., "AAPL").
+            output_size: "compact" (last 100 data points) or "full".
+
+        Returns:
+            Dict with metadata, "dates" (most recent first) and one array per
+            column (open, high, low, close, adjusted_close, volume), or an
+            error dict.
+        """
+        params = {
+            "function": "TIME_SERIES_DAILY_ADJUSTED",
+            "symbol": symbol,
+            "outputsize": output_size,
+        }
+
+        if output_size == "full" and IJSON_AVAILABLE:
+            streamed = self._stream_series(
+                params, "Time Series (Daily)", _DAILY_COLUMNS, ttl=DAILY_SERIES_CACHE_TTL
+            )
+            if "error" in streamed:
+                return streamed
+            metadata, dates, values = streamed["metadata"], streamed["dates"], streamed["values"]
+        else:
+            data = self._request(params, ttl=DAILY_SERIES_CACHE_TTL)
+            if "error" in data:
+                return data
+            metadata = data.get("Meta Data", {})
+            dates, values = _series_columns(data.get("Time Series (Daily)", {}), _DAILY_COLUMNS)
+
+        result: Dict[str, Any] = {"metadata": metadata, "dates": dates}
+        for (name, _), column in zip(_DAILY_COLUMNS.values(), values):
+            result[name] = column
+        return result
+
     def get_daily_time_series(
         self,
         symbol: str,
@@ -79,31 +482,106 @@ class FinanceClient:
                 "function": "TIME_SERIES_DAILY_ADJUSTED",
                 "symbol": symbol,
                 "outputsize": output_size,
-            }
+            },
+            ttl=DAILY_SERIES_CACHE_TTL,
         )
 
         if "error" in data:
             return data
 
-        metadata = data.get("Meta Data", {})
-        series = data.get("Time Series (Daily)", {})
-        prices = [
-            {
-                "date": date,
-                "open": float(values.get("1. open", 0.0)),
-                "high": float(values.get("2. high", 0.0)),
-                "low": float(values.get("3. low", 0.0)),
-                "close": float(values.get("4. close", 0.0)),
-                "adjusted_close": float(values.get("5. adjusted close", 0.0)),
-                "volume": int(values.get("6. volume", 0)),
+        return _parse_daily_series(data)
+
+    def get_daily_time_series_df(
+        self,
+        symbol: str,
+        output_size: str = "compact",
+    ) -> Dict[str, Any]:
+        """
+        Retrieve daily time series data as a pandas DataFrame.
+
+        Skips building one dict per row, which matters for output_size="full"
+        (~5000 rows). Requires pandas.
+
+        Args:
+            symbol: Ticker symbol (e.g., "AAPL").
+            output_size: "compact" (last 100 data points) or "full".
+
+        Returns:
+            Dict with metadata and a date-indexed "prices" DataFrame
+            (most recent first), or an error dict.
+        """
+        params = {
+            "function": "TIME_SERIES_DAILY_ADJUSTED",
+            "symbol": symbol,
+            "outputsize": output_size,
+        }
+
+        if output_size == "full" and IJSON_AVAILABLE:
+            streamed = self._stream_series(
+                params, "Time Series (Daily)", _DAILY_COLUMNS, ttl=DAILY_SERIES_CACHE_TTL
+            )
+            if "error" in streamed:
+                return streamed
+            return {
+                "metadata": streamed["metadata"],
+                "prices": _columns_frame(streamed["dates"], streamed["values"], _DAILY_COLUMNS),
             }
-            for date, values in series.items()
-        ]
 
-        # Sort by descending date (most recent first)
-        prices.sort(key=lambda item: item["date"], reverse=True)
+        data = self._request(params, ttl=DAILY_SERIES_CACHE_TTL)
+
+        if "error" in data:
+            return data
+
+        return {
+            "metadata": data.get("Meta Data", {}),
+            "prices": _series_frame(data.get("Time Series (Daily)", {}), _DAILY_COLUMNS),
+        }
+
+    def get_daily_time_series_arrow(
+        self,
+        symbol: str,
+        output_size: str = "compact",
+    ) -> Dict[str, Any]:
+        """
+        Retrieve daily time series data as a columnar pyarrow Table.
+
+        Much smaller in memory than the list-of-dicts form when fanning out
+        over many symbols. Requires pyarrow.
 
-        return {"metadata": metadata, "prices": prices}
+        Args:
+            symbol: Ticker symbol (e.g., "AAPL").
+            output_size: "compact" (last 100 data points) or "full".
+
+        Returns:
+            Dict with metadata and a "prices" Table (most recent first),
+            or an error dict.
+        """
+        params = {
+            "function": "TIME_SERIES_DAILY_ADJUSTED",
+            "symbol": symbol,
+            "outputsize": output_size,
+        }
+
+        if output_size == "full" and IJSON_AVAILABLE:
+            streamed = self._stream_series(
+                params, "Time Series (Daily)", _DAILY_COLUMNS, ttl=DAILY_SERIES_CACHE_TTL
+            )
+            if "error" in streamed:
+                return streamed
+            return {
+                "metadata": streamed["metadata"],
+                "prices": _columns_table(streamed["dates"], streamed["values"], _DAILY_COLUMNS),
+            }
+
+        data = self._request(params, ttl=DAILY_SERIES_CACHE_TTL)
+
+        if "error" in data:
+            return data
+
+        return {
+            "metadata": data.get("Meta Data", {}),
+            "prices": _series_table(data.get("Time Series (Daily)", {}), _DAILY_COLUMNS),
+        }
 
     def get_fx_rate(self, from_currency: str, to_currency: str) -> Dict[str, Any]:
         """
@@ -121,21 +599,14 @@ class FinanceClient:
                 "function": "CURRENCY_EXCHANGE_RATE",
                 "from_currency": from_currency,
                 "to_currency": to_currency,
-            }
+            },
+            ttl=FX_CACHE_TTL,
         )
 
         if "error" in data:
             return data
 
-        rate = data.get("Realtime Currency Exchange Rate", {})
-        return {
-            "from_currency": rate.get("1. From_Currency Code"),
-            "to_currency": rate.get("3. To_Currency Code"),
-            "exchange_rate": float(rate.get("5. Exchange Rate", 0.0)),
-            "last_refreshed": rate.get("6. Last Refreshed"),
-            "bid_price": float(rate.get("8. Bid Price", 0.0)),
-            "ask_price": float(rate.get("9. Ask Price", 0.0)),
-        }
+        return _parse_fx_rate(data)
 
     def get_crypto_quote(self, symbol: str, market: str = "USD") -> Dict[str, Any]:
         """
@@ -153,31 +624,257 @@ class FinanceClient:
                 "function": "DIGITAL_CURRENCY_DAILY",
                 "symbol": symbol,
                 "market": market,
-            }
+            },
+            ttl=CRYPTO_CACHE_TTL,
         )
 
         if "error" in data:
             return data
 
-        metadata = data.get("Meta Data", {})
-        series = data.get("Time Series (Digital Currency Daily)", {})
+        return _parse_crypto_quotes(data, market)
+
+    def get_crypto_quote_df(self, symbol: str, market: str = "USD") -> Dict[str, Any]:
+        """
+        Retrieve digital currency quotes as a pandas DataFrame. Requires pandas.
+
+        Args:
+            symbol: Crypto symbol (e.g., "BTC").
+            market: Market currency (e.g., "USD").
 
-        quotes = [
+        Returns:
+            Dict with metadata and a date-indexed "quotes" DataFrame
+            (most recent first), or an error dict.
+        """
+        data = self._request(
             {
-                "date": date,
-                "open": float(values.get(f"1a. open ({market})", 0.0)),
-                "high": float(values.get(f"2a. high ({market})", 0.0)),
-                "low": float(values.get(f"3a. low ({market})", 0.0)),
-                "close": float(values.get(f"4a. close ({market})", 0.0)),
-                "volume": float(values.get("5. volume", 0.0)),
-                "market_cap": float(values.get("6. market cap (USD)", 0.0)),
-            }
-            for date, values in series.items()
-        ]
+                "function": "DIGITAL_CURRENCY_DAILY",
+                "symbol": symbol,
+                "market": market,
+            },
+            ttl=CRYPTO_CACHE_TTL,
+        )
+
+        if "error" in data:
+            return data
+
+        return {
+            "metadata": data.get("Meta Data", {}),
+            "quotes": _series_frame(
+                data.get("Time Series (Digital Currency Daily)", {}), _crypto_columns(market)
+            ),
+        }
 
-        quotes.sort(key=lambda item: item["date"], reverse=True)
-        return {"metadata": metadata, "quotes": quotes}
+    def get_crypto_quote_arrow(self, symbol: str, market: str = "USD") -> Dict[str, Any]:
+        """
+        Retrieve digital currency quotes as a columnar pyarrow Table. Requires pyarrow.
+
+        Args:
+            symbol: Crypto symbol (e.g., "BTC").
+            market: Market currency (e.g., "USD").
+
+        Returns:
+            Dict with metadata and a "quotes" Table (most recent first),
+            or an error dict.
+        """
+        data = self._request(
+            {
+                "function": "DIGITAL_CURRENCY_DAILY",
+                "symbol": symbol,
+                "market": market,
+            },
+            ttl=CRYPTO_CACHE_TTL,
+        )
+
+        if "error" in data:
+            return data
+
+        return {
+            "metadata": data.get("Meta Data", {}),
+            "quotes": _series_table(
+                data.get("Time Series (Digital Currency Daily)", {}), _crypto_columns(market)
+            ),
+        }
+
+
+class AsyncFinanceClient(AsyncHTTPClient):
+    """
+    Asynchronous client for Alpha Vantage financial data.
+
+    Same methods as FinanceClient, as coroutines sharing one aiohttp session.
+
+    Example:
+        >>> async with AsyncFinanceClient() as client:  # doctest: +SKIP
+        ...     series = await client.get_daily_time_series("AAPL")
+    """
+
+    BASE_URL = FinanceClient.BASE_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        concurrency: int = 20,
+        max_concurrency: int = 5,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        rate_per_minute: Optional[float] = FREE_TIER_RATE_PER_MINUTE,
+        burst: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize async finance client.
+
+        Args:
+            api_key: Alpha Vantage API key. Falls back to ALPHAVANTAGE_API_KEY env var.
+            timeout: Request timeout in seconds.
+            concurrency: Maximum number of simultaneous connections.
+            max_concurrency: In-flight requests for batch helpers (free tier is 5/min).
+            cache: Response cache backend (default: in-memory TTLCache).
+            use_cache: Whether to cache responses.
+            rate_per_minute: Client-side request budget (default: the free tier's
+                5/min); None disables throttling, e.g. for premium keys.
+            burst: Requests allowed back to back (default: rate_per_minute).
+
+        Raises:
+            RuntimeError: If the API key is missing.
+            ImportError: If aiohttp library not available.
+        """
+        rate_limiter = TokenBucket.per_minute(rate_per_minute, burst) if rate_per_minute else None
+        super().__init__(
+            timeout=timeout,
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+            cache=resolve_cache(cache, use_cache),
+            rate_limiter=rate_limiter,
+        )
+        self.api_key = api_key or os.getenv("ALPHAVANTAGE_API_KEY")
+        if not self.api_key:
+            raise RuntimeError(
+                "Alpha Vantage API key not configured. "
+                "Set ALPHAVANTAGE_API_KEY or provide via constructor."
+            )
+
+    async def _request(self, params: Dict[str, Any], ttl: float = 0) -> Dict[str, Any]:
+        """Perform a GET request, caching successful responses for ttl seconds."""
+        key = cache_key(self.BASE_URL, params) if ttl and self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        params = {**params, "apikey": self.api_key}
+        data = _check_response(await self._get_json(self.BASE_URL, params=params))
+
+        if key is not None and "error" not in data:
+            self.cache.set(key, data, ttl)
+        return data
+
+    async def get_daily_time_series(
+        self,
+        symbol: str,
+        output_size: str = "compact",
+    ) -> Dict[str, Any]:
+        """Async version of FinanceClient.get_daily_time_series."""
+        data = await self._request(
+            {
+                "function": "TIME_SERIES_DAILY_ADJUSTED",
+                "symbol": symbol,
+                "outputsize": output_size,
+            },
+            ttl=DAILY_SERIES_CACHE_TTL,
+        )
+        if "error" in data:
+            return data
+        return _parse_daily_series(data)
+
+    async def get_daily_time_series_df(
+        self,
+        symbol: str,
+        output_size: str = "compact",
+    ) -> Dict[str, Any]:
+        """Async version of FinanceClient.get_daily_time_series_df."""
+        data = await self._request(
+            {
+                "function": "TIME_SERIES_DAILY_ADJUSTED",
+                "symbol": symbol,
+                "outputsize": output_size,
+            },
+            ttl=DAILY_SERIES_CACHE_TTL,
+        )
+        if "error" in data:
+            return data
+        return {
+            "metadata": data.get("Meta Data", {}),
+            "prices": _series_frame(data.get("Time Series (Daily)", {}), _DAILY_COLUMNS),
+        }
+
+    async def get_daily_time_series_arrow(
+        self,
+        symbol: str,
+        output_size: str = "compact",
+    ) -> Dict[str, Any]:
+        """Async version of FinanceClient.get_daily_time_series_arrow."""
+        data = await self._request(
+            {
+                "function": "TIME_SERIES_DAILY_ADJUSTED",
+                "symbol": symbol,
+                "outputsize": output_size,
+            },
+            ttl=DAILY_SERIES_CACHE_TTL,
+        )
+        if "error" in data:
+            return data
+        return {
+            "metadata": data.get("Meta Data", {}),
+            "prices": _series_table(data.get("Time Series (Daily)", {}), _DAILY_COLUMNS),
+        }
+
+    async def get_daily_time_series_many(
+        self,
+        symbols: List[str],
+        output_size: str = "compact",
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch daily time series for several symbols concurrently.
+
+        Args:
+            symbols: Ticker symbols.
+            output_size: "compact" (last 100 data points) or "full".
+
+        Returns:
+            One result dict per symbol, in input order.
+        """
+        return await self._gather_bounded(
+            self.get_daily_time_series(symbol, output_size) for symbol in symbols
+        )
+
+    async def get_fx_rate(self, from_currency: str, to_currency: str) -> Dict[str, Any]:
+        """Async version of FinanceClient.get_fx_rate."""
+        data = await self._request(
+            {
+                "function": "CURRENCY_EXCHANGE_RATE",
+                "from_currency": from_currency,
+                "to_currency": to_currency,
+            },
+            ttl=FX_CACHE_TTL,
+        )
+        if "error" in data:
+            return data
+        return _parse_fx_rate(data)
+
+    async def get_crypto_quote(self, symbol: str, market: str = "USD") -> Dict[str, Any]:
+        """Async version of FinanceClient.get_crypto_quote."""
+        data = await self._request(
+            {
+                "function": "DIGITAL_CURRENCY_DAILY",
+                "symbol": symbol,
+                "market": market,
+            },
+            ttl=CRYPTO_CACHE_TTL,
+        )
+        if "error" in data:
+            return data
+        return _parse_crypto_quotes(data, market)
 
 
-__all__ = ["FinanceClient"]
+__all__ = ["FinanceClient", "AsyncFinanceClient"]
 
@@ -11,42 +11,206 @@ Author: Luke Steuber
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+from .utils import (
+    AsyncHTTPClient,
+    CachedSessionMixin,
+    ResponseCache,
+    TokenBucket,
+    dig,
+    get_shared_session,
+    names,
+    resolve_cache,
+)
+
 logger = logging.getLogger(__name__)
 
+# Cache lifetimes (seconds): search results move faster than repo metadata
+SEARCH_CACHE_TTL = 300
+REPO_CACHE_TTL = 3600
+
+# Core API requests per hour with and without a token
+AUTHENTICATED_RATE_PER_HOUR = 5000
+ANONYMOUS_RATE_PER_HOUR = 60
+# The search API has its own, much lower, per-minute limit
+AUTHENTICATED_SEARCH_RATE_PER_MINUTE = 30
+ANONYMOUS_SEARCH_RATE_PER_MINUTE = 10
+
+
+# GitHub search serves at most the first 1000 results of any query
+SEARCH_RESULT_LIMIT = 1000
+# Concurrent page requests; GitHub's secondary rate limits punish more
+SEARCH_PAGE_WORKERS = 4
+
+
+def _remaining_pages(total_count: int, per_page: int, max_pages: int) -> range:
+    """Page numbers after the first needed to cover total_count, up to max_pages."""
+    available = -(-min(total_count, SEARCH_RESULT_LIMIT) // per_page)
+    return range(2, min(max_pages, available) + 1)
+
+
+def _rate_limiter(api_key: Optional[str]) -> TokenBucket:
+    """Pace requests to the hourly budget; the whole budget may be used in a burst."""
+    return TokenBucket.per_hour(AUTHENTICATED_RATE_PER_HOUR if api_key else ANONYMOUS_RATE_PER_HOUR)
+
+
+def _search_rate_limiter(api_key: Optional[str]) -> TokenBucket:
+    """Pace /search/* requests, which the core-API bucket would let burst into 403s."""
+    return TokenBucket.per_minute(
+        AUTHENTICATED_SEARCH_RATE_PER_MINUTE if api_key else ANONYMOUS_SEARCH_RATE_PER_MINUTE
+    )
+
+
+def _repo_summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a repository search hit."""
+    return {
+        "name": item.get("full_name"),
+        "description": item.get("description"),
+        "stars": item.get("stargazers_count"),
+        "forks": item.get("forks_count"),
+        "language": item.get("language"),
+        "url": item.get("html_url"),
+        "topics": item.get("topics", [])
+    }
+
+
+def _code_result(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a code search hit."""
+    return {
+        "name": item.get("name"),
+        "path": item.get("path"),
+        "repository": dig(item, "repository", "full_name"),
+        "url": item.get("html_url"),
+        "language": item.get("language")
+    }
 
-class GitHubClient:
-    """Client for GitHub API."""
+
+def _repo_details(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a repository detail response."""
+    return {
+        "name": data.get("full_name"),
+        "description": data.get("description"),
+        "stars": data.get("stargazers_count"),
+        "forks": data.get("forks_count"),
+        "watchers": data.get("watchers_count"),
+        "language": data.get("language"),
+        "topics": data.get("topics", []),
+        "created_at": data.get("created_at"),
+        "updated_at": data.get("updated_at"),
+        "url": data.get("html_url"),
+        "homepage": data.get("homepage"),
+        "license": dig(data, "license", "name")
+    }
+
+
+def _issue_summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an issue/PR search hit."""
+    return {
+        "title": item.get("title"),
+        "number": item.get("number"),
+        "state": item.get("state"),
+        "user": dig(item, "user", "login"),
+        "repository": (item.get("repository_url") or "").split("/")[-2:],
+        "created_at": item.get("created_at"),
+        "url": item.get("html_url"),
+        "labels": names(item.get("labels"))
+    }
+
+
+class GitHubClient(CachedSessionMixin):
+    """
+    Client for GitHub API.
+
+    Expired cache entries are revalidated with their ETag; GitHub answers
+    unchanged resources with a 304 that does not count against the rate limit.
+    """
 
     BASE_URL = "https://api.github.com"
+    CONDITIONAL_REQUESTS = True
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        http2: bool = False,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize GitHub client.
 
         Args:
             api_key: GitHub personal access token (optional but recommended for higher rate limits)
+            cache: Response cache backend (default: in-memory TTLCache)
+            use_cache: Whether to cache responses
+            http2: Use an HTTP/2 httpx client instead of requests (needs httpx[http2])
+            session: Session to use (default: the process-wide shared session)
         """
         self.api_key = api_key or os.getenv('GITHUB_TOKEN') or os.getenv('GITHUB_API_KEY')
-        self.session = requests.Session()
+        self.session = session or get_shared_session(http2)
+        self.cache = resolve_cache(cache, use_cache)
+        self.rate_limiter = _rate_limiter(self.api_key)
+        self.search_rate_limiter = _search_rate_limiter(self.api_key)
+        # Last seen X-RateLimit-* values: {"limit", "remaining", "reset"}
+        self.rate_limit: Dict[str, int] = {}
 
         if self.api_key:
-            self.session.headers.update({
+            self.headers = {
                 'Authorization': f'Bearer {self.api_key}',
                 'Accept': 'application/vnd.github.v3+json'
-            })
+            }
         else:
             logger.warning("No GitHub API key provided. Rate limits will be restrictive (60 requests/hour)")
 
+    def _after_response(self, response: Any) -> None:
+        """Record the rate-limit budget reported with each response."""
+        for field in ("limit", "remaining", "reset"):
+            value = response.headers.get(f"X-RateLimit-{field.capitalize()}")
+            if value is not None:
+                self.rate_limit[field] = int(value)
+
+    def _search(self, path: str, params: Dict[str, Any], max_pages: int = 1) -> Dict[str, Any]:
+        """
+        Run a search, fetching pages 2..max_pages in parallel once page 1
+        reports total_count.
+
+        Returns:
+            Page 1's response with "items" extended by the later pages
+        """
+        url = f"{self.BASE_URL}{path}"
+        data = self._get_cached_json(
+            url, params=params, ttl=SEARCH_CACHE_TTL, rate_limiter=self.search_rate_limiter
+        )
+        pages = _remaining_pages(data.get('total_count', 0), params["per_page"], max_pages)
+        if not pages:
+            return data
+
+        def fetch(page: int) -> Dict[str, Any]:
+            return self._get_cached_json(
+                url,
+                params={**params, "page": page},
+                ttl=SEARCH_CACHE_TTL,
+                rate_limiter=self.search_rate_limiter
+            )
+
+        with ThreadPoolExecutor(max_workers=min(len(pages), SEARCH_PAGE_WORKERS)) as executor:
+            rest = list(executor.map(fetch, pages))
+        items = list(data.get('items', []))
+        for page in rest:
+            items.extend(page.get('items', []))
+        return {**data, "items": items}
+
     def search_repositories(
         self,
         query: str,
         sort: str = "stars",
         order: str = "desc",
-        per_page: int = 30
+        per_page: int = 30,
+        max_pages: int = 1
     ) -> Dict[str, Any]:
         """
         Search GitHub repositories.
@@ -56,35 +220,20 @@ class GitHubClient:
             sort: Sort by (stars, forks, updated)
             order: asc or desc
             per_page: Results per page
+            max_pages: Pages to fetch (in parallel after the first); GitHub
+                serves at most 1000 results per query
 
         Returns:
             Dict with search results
         """
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/search/repositories",
-                params={
-                    "q": query,
-                    "sort": sort,
-                    "order": order,
-                    "per_page": per_page
-                },
-                timeout=30
+            data = self._search(
+                "/search/repositories",
+                {"q": query, "sort": sort, "order": order, "per_page": per_page},
+                max_pages
             )
-            response.raise_for_status()
-            data = response.json()
-
-            repos = []
-            for item in data.get('items', []):
-                repos.append({
-                    "name": item.get("full_name"),
-                    "description": item.get("description"),
-                    "stars": item.get("stargazers_count"),
-                    "forks": item.get("forks_count"),
-                    "language": item.get("language"),
-                    "url": item.get("html_url"),
-                    "topics": item.get("topics", [])
-                })
+
+            repos = [_repo_summary(item) for item in data.get('items', [])]
 
             return {
                 "query": query,
@@ -92,13 +241,14 @@ class GitHubClient:
                 "repositories": repos
             }
         except Exception as e:
-            logger.error(f"GitHub search error: {e}")
+            logger.error("GitHub search error: %s", e)
             return {"error": str(e)}
 
     def search_code(
         self,
         query: str,
-        per_page: int = 30
+        per_page: int = 30,
+        max_pages: int = 1
     ) -> Dict[str, Any]:
         """
         Search GitHub code.
@@ -106,28 +256,16 @@ class GitHubClient:
         Args:
             query: Search query (e.g., "addClass in:file language:js")
             per_page: Results per page
+            max_pages: Pages to fetch (in parallel after the first); GitHub
+                serves at most 1000 results per query
 
         Returns:
             Dict with code search results
         """
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/search/code",
-                params={"q": query, "per_page": per_page},
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            results = []
-            for item in data.get('items', []):
-                results.append({
-                    "name": item.get("name"),
-                    "path": item.get("path"),
-                    "repository": item.get("repository", {}).get("full_name"),
-                    "url": item.get("html_url"),
-                    "language": item.get("language")
-                })
+            data = self._search("/search/code", {"q": query, "per_page": per_page}, max_pages)
+
+            results = [_code_result(item) for item in data.get('items', [])]
 
             return {
                 "query": query,
@@ -135,7 +273,7 @@ class GitHubClient:
                 "results": results
             }
         except Exception as e:
-            logger.error(f"GitHub code search error: {e}")
+            logger.error("GitHub code search error: %s", e)
             return {"error": str(e)}
 
     def get_repository(self, owner: str, repo: str) -> Dict[str, Any]:
@@ -150,29 +288,14 @@ class GitHubClient:
             Dict with repository info
         """
         try:
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/repos/{owner}/{repo}",
-                timeout=30
+                ttl=REPO_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
 
-            return {
-                "name": data.get("full_name"),
-                "description": data.get("description"),
-                "stars": data.get("stargazers_count"),
-                "forks": data.get("forks_count"),
-                "watchers": data.get("watchers_count"),
-                "language": data.get("language"),
-                "topics": data.get("topics", []),
-                "created_at": data.get("created_at"),
-                "updated_at": data.get("updated_at"),
-                "url": data.get("html_url"),
-                "homepage": data.get("homepage"),
-                "license": data.get("license", {}).get("name")
-            }
+            return _repo_details(data)
         except Exception as e:
-            logger.error(f"GitHub repo fetch error: {e}")
+            logger.error("GitHub repo fetch error: %s", e)
             return {"error": str(e)}
 
     def search_issues(
@@ -180,7 +303,8 @@ class GitHubClient:
         query: str,
         sort: str = "created",
         order: str = "desc",
-        per_page: int = 30
+        per_page: int = 30,
+        max_pages: int = 1
     ) -> Dict[str, Any]:
         """
         Search GitHub issues and pull requests.
@@ -190,36 +314,20 @@ class GitHubClient:
             sort: Sort by (created, updated, comments)
             order: asc or desc
             per_page: Results per page
+            max_pages: Pages to fetch (in parallel after the first); GitHub
+                serves at most 1000 results per query
 
         Returns:
             Dict with issue search results
         """
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/search/issues",
-                params={
-                    "q": query,
-                    "sort": sort,
-                    "order": order,
-                    "per_page": per_page
-                },
-                timeout=30
+            data = self._search(
+                "/search/issues",
+                {"q": query, "sort": sort, "order": order, "per_page": per_page},
+                max_pages
             )
-            response.raise_for_status()
-            data = response.json()
-
-            issues = []
-            for item in data.get('items', []):
-                issues.append({
-                    "title": item.get("title"),
-                    "number": item.get("number"),
-                    "state": item.get("state"),
-                    "user": item.get("user", {}).get("login"),
-                    "repository": item.get("repository_url", "").split("/")[-2:],
-                    "created_at": item.get("created_at"),
-                    "url": item.get("html_url"),
-                    "labels": [l.get("name") for l in item.get("labels", [])]
-                })
+
+            issues = [_issue_summary(item) for item in data.get('items', [])]
 
             return {
                 "query": query,
@@ -227,6 +335,180 @@ class GitHubClient:
                 "issues": issues
             }
         except Exception as e:
-            logger.error(f"GitHub issue search error: {e}")
+            logger.error("GitHub issue search error: %s", e)
             return {"error": str(e)}
 
+
+class AsyncGitHubClient(AsyncHTTPClient):
+    """
+    Asynchronous client for GitHub API.
+
+    Same methods as GitHubClient, as coroutines sharing one aiohttp session.
+
+    Example:
+        >>> async with AsyncGitHubClient() as client:  # doctest: +SKIP
+        ...     repo = await client.get_repository("python", "cpython")
+    """
+
+    BASE_URL = GitHubClient.BASE_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        concurrency: int = 20,
+        max_concurrency: int = 20,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True
+    ):
+        """
+        Initialize async GitHub client.
+
+        Args:
+            api_key: GitHub personal access token (optional but recommended for higher rate limits)
+            concurrency: Maximum number of simultaneous connections
+            max_concurrency: Maximum in-flight requests for batch helpers
+            cache: Response cache backend (default: in-memory TTLCache)
+            use_cache: Whether to cache responses
+
+        Raises:
+            ImportError: If aiohttp library not available
+        """
+        self.api_key = api_key or os.getenv('GITHUB_TOKEN') or os.getenv('GITHUB_API_KEY')
+        headers = {}
+        if self.api_key:
+            headers = {
+                'Authorization': f'Bearer {self.api_key}',
+                'Accept': 'application/vnd.github.v3+json'
+            }
+        else:
+            logger.warning(
+                "No GitHub API key provided. Rate limits will be restrictive (60 requests/hour)"
+            )
+        super().__init__(
+            headers=headers,
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+            cache=resolve_cache(cache, use_cache),
+            rate_limiter=_rate_limiter(self.api_key)
+        )
+        self.search_rate_limiter = _search_rate_limiter(self.api_key)
+
+    async def _search(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        max_pages: int = 1
+    ) -> Dict[str, Any]:
+        """Async version of GitHubClient._search."""
+        url = f"{self.BASE_URL}{path}"
+        data = await self._get_json(
+            url, params=params, ttl=SEARCH_CACHE_TTL, rate_limiter=self.search_rate_limiter
+        )
+        pages = _remaining_pages(data.get('total_count', 0), params["per_page"], max_pages)
+        if not pages:
+            return data
+
+        rest = await self._gather_bounded(
+            self._get_json(
+                url,
+                params={**params, "page": page},
+                ttl=SEARCH_CACHE_TTL,
+                rate_limiter=self.search_rate_limiter
+            )
+            for page in pages
+        )
+        items = list(data.get('items', []))
+        for page in rest:
+            if "error" in page:
+                raise RuntimeError(page["error"])
+            items.extend(page.get('items', []))
+        return {**data, "items": items}
+
+    async def search_repositories(
+        self,
+        query: str,
+        sort: str = "stars",
+        order: str = "desc",
+        per_page: int = 30,
+        max_pages: int = 1
+    ) -> Dict[str, Any]:
+        """Async version of GitHubClient.search_repositories."""
+        try:
+            data = await self._search(
+                "/search/repositories",
+                {"q": query, "sort": sort, "order": order, "per_page": per_page},
+                max_pages
+            )
+            return {
+                "query": query,
+                "total_count": data.get('total_count', 0),
+                "repositories": [_repo_summary(item) for item in data.get('items', [])]
+            }
+        except Exception as e:
+            logger.error("GitHub search error: %s", e)
+            return {"error": str(e)}
+
+    async def search_code(
+        self,
+        query: str,
+        per_page: int = 30,
+        max_pages: int = 1
+    ) -> Dict[str, Any]:
+        """Async version of GitHubClient.search_code."""
+        try:
+            data = await self._search("/search/code", {"q": query, "per_page": per_page}, max_pages)
+            return {
+                "query": query,
+                "total_count": data.get('total_count', 0),
+                "results": [_code_result(item) for item in data.get('items', [])]
+            }
+        except Exception as e:
+            logger.error("GitHub code search error: %s", e)
+            return {"error": str(e)}
+
+    async def get_repository(self, owner: str, repo: str) -> Dict[str, Any]:
+        """Async version of GitHubClient.get_repository."""
+        try:
+            data = await self._get_json(f"{self.BASE_URL}/repos/{owner}/{repo}", ttl=REPO_CACHE_TTL)
+            return _repo_details(data)
+        except Exception as e:
+            logger.error("GitHub repo fetch error: %s", e)
+            return {"error": str(e)}
+
+    async def get_repositories_many(self, repos: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Fetch several repositories concurrently.
+
+        Args:
+            repos: (owner, repo) pairs
+
+        Returns:
+            One result dict per repository, in input order
+        """
+        return await self._gather_bounded(
+            self.get_repository(owner, repo) for owner, repo in repos
+        )
+
+    async def search_issues(
+        self,
+        query: str,
+        sort: str = "created",
+        order: str = "desc",
+        per_page: int = 30,
+        max_pages: int = 1
+    ) -> Dict[str, Any]:
+        """Async version of GitHubClient.search_issues."""
+        try:
+            data = await self._search(
+                "/search/issues",
+                {"q": query, "sort": sort, "order": order, "per_page": per_page},
+                max_pages
+            )
+            return {
+                "query": query,
+                "total_count": data.get('total_count', 0),
+                "issues": [_issue_summary(item) for item in data.get('items', [])]
+            }
+        except Exception as e:
+            logger.error("GitHub issue search error: %s", e)
+            return {"error": str(e)}
@@ -14,6 +14,8 @@ import requests
 from typing import Dict, Any, Optional, List
 import logging
 
+from .utils import get_shared_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,9 +29,14 @@ class JudiciaryClient:
 
     BASE_URL = "https://www.judicialfinancialreport.org"
 
-    def __init__(self):
-        """Initialize Judiciary client."""
-        self.session = requests.Session()
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize Judiciary client.
+
+        Args:
+            session: Session to use (default: the process-wide shared session)
+        """
+        self.session = session or get_shared_session()
         logger.info("Judiciary client initialized. Note: Full functionality requires PDF parsing.")
 
     def search_judges(
@@ -13,25 +13,101 @@ API Documentation: https://myanimelist.net/apiconfig/references/api/v2
 Author: Luke Steuber
 """
 
+import asyncio
 import os
 import requests
 from typing import Dict, Any, Optional, List
 import logging
 
+from .utils import (
+    AIOHTTP_AVAILABLE,
+    HTTP_ERRORS,
+    AsyncHTTPClient,
+    CachedSessionMixin,
+    ResponseCache,
+    get_shared_session,
+    names,
+    resolve_cache,
+)
+
+if AIOHTTP_AVAILABLE:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_SEARCH_FIELDS = 'mean,rank,popularity,num_episodes,genres,studios'
+DETAIL_FIELDS = 'synopsis,mean,rank,popularity,num_episodes,start_season,genres,studios,rating'
+SEASON_FIELDS = 'mean,rank,genres'
+
+# Cache lifetimes (seconds); anime details rarely change
+SEARCH_CACHE_TTL = 3600
+DETAILS_CACHE_TTL = 7 * 24 * 3600
+SEASON_CACHE_TTL = 24 * 3600
+
+
+def _anime_summary(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an anime node from a search result."""
+    return {
+        "id": node.get("id"),
+        "title": node.get("title"),
+        "mean_score": node.get("mean"),
+        "rank": node.get("rank"),
+        "popularity": node.get("popularity"),
+        "num_episodes": node.get("num_episodes"),
+        "genres": names(node.get("genres")),
+        "studios": names(node.get("studios")),
+    }
+
+
+def _anime_details(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an anime detail response."""
+    return {
+        "id": data.get("id"),
+        "title": data.get("title"),
+        "synopsis": data.get("synopsis"),
+        "mean_score": data.get("mean"),
+        "rank": data.get("rank"),
+        "popularity": data.get("popularity"),
+        "num_episodes": data.get("num_episodes"),
+        "start_season": data.get("start_season"),
+        "genres": names(data.get("genres")),
+        "studios": names(data.get("studios")),
+        "rating": data.get("rating"),
+    }
+
+
+def _season_anime(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an anime node from a seasonal listing."""
+    return {
+        "id": node.get("id"),
+        "title": node.get("title"),
+        "mean_score": node.get("mean"),
+        "genres": names(node.get("genres")),
+    }
 
-class MyAnimeListClient:
+
+class MyAnimeListClient(CachedSessionMixin):
     """Client for MyAnimeList API v2."""
 
     BASE_URL = "https://api.myanimelist.net/v2"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        http2: bool = False,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize MAL client.
 
         Args:
             api_key: MAL API client ID
+            cache: Response cache backend (default: in-memory TTLCache)
+            use_cache: Whether to cache responses
+            http2: Use an HTTP/2 httpx client instead of requests (needs httpx[http2])
+            session: Session to use (default: the process-wide shared session)
         """
         self.api_key = api_key or os.getenv('MAL_API_KEY') or os.getenv('MYANIMELIST_API_KEY')
         
@@ -41,10 +117,11 @@ class MyAnimeListClient:
                 "and set MAL_API_KEY environment variable"
             )
 
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = session or get_shared_session(http2)
+        self.headers = {
             'X-MAL-CLIENT-ID': self.api_key
-        })
+        }
+        self.cache = resolve_cache(cache, use_cache)
 
     def search_anime(
         self,
@@ -64,67 +141,35 @@ class MyAnimeListClient:
             Dict with anime results
         """
         try:
-            params = {'q': query, 'limit': limit}
-            if fields:
-                params['fields'] = fields
-            else:
-                params['fields'] = 'mean,rank,popularity,num_episodes,genres,studios'
+            params = {'q': query, 'limit': limit, 'fields': fields or DEFAULT_SEARCH_FIELDS}
 
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/anime",
                 params=params,
-                timeout=30
+                ttl=SEARCH_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            anime_list = []
-            for item in data.get('data', []):
-                node = item.get('node', {})
-                anime_list.append({
-                    "id": node.get("id"),
-                    "title": node.get("title"),
-                    "mean_score": node.get("mean"),
-                    "rank": node.get("rank"),
-                    "popularity": node.get("popularity"),
-                    "num_episodes": node.get("num_episodes"),
-                    "genres": [g.get("name") for g in node.get("genres", [])],
-                    "studios": [s.get("name") for s in node.get("studios", [])],
-                })
+
+            anime_list = [_anime_summary(item.get('node', {})) for item in data.get('data', [])]
 
             return {"anime": anime_list, "total": len(anime_list)}
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"MAL API error searching anime: {e}")
+        except HTTP_ERRORS as e:
+            logger.error("MAL API error searching anime: %s", e)
             return {"error": str(e), "anime": []}
 
     def get_anime_details(self, anime_id: int) -> Dict[str, Any]:
         """Get detailed info for an anime."""
         try:
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/anime/{anime_id}",
-                params={'fields': 'synopsis,mean,rank,popularity,num_episodes,start_season,genres,studios,rating'},
-                timeout=30
+                params={'fields': DETAIL_FIELDS},
+                ttl=DETAILS_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            return {
-                "id": data.get("id"),
-                "title": data.get("title"),
-                "synopsis": data.get("synopsis"),
-                "mean_score": data.get("mean"),
-                "rank": data.get("rank"),
-                "popularity": data.get("popularity"),
-                "num_episodes": data.get("num_episodes"),
-                "start_season": data.get("start_season"),
-                "genres": [g.get("name") for g in data.get("genres", [])],
-                "studios": [s.get("name") for s in data.get("studios", [])],
-                "rating": data.get("rating"),
-            }
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"MAL API error getting anime details: {e}")
+
+            return _anime_details(data)
+
+        except HTTP_ERRORS as e:
+            logger.error("MAL API error getting anime details: %s", e)
             return {"error": str(e)}
 
     def get_season_anime(self, year: int, season: str, limit: int = 20) -> Dict[str, Any]:
@@ -140,26 +185,130 @@ class MyAnimeListClient:
             Dict with seasonal anime
         """
         try:
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/anime/season/{year}/{season}",
-                params={'limit': limit, 'fields': 'mean,rank,genres'},
-                timeout=30
+                params={'limit': limit, 'fields': SEASON_FIELDS},
+                ttl=SEASON_CACHE_TTL
+            )
+
+            anime_list = [_season_anime(item.get('node', {})) for item in data.get('data', [])]
+
+            return {"anime": anime_list, "season": f"{season} {year}"}
+
+        except HTTP_ERRORS as e:
+            logger.error("MAL API error getting season anime: %s", e)
+            return {"error": str(e), "anime": []}
+
+
+class AsyncMyAnimeListClient(AsyncHTTPClient):
+    """
+    Asynchronous client for MyAnimeList API v2.
+
+    Same methods as MyAnimeListClient, as coroutines sharing one aiohttp session.
+
+    Example:
+        >>> async with AsyncMyAnimeListClient() as client:  # doctest: +SKIP
+        ...     details = await client.get_anime_details(5114)
+    """
+
+    BASE_URL = MyAnimeListClient.BASE_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        concurrency: int = 20,
+        max_concurrency: int = 10,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True
+    ):
+        """
+        Initialize async MAL client.
+
+        Args:
+            api_key: MAL API client ID
+            concurrency: Maximum number of simultaneous connections
+            max_concurrency: Maximum in-flight requests for batch helpers
+            cache: Response cache backend (default: in-memory TTLCache)
+            use_cache: Whether to cache responses
+
+        Raises:
+            ValueError: If no API key is available
+            ImportError: If aiohttp library not available
+        """
+        self.api_key = api_key or os.getenv('MAL_API_KEY') or os.getenv('MYANIMELIST_API_KEY')
+
+        if not self.api_key:
+            raise ValueError(
+                "MyAnimeList API key is required. Get one at https://myanimelist.net/apiconfig "
+                "and set MAL_API_KEY environment variable"
+            )
+
+        super().__init__(
+            headers={'X-MAL-CLIENT-ID': self.api_key},
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+            cache=resolve_cache(cache, use_cache)
+        )
+
+    async def search_anime(
+        self,
+        query: str,
+        limit: int = 10,
+        fields: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async version of MyAnimeListClient.search_anime."""
+        try:
+            data = await self._get_json(
+                f"{self.BASE_URL}/anime",
+                params={'q': query, 'limit': limit, 'fields': fields or DEFAULT_SEARCH_FIELDS},
+                ttl=SEARCH_CACHE_TTL
+            )
+            anime_list = [_anime_summary(item.get('node', {})) for item in data.get('data', [])]
+            return {"anime": anime_list, "total": len(anime_list)}
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("MAL API error searching anime: %s", e)
+            return {"error": str(e), "anime": []}
+
+    async def get_anime_details(self, anime_id: int) -> Dict[str, Any]:
+        """Async version of MyAnimeListClient.get_anime_details."""
+        try:
+            data = await self._get_json(
+                f"{self.BASE_URL}/anime/{anime_id}",
+                params={'fields': DETAIL_FIELDS},
+                ttl=DETAILS_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            anime_list = []
-            for item in data.get('data', []):
-                node = item.get('node', {})
-                anime_list.append({
-                    "id": node.get("id"),
-                    "title": node.get("title"),
-                    "mean_score": node.get("mean"),
-                    "genres": [g.get("name") for g in node.get("genres", [])],
-                })
+            return _anime_details(data)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("MAL API error getting anime details: %s", e)
+            return {"error": str(e)}
+
+    async def get_anime_details_many(self, anime_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Fetch details for several anime concurrently.
 
+        Args:
+            anime_ids: MAL anime IDs
+
+        Returns:
+            One result dict per ID, in input order
+        """
+        return await self._gather_bounded(
+            self.get_anime_details(anime_id) for anime_id in anime_ids
+        )
+
+    async def get_season_anime(self, year: int, season: str, limit: int = 20) -> Dict[str, Any]:
+        """Async version of MyAnimeListClient.get_season_anime."""
+        try:
+            data = await self._get_json(
+                f"{self.BASE_URL}/anime/season/{year}/{season}",
+                params={'limit': limit, 'fields': SEASON_FIELDS},
+                ttl=SEASON_CACHE_TTL
+            )
+            anime_list = [_season_anime(item.get('node', {})) for item in data.get('data', [])]
             return {"anime": anime_list, "season": f"{season} {year}"}
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"MAL API error getting season anime: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("MAL API error getting season anime: %s", e)
             return {"error": str(e), "anime": []}
@@ -14,27 +14,124 @@ Author: Luke Steuber
 
 import os
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 
+from .utils import (
+    FOREVER,
+    AsyncHTTPClient,
+    CachedSessionMixin,
+    ResponseCache,
+    TokenBucket,
+    dig,
+    get_shared_session,
+    resolve_cache,
+)
+
 logger = logging.getLogger(__name__)
 
+# Cache lifetimes (seconds); imagery for an explicit date never changes
+DAILY_CACHE_TTL = 3600
+MARS_CACHE_TTL = 24 * 3600
+NEO_CACHE_TTL = 3600
+
+# Requests per hour for DEMO_KEY and for a registered key
+DEMO_KEY_RATE_PER_HOUR = 30
+API_KEY_RATE_PER_HOUR = 1000
+
+# Default NEO feed window (the API's maximum)
+_NEO_WINDOW = timedelta(days=7)
+
+
+def _apod_result(data: Any) -> Dict[str, Any]:
+    """Shape an APOD response (a single entry or a list when count is set)."""
+    if isinstance(data, list):
+        return {"apods": data, "count": len(data)}
+    return {
+        "date": data.get("date"),
+        "title": data.get("title"),
+        "explanation": data.get("explanation"),
+        "url": data.get("url"),
+        "hdurl": data.get("hdurl"),
+        "media_type": data.get("media_type"),
+        "copyright": data.get("copyright")
+    }
+
+
+def _mars_photo(photo: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a single Mars Rover photo."""
+    return {
+        "id": photo.get("id"),
+        "sol": photo.get("sol"),
+        "camera": dig(photo, "camera", "name"),
+        "img_src": photo.get("img_src"),
+        "earth_date": photo.get("earth_date"),
+        "rover": dig(photo, "rover", "name")
+    }
+
+
+def _apod_ttl(date: Optional[str], count: Optional[int]) -> float:
+    """Random picks are never cached; a given date's picture never changes."""
+    if count:
+        return 0
+    return FOREVER if date else DAILY_CACHE_TTL
+
+
+def _imagery_ttl(date: Optional[str]) -> float:
+    """Imagery for an explicit date is fixed; "latest" can change daily."""
+    return FOREVER if date else DAILY_CACHE_TTL
+
+
+def _rate_limiter(api_key: str) -> TokenBucket:
+    """Pace requests to the key's hourly budget; the whole budget may be used in a burst."""
+    if api_key == 'DEMO_KEY':
+        return TokenBucket.per_hour(DEMO_KEY_RATE_PER_HOUR)
+    return TokenBucket.per_hour(API_KEY_RATE_PER_HOUR)
+
+
+def _default_neo_range(
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[str, str]:
+    """Fill in the NEO feed window: today through a week from today."""
+    if not start_date or not end_date:
+        # One snapshot, so the window can't straddle midnight
+        now = datetime.now()
+        if not start_date:
+            start_date = now.strftime('%Y-%m-%d')
+        if not end_date:
+            end_date = (now + _NEO_WINDOW).strftime('%Y-%m-%d')
+    return start_date, end_date
+
 
-class NASAClient:
+class NASAClient(CachedSessionMixin):
     """Client for NASA APIs."""
 
     BASE_URL = "https://api.nasa.gov"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        http2: bool = False,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize NASA client.
 
         Args:
             api_key: NASA API key (defaults to DEMO_KEY if not provided)
+            cache: Response cache backend (default: in-memory TTLCache)
+            use_cache: Whether to cache responses
+            http2: Use an HTTP/2 httpx client instead of requests (needs httpx[http2])
+            session: Session to use (default: the process-wide shared session)
         """
         self.api_key = api_key or os.getenv('NASA_API_KEY') or 'DEMO_KEY'
-        self.session = requests.Session()
+        self.session = session or get_shared_session(http2)
+        self.cache = resolve_cache(cache, use_cache)
+        self.rate_limiter = _rate_limiter(self.api_key)
 
     def get_apod(self, date: Optional[str] = None, count: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -55,29 +152,15 @@ class NASAClient:
             elif date:
                 params['date'] = date
 
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/planetary/apod",
                 params=params,
-                timeout=30
+                ttl=_apod_ttl(date, count)
             )
-            response.raise_for_status()
-            data = response.json()
-
-            # Handle single vs multiple results
-            if isinstance(data, list):
-                return {"apods": data, "count": len(data)}
-            else:
-                return {
-                    "date": data.get("date"),
-                    "title": data.get("title"),
-                    "explanation": data.get("explanation"),
-                    "url": data.get("url"),
-                    "hdurl": data.get("hdurl"),
-                    "media_type": data.get("media_type"),
-                    "copyright": data.get("copyright")
-                }
+
+            return _apod_result(data)
         except Exception as e:
-            logger.error(f"NASA APOD error: {e}")
+            logger.error("NASA APOD error: %s", e)
             return {"error": str(e)}
 
     def get_mars_photos(
@@ -103,24 +186,13 @@ class NASAClient:
             if camera:
                 params['camera'] = camera
 
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/mars-photos/api/v1/rovers/{rover}/photos",
                 params=params,
-                timeout=30
+                ttl=MARS_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            photos = []
-            for photo in data.get('photos', []):
-                photos.append({
-                    "id": photo.get("id"),
-                    "sol": photo.get("sol"),
-                    "camera": photo.get("camera", {}).get("name"),
-                    "img_src": photo.get("img_src"),
-                    "earth_date": photo.get("earth_date"),
-                    "rover": photo.get("rover", {}).get("name")
-                })
+
+            photos = [_mars_photo(photo) for photo in data.get('photos', [])]
 
             return {
                 "rover": rover,
@@ -129,7 +201,7 @@ class NASAClient:
                 "count": len(photos)
             }
         except Exception as e:
-            logger.error(f"NASA Mars photos error: {e}")
+            logger.error("NASA Mars photos error: %s", e)
             return {"error": str(e)}
 
     def get_earth_imagery(
@@ -162,13 +234,11 @@ class NASAClient:
             if date:
                 params['date'] = date
 
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/planetary/earth/imagery",
                 params=params,
-                timeout=30
+                ttl=_imagery_ttl(date)
             )
-            response.raise_for_status()
-            data = response.json()
 
             return {
                 "date": data.get("date"),
@@ -177,7 +247,7 @@ class NASAClient:
                 "location": {"latitude": lat, "longitude": lon}
             }
         except Exception as e:
-            logger.error(f"NASA Earth imagery error: {e}")
+            logger.error("NASA Earth imagery error: %s", e)
             return {"error": str(e)}
 
     def get_neo(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
@@ -191,23 +261,18 @@ class NASAClient:
         Returns:
             Dict with NEO data
         """
-        if not start_date:
-            start_date = datetime.now().strftime('%Y-%m-%d')
-        if not end_date:
-            end_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
+        start_date, end_date = _default_neo_range(start_date, end_date)
 
         try:
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/neo/rest/v1/feed",
                 params={
                     'start_date': start_date,
                     'end_date': end_date,
                     'api_key': self.api_key
                 },
-                timeout=30
+                ttl=NEO_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
 
             return {
                 "element_count": data.get("element_count", 0),
@@ -216,6 +281,176 @@ class NASAClient:
                 "end_date": end_date
             }
         except Exception as e:
-            logger.error(f"NASA NEO error: {e}")
+            logger.error("NASA NEO error: %s", e)
+            return {"error": str(e)}
+
+
+class AsyncNASAClient(AsyncHTTPClient):
+    """
+    Asynchronous client for NASA APIs.
+
+    Same methods as NASAClient, as coroutines sharing one aiohttp session.
+
+    Example:
+        >>> async with AsyncNASAClient() as client:  # doctest: +SKIP
+        ...     apod = await client.get_apod()
+    """
+
+    BASE_URL = NASAClient.BASE_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        concurrency: int = 20,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True
+    ):
+        """
+        Initialize async NASA client.
+
+        Args:
+            api_key: NASA API key (defaults to DEMO_KEY if not provided)
+            concurrency: Maximum number of simultaneous connections
+            max_concurrency: Maximum in-flight requests for batch helpers
+                             (default: 2 with DEMO_KEY, 10 with a real key)
+            cache: Response cache backend (default: in-memory TTLCache)
+            use_cache: Whether to cache responses
+
+        Raises:
+            ImportError: If aiohttp library not available
+        """
+        api_key = api_key or os.getenv('NASA_API_KEY') or 'DEMO_KEY'
+        if max_concurrency is None:
+            max_concurrency = 2 if api_key == 'DEMO_KEY' else 10
+        super().__init__(
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+            cache=resolve_cache(cache, use_cache),
+            rate_limiter=_rate_limiter(api_key)
+        )
+        self.api_key = api_key
+
+    async def get_apod(
+        self,
+        date: Optional[str] = None,
+        count: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Async version of NASAClient.get_apod."""
+        try:
+            params = {'api_key': self.api_key}
+            if count:
+                params['count'] = count
+            elif date:
+                params['date'] = date
+
+            data = await self._get_json(
+                f"{self.BASE_URL}/planetary/apod",
+                params=params,
+                ttl=_apod_ttl(date, count)
+            )
+            return _apod_result(data)
+        except Exception as e:
+            logger.error("NASA APOD error: %s", e)
+            return {"error": str(e)}
+
+    async def get_mars_photos(
+        self,
+        sol: int,
+        rover: str = "curiosity",
+        camera: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async version of NASAClient.get_mars_photos."""
+        try:
+            params = {'sol': sol, 'api_key': self.api_key}
+            if camera:
+                params['camera'] = camera
+
+            data = await self._get_json(
+                f"{self.BASE_URL}/mars-photos/api/v1/rovers/{rover}/photos",
+                params=params,
+                ttl=MARS_CACHE_TTL
+            )
+            photos = [_mars_photo(photo) for photo in data.get('photos', [])]
+            return {
+                "rover": rover,
+                "sol": sol,
+                "photos": photos,
+                "count": len(photos)
+            }
+        except Exception as e:
+            logger.error("NASA Mars photos error: %s", e)
             return {"error": str(e)}
 
+    async def get_mars_photos_many(
+        self,
+        sols: Iterable[int],
+        rover: str = "curiosity",
+        camera: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch Mars Rover photos for several sols concurrently.
+
+        Args:
+            sols: Martian sols (days)
+            rover: Rover name (curiosity, opportunity, spirit)
+            camera: Specific camera (FHAZ, RHAZ, MAST, etc.)
+
+        Returns:
+            One result dict per sol, in input order
+        """
+        return await self._gather_bounded(
+            self.get_mars_photos(sol, rover, camera) for sol in sols
+        )
+
+    async def get_earth_imagery(
+        self,
+        lat: float,
+        lon: float,
+        date: Optional[str] = None,
+        dim: float = 0.025
+    ) -> Dict[str, Any]:
+        """Async version of NASAClient.get_earth_imagery."""
+        try:
+            params = {'lat': lat, 'lon': lon, 'dim': dim, 'api_key': self.api_key}
+            if date:
+                params['date'] = date
+
+            data = await self._get_json(
+                f"{self.BASE_URL}/planetary/earth/imagery",
+                params=params,
+                ttl=_imagery_ttl(date)
+            )
+            return {
+                "date": data.get("date"),
+                "url": data.get("url"),
+                "cloud_score": data.get("cloud_score"),
+                "location": {"latitude": lat, "longitude": lon}
+            }
+        except Exception as e:
+            logger.error("NASA Earth imagery error: %s", e)
+            return {"error": str(e)}
+
+    async def get_neo(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async version of NASAClient.get_neo."""
+        start_date, end_date = _default_neo_range(start_date, end_date)
+
+        try:
+            data = await self._get_json(
+                f"{self.BASE_URL}/neo/rest/v1/feed",
+                params={'start_date': start_date, 'end_date': end_date, 'api_key': self.api_key},
+                ttl=NEO_CACHE_TTL
+            )
+            return {
+                "element_count": data.get("element_count", 0),
+                "near_earth_objects": data.get("near_earth_objects", {}),
+                "start_date": start_date,
+                "end_date": end_date
+            }
+        except Exception as e:
+            logger.error("NASA NEO error: %s", e)
+            return {"error": str(e)}
@@ -12,30 +12,181 @@ Author: Luke Steuber
 """
 
 import os
-import requests
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional
 import logging
 
-logger = logging.getLogger(__name__)
+import requests
 
+from .utils import (
+    ACCEPT_ENCODING,
+    AsyncHTTPClient,
+    CachedSessionMixin,
+    ResponseCache,
+    create_session,
+    dig,
+    get_shared_session,
+    record_mapper,
+    resolve_cache,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
 
-class NewsClient:
+logger = logging.getLogger(__name__)
+
+# Cache lifetimes (seconds); headlines and search results move quickly
+ARTICLES_CACHE_TTL = 300
+SOURCES_CACHE_TTL = 24 * 3600
+
+
+# Raw article fields, in output order; "source" is reduced to its name below
+_headline_fields = record_mapper({
+    "title": "title",
+    "description": "description",
+    "url": "url",
+    "source": "source",
+    "published_at": "publishedAt",
+    "author": "author",
+    "image_url": "urlToImage"
+})
+
+_article_fields = record_mapper({
+    "title": "title",
+    "description": "description",
+    "content": "content",
+    "url": "url",
+    "source": "source",
+    "published_at": "publishedAt",
+    "author": "author"
+})
+
+# Shape a news source
+_source = record_mapper({
+    "id": "id",
+    "name": "name",
+    "description": "description",
+    "url": "url",
+    "category": "category",
+    "country": "country",
+    "language": "language"
+})
+
+
+def _headline(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a top-headlines article."""
+    article = _headline_fields(item)
+    article["source"] = dig(article, "source", "name")
+    return article
+
+
+def _article(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an everything-search article."""
+    article = _article_fields(item)
+    article["source"] = dig(article, "source", "name")
+    return article
+
+
+def _headlines_params(
+    api_key: str,
+    country: str,
+    category: Optional[str],
+    query: Optional[str],
+    page_size: int
+) -> Dict[str, Any]:
+    """Query parameters for /top-headlines."""
+    params = {
+        'apiKey': api_key,
+        'country': country,
+        'pageSize': page_size
+    }
+    if category:
+        params['category'] = category
+    if query:
+        params['q'] = query
+    return params
+
+
+def _everything_params(
+    api_key: str,
+    query: str,
+    from_date: Optional[str],
+    to_date: Optional[str],
+    language: str,
+    sort_by: str,
+    page_size: int
+) -> Dict[str, Any]:
+    """Query parameters for /everything."""
+    params = {
+        'apiKey': api_key,
+        'q': query,
+        'language': language,
+        'sortBy': sort_by,
+        'pageSize': page_size
+    }
+    if from_date:
+        params['from'] = from_date
+    if to_date:
+        params['to'] = to_date
+    return params
+
+
+def _sources_params(
+    api_key: str,
+    category: Optional[str],
+    language: str,
+    country: Optional[str]
+) -> Dict[str, Any]:
+    """Query parameters for /sources."""
+    params = {'apiKey': api_key, 'language': language}
+    if category:
+        params['category'] = category
+    if country:
+        params['country'] = country
+    return params
+
+
+class NewsClient(CachedSessionMixin):
     """Client for News API."""
 
     BASE_URL = "https://newsapi.org/v2"
+    UNCACHED_PARAMS = ('apiKey',)
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        http2: bool = False,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize News API client.
 
         Args:
             api_key: News API key
+            cache: Response cache backend (default: in-memory TTLCache)
+            use_cache: Whether to cache responses
+            http2: Use the shared HTTP/2 httpx client instead of requests (needs httpx[http2])
+            session: Session to use (default: a pooled, retrying requests.Session)
         """
         self.api_key = api_key or os.getenv('NEWS_API_KEY')
         if not self.api_key:
             raise ValueError("NEWS_API_KEY is required")
 
-        self.session = requests.Session()
+        self._owns_session = session is None and not http2
+        if session is not None:
+            self.session = session
+        elif http2:
+            self.session = get_shared_session(http2=True)
+        else:
+            # Advertises br (with brotli installed) as well as gzip/deflate
+            self.session = create_session(
+                pool_connections=32,
+                pool_maxsize=64,
+                backoff_factor=0.3,
+                headers={"Accept-Encoding": ACCEPT_ENCODING}
+            )
+        self.cache = resolve_cache(cache, use_cache)
 
     def get_top_headlines(
         self,
@@ -57,46 +208,47 @@ class NewsClient:
             Dict with headlines
         """
         try:
-            params = {
-                'apiKey': self.api_key,
-                'country': country,
-                'pageSize': page_size
-            }
-
-            if category:
-                params['category'] = category
-            if query:
-                params['q'] = query
-
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/top-headlines",
-                params=params,
-                timeout=30
+                params=_headlines_params(self.api_key, country, category, query, page_size),
+                ttl=ARTICLES_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            articles = []
-            for item in data.get('articles', []):
-                articles.append({
-                    "title": item.get("title"),
-                    "description": item.get("description"),
-                    "url": item.get("url"),
-                    "source": item.get("source", {}).get("name"),
-                    "published_at": item.get("publishedAt"),
-                    "author": item.get("author"),
-                    "image_url": item.get("urlToImage")
-                })
 
             return {
                 "status": data.get('status'),
                 "total_results": data.get('totalResults', 0),
-                "articles": articles
+                "articles": [_headline(item) for item in data.get('articles', [])]
             }
         except Exception as e:
             logger.error(f"News API headlines error: {e}")
             return {"error": str(e)}
 
+    def iter_top_headlines(
+        self,
+        country: str = "us",
+        category: Optional[str] = None,
+        query: Optional[str] = None,
+        page_size: int = 20
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield top headlines one at a time.
+
+        Same articles as get_top_headlines, reshaped as they are consumed
+        rather than collected into a list.
+
+        Yields:
+            Article dicts
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        data = self._get_cached_json(
+            f"{self.BASE_URL}/top-headlines",
+            params=_headlines_params(self.api_key, country, category, query, page_size),
+            ttl=ARTICLES_CACHE_TTL
+        )
+        yield from map(_headline, data.get('articles', []))
+
     def search_everything(
         self,
         query: str,
@@ -121,48 +273,50 @@ class NewsClient:
             Dict with search results
         """
         try:
-            params = {
-                'apiKey': self.api_key,
-                'q': query,
-                'language': language,
-                'sortBy': sort_by,
-                'pageSize': page_size
-            }
-
-            if from_date:
-                params['from'] = from_date
-            if to_date:
-                params['to'] = to_date
-
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/everything",
-                params=params,
-                timeout=30
+                params=_everything_params(
+                    self.api_key, query, from_date, to_date, language, sort_by, page_size
+                ),
+                ttl=ARTICLES_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            articles = []
-            for item in data.get('articles', []):
-                articles.append({
-                    "title": item.get("title"),
-                    "description": item.get("description"),
-                    "content": item.get("content"),
-                    "url": item.get("url"),
-                    "source": item.get("source", {}).get("name"),
-                    "published_at": item.get("publishedAt"),
-                    "author": item.get("author")
-                })
 
             return {
                 "query": query,
                 "total_results": data.get('totalResults', 0),
-                "articles": articles
+                "articles": [_article(item) for item in data.get('articles', [])]
             }
         except Exception as e:
             logger.error(f"News API search error: {e}")
             return {"error": str(e)}
 
+    def iter_everything(
+        self,
+        query: str,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        language: str = "en",
+        sort_by: str = "publishedAt",
+        page_size: int = 20
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield search_everything results one at a time.
+
+        Yields:
+            Article dicts
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        data = self._get_cached_json(
+            f"{self.BASE_URL}/everything",
+            params=_everything_params(
+                self.api_key, query, from_date, to_date, language, sort_by, page_size
+            ),
+            ttl=ARTICLES_CACHE_TTL
+        )
+        yield from map(_article, data.get('articles', []))
+
     def get_sources(
         self,
         category: Optional[str] = None,
@@ -181,32 +335,13 @@ class NewsClient:
             Dict with sources
         """
         try:
-            params = {'apiKey': self.api_key, 'language': language}
-
-            if category:
-                params['category'] = category
-            if country:
-                params['country'] = country
-
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/sources",
-                params=params,
-                timeout=30
+                params=_sources_params(self.api_key, category, language, country),
+                ttl=SOURCES_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            sources = []
-            for item in data.get('sources', []):
-                sources.append({
-                    "id": item.get("id"),
-                    "name": item.get("name"),
-                    "description": item.get("description"),
-                    "url": item.get("url"),
-                    "category": item.get("category"),
-                    "country": item.get("country"),
-                    "language": item.get("language")
-                })
+
+            sources = [_source(item) for item in data.get('sources', [])]
 
             return {
                 "sources": sources,
@@ -216,3 +351,115 @@ class NewsClient:
             logger.error(f"News API sources error: {e}")
             return {"error": str(e)}
 
+
+class AsyncNewsClient(AsyncHTTPClient):
+    """
+    Asynchronous client for News API.
+
+    Same methods as NewsClient, as coroutines sharing one aiohttp session.
+
+    Example:
+        >>> async with AsyncNewsClient() as client:  # doctest: +SKIP
+        ...     tech, science = await asyncio.gather(
+        ...         client.get_top_headlines(category="technology"),
+        ...         client.get_top_headlines(category="science"),
+        ...     )
+    """
+
+    BASE_URL = NewsClient.BASE_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        concurrency: int = 20,
+        max_concurrency: int = 10,
+        session: Optional['aiohttp.ClientSession'] = None
+    ):
+        """
+        Initialize async News API client.
+
+        Args:
+            api_key: News API key
+            concurrency: Maximum number of simultaneous connections
+            max_concurrency: Maximum in-flight requests for batch helpers
+            session: aiohttp session shared with other clients (see
+                     utils.create_async_session); left open by close()
+
+        Raises:
+            ValueError: If no API key is available
+            ImportError: If aiohttp library not available
+        """
+        self.api_key = api_key or os.getenv('NEWS_API_KEY')
+        if not self.api_key:
+            raise ValueError("NEWS_API_KEY is required")
+        super().__init__(
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+            session=session
+        )
+
+    async def get_top_headlines(
+        self,
+        country: str = "us",
+        category: Optional[str] = None,
+        query: Optional[str] = None,
+        page_size: int = 20
+    ) -> Dict[str, Any]:
+        """Async version of NewsClient.get_top_headlines."""
+        try:
+            data = await self._get_json(
+                f"{self.BASE_URL}/top-headlines",
+                params=_headlines_params(self.api_key, country, category, query, page_size)
+            )
+            return {
+                "status": data.get('status'),
+                "total_results": data.get('totalResults', 0),
+                "articles": [_headline(item) for item in data.get('articles', [])]
+            }
+        except Exception as e:
+            logger.error(f"News API headlines error: {e}")
+            return {"error": str(e)}
+
+    async def search_everything(
+        self,
+        query: str,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        language: str = "en",
+        sort_by: str = "publishedAt",
+        page_size: int = 20
+    ) -> Dict[str, Any]:
+        """Async version of NewsClient.search_everything."""
+        try:
+            data = await self._get_json(
+                f"{self.BASE_URL}/everything",
+                params=_everything_params(
+                    self.api_key, query, from_date, to_date, language, sort_by, page_size
+                )
+            )
+            return {
+                "query": query,
+                "total_results": data.get('totalResults', 0),
+                "articles": [_article(item) for item in data.get('articles', [])]
+            }
+        except Exception as e:
+            logger.error(f"News API search error: {e}")
+            return {"error": str(e)}
+
+    async def get_sources(
+        self,
+        category: Optional[str] = None,
+        language: str = "en",
+        country: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async version of NewsClient.get_sources."""
+        try:
+            data = await self._get_json(
+                f"{self.BASE_URL}/sources",
+                params=_sources_params(self.api_key, category, language, country)
+            )
+            sources = [_source(item) for item in data.get('sources', [])]
+            return {"sources": sources, "count": len(sources)}
+        except Exception as e:
+            logger.error(f"News API sources error: {e}")
+            return {"error": str(e)}
@@ -12,24 +12,185 @@ No API key required.
 Author: Luke Steuber
 """
 
-import requests
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+import requests
+
+from .utils import (
+    ACCEPT_ENCODING,
+    AsyncHTTPClient,
+    CachedSessionMixin,
+    ResponseCache,
+    create_session,
+    get_shared_session,
+    record_mapper,
+    resolve_cache,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
+# Cache lifetimes (seconds); catalogue records rarely change
+SEARCH_CACHE_TTL = 3600
+RECORD_CACHE_TTL = 24 * 3600
+
+# ISBNs per /api/books request, and how many such requests run at once
+ISBN_BATCH_SIZE = 100
+ISBN_BATCH_WORKERS = 8
+
+HEADERS = {
+    'User-Agent': 'SharedLibraryOpenLibraryClient/1.0'
+}
+
+
+_search_doc_fields = record_mapper(
+    {
+        "title": "title",
+        "author": "author_name",
+        "first_publish_year": "first_publish_year",
+        "isbn": "isbn",
+        "publisher": "publisher",
+        "language": "language",
+        "subject": "subject",
+        "key": "key",
+        "cover_id": "cover_i"
+    },
+    defaults={
+        "author_name": list,
+        "isbn": list,
+        "publisher": list,
+        "language": list,
+        "subject": list
+    }
+)
+
+
+def _search_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a search.json document."""
+    book = _search_doc_fields(doc)
+    book["subject"] = book["subject"][:5]  # First 5 subjects
+    return book
+
+
+def _isbn_book(book_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an /api/books entry."""
+    return {
+        "title": book_data.get("title"),
+        "authors": [a.get("name") for a in book_data.get("authors", [])],
+        "publish_date": book_data.get("publish_date"),
+        "publishers": [p.get("name") for p in book_data.get("publishers", [])],
+        "number_of_pages": book_data.get("number_of_pages"),
+        "subjects": [s.get("name") for s in book_data.get("subjects", [])],
+        "cover": book_data.get("cover", {}).get("large"),
+        "url": book_data.get("url")
+    }
+
+
+def _isbn_params(isbns: List[str]) -> Dict[str, str]:
+    """Query parameters looking up several ISBNs in one /api/books call."""
+    return {
+        'bibkeys': ",".join(f'ISBN:{isbn}' for isbn in isbns),
+        'format': 'json',
+        'jscmd': 'data'
+    }
+
+
+def _isbn_results(data: Dict[str, Any], isbns: List[str]) -> List[Dict[str, Any]]:
+    """One shaped book (or not-found error) per requested ISBN."""
+    results = []
+    for isbn in isbns:
+        book_data = data.get(f'ISBN:{isbn}')
+        results.append(_isbn_book(book_data) if book_data else {"error": "Book not found"})
+    return results
+
+
+def _isbn_batches(isbns: List[str]) -> List[List[str]]:
+    """Split ISBNs into /api/books-sized chunks."""
+    return [isbns[i:i + ISBN_BATCH_SIZE] for i in range(0, len(isbns), ISBN_BATCH_SIZE)]
+
+
+def _author(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an author record."""
+    return {
+        "name": data.get("name"),
+        "birth_date": data.get("birth_date"),
+        "death_date": data.get("death_date"),
+        "bio": (
+            data.get("bio", {}).get("value")
+            if isinstance(data.get("bio"), dict)
+            else data.get("bio")
+        ),
+        "photo": data.get("photos", [None])[0],
+        "wikipedia": data.get("wikipedia"),
+        "key": data.get("key")
+    }
+
+
+def _subject_work(work: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a work from a subject listing."""
+    return {
+        "title": work.get("title"),
+        "authors": [a.get("name") for a in work.get("authors", [])],
+        "first_publish_year": work.get("first_publish_year"),
+        "key": work.get("key"),
+        "cover_id": work.get("cover_id")
+    }
+
+
+def _author_path(author_key: str) -> str:
+    """Normalize an author key to /authors/<id>."""
+    if not author_key.startswith('/authors/'):
+        author_key = f'/authors/{author_key}'
+    return author_key
+
 
-class OpenLibraryClient:
-    """Client for OpenLibrary API."""
+class OpenLibraryClient(CachedSessionMixin):
+    """
+    Client for OpenLibrary API.
+
+    Expired cache entries are revalidated with their ETag, so unchanged
+    records come back as an empty 304 instead of being downloaded again.
+    """
 
     BASE_URL = "https://openlibrary.org"
+    CONDITIONAL_REQUESTS = True
 
-    def __init__(self):
-        """Initialize OpenLibrary client."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'SharedLibraryOpenLibraryClient/1.0'
-        })
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        http2: bool = False,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Initialize OpenLibrary client.
+
+        Args:
+            cache: Response cache backend (default: in-memory TTLCache)
+            use_cache: Whether to cache responses
+            http2: Use the shared HTTP/2 httpx client instead of requests (needs httpx[http2])
+            session: Session to use (default: a pooled, retrying requests.Session)
+        """
+        # HEADERS go out per request, so a shared session can be passed in
+        self.headers = HEADERS
+        self._owns_session = session is None and not http2
+        if session is not None:
+            self.session = session
+        elif http2:
+            self.session = get_shared_session(http2=True)
+        else:
+            # Advertises br (with brotli installed) as well as gzip/deflate
+            self.session = create_session(
+                pool_connections=32,
+                pool_maxsize=64,
+                backoff_factor=0.3,
+                headers={"Accept-Encoding": ACCEPT_ENCODING}
+            )
+        self.cache = resolve_cache(cache, use_cache)
 
     def search_books(self, query: str, limit: int = 10) -> Dict[str, Any]:
         """
@@ -43,37 +204,38 @@ class OpenLibraryClient:
             Dict with book search results
         """
         try:
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/search.json",
                 params={'q': query, 'limit': limit},
-                timeout=30
+                ttl=SEARCH_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            books = []
-            for doc in data.get('docs', []):
-                books.append({
-                    "title": doc.get("title"),
-                    "author": doc.get("author_name", []),
-                    "first_publish_year": doc.get("first_publish_year"),
-                    "isbn": doc.get("isbn", []),
-                    "publisher": doc.get("publisher", []),
-                    "language": doc.get("language", []),
-                    "subject": doc.get("subject", [])[:5],  # First 5 subjects
-                    "key": doc.get("key"),
-                    "cover_id": doc.get("cover_i")
-                })
 
             return {
                 "query": query,
                 "num_found": data.get('numFound', 0),
-                "books": books
+                "books": [_search_doc(doc) for doc in data.get('docs', [])]
             }
         except Exception as e:
             logger.error(f"OpenLibrary search error: {e}")
             return {"error": str(e)}
 
+    def iter_search_books(self, query: str, limit: int = 10) -> Iterator[Dict[str, Any]]:
+        """
+        Yield search_books results one at a time.
+
+        Yields:
+            Book dicts
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        data = self._get_cached_json(
+            f"{self.BASE_URL}/search.json",
+            params={'q': query, 'limit': limit},
+            ttl=SEARCH_CACHE_TTL
+        )
+        yield from map(_search_doc, data.get('docs', []))
+
     def get_book_by_isbn(self, isbn: str) -> Dict[str, Any]:
         """
         Get book details by ISBN.
@@ -84,32 +246,39 @@ class OpenLibraryClient:
         Returns:
             Dict with book details
         """
+        return self._get_isbn_batch([isbn])[0]
+
+    def get_books_by_isbns(self, isbns: List[str]) -> List[Dict[str, Any]]:
+        """
+        Look up several ISBNs, up to ISBN_BATCH_SIZE per request.
+
+        Batches are fetched in parallel over the client's session.
+
+        Args:
+            isbns: ISBN-10 or ISBN-13 values
+
+        Returns:
+            One result dict per ISBN, in input order
+        """
+        batches = _isbn_batches(isbns)
+        if len(batches) <= 1:
+            return self._get_isbn_batch(isbns) if isbns else []
+
+        with ThreadPoolExecutor(max_workers=min(len(batches), ISBN_BATCH_WORKERS)) as executor:
+            return [book for books in executor.map(self._get_isbn_batch, batches) for book in books]
+
+    def _get_isbn_batch(self, isbns: List[str]) -> List[Dict[str, Any]]:
+        """Fetch one /api/books request's worth of ISBNs."""
         try:
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/api/books",
-                params={'bibkeys': f'ISBN:{isbn}', 'format': 'json', 'jscmd': 'data'},
-                timeout=30
+                params=_isbn_params(isbns),
+                ttl=RECORD_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            book_data = data.get(f'ISBN:{isbn}', {})
-            if not book_data:
-                return {"error": "Book not found"}
-
-            return {
-                "title": book_data.get("title"),
-                "authors": [a.get("name") for a in book_data.get("authors", [])],
-                "publish_date": book_data.get("publish_date"),
-                "publishers": [p.get("name") for p in book_data.get("publishers", [])],
-                "number_of_pages": book_data.get("number_of_pages"),
-                "subjects": [s.get("name") for s in book_data.get("subjects", [])],
-                "cover": book_data.get("cover", {}).get("large"),
-                "url": book_data.get("url")
-            }
+            return _isbn_results(data, isbns)
         except Exception as e:
             logger.error(f"OpenLibrary ISBN error: {e}")
-            return {"error": str(e)}
+            return [{"error": str(e)} for _ in isbns]
 
     def get_author(self, author_key: str) -> Dict[str, Any]:
         """
@@ -122,26 +291,12 @@ class OpenLibraryClient:
             Dict with author info
         """
         try:
-            # Ensure key format
-            if not author_key.startswith('/authors/'):
-                author_key = f'/authors/{author_key}'
-
-            response = self.session.get(
-                f"{self.BASE_URL}{author_key}.json",
-                timeout=30
+            data = self._get_cached_json(
+                f"{self.BASE_URL}{_author_path(author_key)}.json",
+                ttl=RECORD_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
 
-            return {
-                "name": data.get("name"),
-                "birth_date": data.get("birth_date"),
-                "death_date": data.get("death_date"),
-                "bio": data.get("bio", {}).get("value") if isinstance(data.get("bio"), dict) else data.get("bio"),
-                "photo": data.get("photos", [None])[0],
-                "wikipedia": data.get("wikipedia"),
-                "key": data.get("key")
-            }
+            return _author(data)
         except Exception as e:
             logger.error(f"OpenLibrary author error: {e}")
             return {"error": str(e)}
@@ -158,30 +313,125 @@ class OpenLibraryClient:
             Dict with books in subject
         """
         try:
-            response = self.session.get(
+            data = self._get_cached_json(
                 f"{self.BASE_URL}/subjects/{subject}.json",
                 params={'limit': limit},
-                timeout=30
+                ttl=SEARCH_CACHE_TTL
             )
-            response.raise_for_status()
-            data = response.json()
-
-            books = []
-            for work in data.get('works', []):
-                books.append({
-                    "title": work.get("title"),
-                    "authors": [a.get("name") for a in work.get("authors", [])],
-                    "first_publish_year": work.get("first_publish_year"),
-                    "key": work.get("key"),
-                    "cover_id": work.get("cover_id")
-                })
 
             return {
                 "subject": subject,
                 "work_count": data.get('work_count', 0),
-                "books": books
+                "books": [_subject_work(work) for work in data.get('works', [])]
             }
         except Exception as e:
             logger.error(f"OpenLibrary subject error: {e}")
             return {"error": str(e)}
 
+
+class AsyncOpenLibraryClient(AsyncHTTPClient):
+    """
+    Asynchronous client for OpenLibrary API.
+
+    Same methods as OpenLibraryClient, as coroutines sharing one aiohttp session.
+
+    Example:
+        >>> async with AsyncOpenLibraryClient() as client:  # doctest: +SKIP
+        ...     books = await client.get_books_by_isbns(["9780140328721", "9780261103573"])
+    """
+
+    BASE_URL = OpenLibraryClient.BASE_URL
+
+    def __init__(
+        self,
+        concurrency: int = 20,
+        max_concurrency: int = 10,
+        session: Optional['aiohttp.ClientSession'] = None
+    ):
+        """
+        Initialize async OpenLibrary client.
+
+        Args:
+            concurrency: Maximum number of simultaneous connections
+            max_concurrency: Maximum in-flight requests for batch helpers
+            session: aiohttp session shared with other clients (see
+                     utils.create_async_session); left open by close()
+
+        Raises:
+            ImportError: If aiohttp library not available
+        """
+        super().__init__(
+            headers=HEADERS,
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+            session=session
+        )
+
+    async def search_books(self, query: str, limit: int = 10) -> Dict[str, Any]:
+        """Async version of OpenLibraryClient.search_books."""
+        try:
+            data = await self._get_json(
+                f"{self.BASE_URL}/search.json",
+                params={'q': query, 'limit': limit}
+            )
+            return {
+                "query": query,
+                "num_found": data.get('numFound', 0),
+                "books": [_search_doc(doc) for doc in data.get('docs', [])]
+            }
+        except Exception as e:
+            logger.error(f"OpenLibrary search error: {e}")
+            return {"error": str(e)}
+
+    async def get_book_by_isbn(self, isbn: str) -> Dict[str, Any]:
+        """Async version of OpenLibraryClient.get_book_by_isbn."""
+        return (await self._get_isbn_batch([isbn]))[0]
+
+    async def get_books_by_isbns(self, isbns: List[str]) -> List[Dict[str, Any]]:
+        """
+        Look up several ISBNs, up to ISBN_BATCH_SIZE per request, batches concurrently.
+
+        Args:
+            isbns: ISBN-10 or ISBN-13 values
+
+        Returns:
+            One result dict per ISBN, in input order
+        """
+        results = await self._gather_bounded(
+            self._get_isbn_batch(batch) for batch in _isbn_batches(isbns)
+        )
+        return [book for books in results for book in books]
+
+    async def _get_isbn_batch(self, isbns: List[str]) -> List[Dict[str, Any]]:
+        """Async version of OpenLibraryClient._get_isbn_batch."""
+        try:
+            data = await self._get_json(f"{self.BASE_URL}/api/books", params=_isbn_params(isbns))
+            return _isbn_results(data, isbns)
+        except Exception as e:
+            logger.error(f"OpenLibrary ISBN error: {e}")
+            return [{"error": str(e)} for _ in isbns]
+
+    async def get_author(self, author_key: str) -> Dict[str, Any]:
+        """Async version of OpenLibraryClient.get_author."""
+        try:
+            data = await self._get_json(f"{self.BASE_URL}{_author_path(author_key)}.json")
+            return _author(data)
+        except Exception as e:
+            logger.error(f"OpenLibrary author error: {e}")
+            return {"error": str(e)}
+
+    async def get_subjects(self, subject: str, limit: int = 10) -> Dict[str, Any]:
+        """Async version of OpenLibraryClient.get_subjects."""
+        try:
+            data = await self._get_json(
+                f"{self.BASE_URL}/subjects/{subject}.json",
+                params={'limit': limit}
+            )
+            return {
+                "subject": subject,
+                "work_count": data.get('work_count', 0),
+                "books": [_subject_work(work) for work in data.get('works', [])]
+            }
+        except Exception as e:
+            logger.error(f"OpenLibrary subject error: {e}")
+            return {"error": str(e)}
@@ -8,11 +8,37 @@ completing the academic research trio alongside ArxivClient and SemanticScholarC
 Author: Luke Steuber
 """
 
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Dict, Iterator, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from dataclasses import asdict, dataclass
+import asyncio
 import logging
+import re
 import requests
 
+from .utils import (
+    DATACLASS_SLOTS,
+    HTTP_ERRORS,
+    AsyncHTTPClient,
+    CachedSessionMixin,
+    ResponseCache,
+    TokenBucket,
+    create_session,
+    get_shared_session,
+    record_mapper,
+    resolve_cache,
+)
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 # API URLs
@@ -25,8 +51,23 @@ HEADERS = {
     "User-Agent": "research-data-clients/0.1.0 (https://github.com/lukeslp/research-data-clients)"
 }
 
+# DOI within an elocationid such as "pii: S0140-6736(20)30183-5. doi: 10.1016/..."
+_DOI = re.compile(r'doi:\s*(\S+)', re.IGNORECASE)
+
+# ESummary fields copied straight onto PubMedArticle
+_summary_fields = record_mapper(
+    {
+        "title": "title",
+        "publication_date": "pubdate",
+        "abstract": "abstract",
+        "publication_types": "pubtype",
+        "keywords": "keywords"
+    },
+    defaults={"title": str, "pubdate": str, "pubtype": list, "keywords": list}
+)
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PubMedArticle:
     """Dataclass representing a PubMed article"""
     pmid: str
@@ -49,29 +90,19 @@ class PubMedArticle:
     def from_summary(cls, pmid: str, data: Dict[str, Any]) -> 'PubMedArticle':
         """Create PubMedArticle from PubMed summary API response"""
         # Extract authors
-        authors = []
-        if "authors" in data:
-            for author in data["authors"]:
-                if "name" in author:
-                    authors.append(author["name"])
+        authors = [author["name"] for author in data.get("authors", ()) if "name" in author]
 
         # Extract DOI from elocationid
-        doi = None
-        elocationid = data.get("elocationid", "")
-        if elocationid and "doi:" in elocationid.lower():
-            doi = elocationid.replace("doi:", "").strip()
+        match = _DOI.search(data.get("elocationid") or "")
+        doi = match.group(1) if match else None
 
         return cls(
             pmid=pmid,
-            title=data.get("title", ""),
             authors=authors,
             journal=data.get("fulljournalname", data.get("source", "")),
-            publication_date=data.get("pubdate", ""),
-            abstract=data.get("abstract"),
             doi=doi,
-            publication_types=data.get("pubtype", []),
-            keywords=data.get("keywords", []),
-            mesh_terms=None  # Requires separate fetch
+            mesh_terms=None,  # Requires separate fetch
+            **_summary_fields(data)
         )
 
     def to_dict(self) -> Dict:
@@ -92,29 +123,188 @@ class PubMedArticle:
         }
 
 
-class PubMedClient:
+VALID_SORTS = ("relevance", "date")
+
+# PMIDs per ESummary request; NCBI truncates or throttles much larger lists
+SUMMARY_BATCH_SIZE = 200
+
+# Cache lifetimes (seconds); new papers shift search hits, summaries are stable
+SEARCH_CACHE_TTL = 3600
+SUMMARY_CACHE_TTL = 24 * 3600
+
+
+def _batches(pmids: List[str]) -> List[List[str]]:
+    """Split PMIDs into ESummary-sized chunks."""
+    return [pmids[i:i + SUMMARY_BATCH_SIZE] for i in _batch_starts(pmids)]
+
+
+def _batch_starts(pmids: List[str]) -> range:
+    """Offset of each _batches() chunk within the full PMID list."""
+    return range(0, len(pmids), SUMMARY_BATCH_SIZE)
+
+
+def _max_parallel_requests(api_key: Optional[str]) -> int:
+    """NCBI's per-second request allowance: 10 with an API key, 3 without."""
+    return 10 if api_key else 3
+
+
+_PMID_PREFIX = re.compile(r'pmid:\s*', re.IGNORECASE)
+
+
+def _clean_pmid(pmid: str) -> str:
+    """Strip whitespace and any PMID: prefix."""
+    return _PMID_PREFIX.sub('', pmid).strip()
+
+
+def _base_params(api_key: Optional[str], email: Optional[str]) -> Dict[str, str]:
+    """Parameters sent with every E-utilities request, API key and email included."""
+    params = {"db": "pubmed", "retmode": "json"}
+    if api_key:
+        params["api_key"] = api_key
+    if email:
+        params["email"] = email
+    return params
+
+
+def _search_term(query: str, date_range: Optional[str], journal: Optional[str]) -> str:
+    """Build the ESearch term with optional journal and date filters."""
+    parts = [query]
+
+    if journal:
+        parts.append(f"{journal}[Journal]")
+
+    if date_range:
+        parts.append(f"{date_range}[Date - Publication]")
+
+    return " AND ".join(parts)
+
+
+def _esearch_params(
+    base_params: Dict[str, str],
+    query: str,
+    max_results: int,
+    sort_by: str,
+    date_range: Optional[str],
+    journal: Optional[str]
+) -> Dict[str, Any]:
+    """
+    ESearch parameters; searches spanning several ESummary batches also ask
+    NCBI to keep the result set on its history server.
+    """
+    if sort_by not in VALID_SORTS:
+        raise ValueError(f"Invalid sort_by: {sort_by}. Must be 'relevance' or 'date'")
+
+    params = {
+        **base_params,
+        "term": _search_term(query, date_range, journal),
+        "retmax": max_results,
+        "sort": "relevance" if sort_by == "relevance" else "pub date"
+    }
+    if max_results > SUMMARY_BATCH_SIZE:
+        params["usehistory"] = "y"
+    return params
+
+
+def _history(esearch_result: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """WebEnv/query_key naming a result set on NCBI's history server, if any."""
+    webenv = esearch_result.get("webenv")
+    query_key = esearch_result.get("querykey")
+    if not webenv or not query_key:
+        return None
+    return {"WebEnv": webenv, "query_key": query_key}
+
+
+def _summary_params(
+    base_params: Dict[str, str],
+    pmids: List[str],
+    history: Optional[Dict[str, str]],
+    retstart: int
+) -> Dict[str, Any]:
+    """
+    ESummary parameters for one batch: a slice of a history-server result
+    set when available, otherwise the PMIDs themselves.
+    """
+    if history is not None:
+        return {**base_params, **history, "retstart": retstart, "retmax": len(pmids)}
+    return {**base_params, "id": ",".join(pmids)}
+
+
+def _articles_from_summary(summary_data: Dict[str, Any], pmids: List[str]) -> List[PubMedArticle]:
+    """Build articles from an ESummary response, in the order NCBI lists them."""
+    result_list = summary_data.get("result", {})
+
+    # Get ordered UIDs (read, not popped: the response may be a cached object)
+    uids = result_list.get("uids", pmids)
+
+    # Build article list
+    articles = []
+    for uid in uids:
+        if uid in result_list:
+            article = PubMedArticle.from_summary(uid, result_list[uid])
+            articles.append(article)
+
+    return articles
+
+
+def _stream_articles(stream: Any, pmids: List[str]) -> List[PubMedArticle]:
+    """
+    Build articles from an ESummary body with ijson, one record at a time.
+
+    Each summary becomes a PubMedArticle as soon as it is parsed, so the raw
+    response is never held as a whole. Order follows NCBI's "uids" list.
+    """
+    uids = pmids
+    by_uid = {}
+    for uid, record in ijson.kvitems(stream, "result"):
+        if uid == "uids":
+            uids = record
+        else:
+            by_uid[uid] = PubMedArticle.from_summary(uid, record)
+    return [by_uid[uid] for uid in uids if uid in by_uid]
+
+
+class PubMedClient(CachedSessionMixin):
     """Client for interacting with the PubMed API"""
 
-    def __init__(self, api_key: Optional[str] = None, email: Optional[str] = None):
+    UNCACHED_PARAMS = ("api_key", "email")
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        email: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        http2: bool = False,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize the PubMed client.
 
         Args:
             api_key: Optional NCBI API key for higher rate limits
             email: Optional email for NCBI to contact about usage
+            cache: Response cache backend (default: in-memory TTLCache)
+            use_cache: Whether to cache responses
+            http2: Use the shared HTTP/2 httpx client instead of requests (needs httpx[http2])
+            session: Session to use (default: a pooled, retrying requests.Session)
         """
         self.api_key = api_key
         self.email = email
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
-
-    def _add_api_params(self, params: Dict) -> Dict:
-        """Add API key and email to request params if available"""
-        if self.api_key:
-            params['api_key'] = self.api_key
-        if self.email:
-            params['email'] = self.email
-        return params
+        self._base_params = _base_params(api_key, email)
+        # HEADERS go out per request, so a shared session can be passed in
+        self.headers = HEADERS
+        self._owns_session = session is None and not http2
+        if session is not None:
+            self.session = session
+        elif http2:
+            self.session = get_shared_session(http2=True)
+        else:
+            self.session = create_session(pool_connections=32, pool_maxsize=64, backoff_factor=0.3)
+        self.cache = resolve_cache(cache, use_cache)
+        # Shared by every thread of a parallel batch fetch, so the client as a
+        # whole stays within NCBI's 3/s (10/s with a key) allowance
+        requests_per_second = _max_parallel_requests(api_key)
+        self.rate_limiter = TokenBucket(requests_per_second, burst=requests_per_second)
 
     def search(
         self,
@@ -139,37 +329,15 @@ class PubMedClient:
 
         Raises:
             ValueError: If sort_by is invalid
-            requests.RequestException: If API request fails
+            requests.RequestException: If API request fails (httpx.HTTPError
+                when using HTTP/2)
         """
-        if sort_by not in ["relevance", "date"]:
-            raise ValueError(f"Invalid sort_by: {sort_by}. Must be 'relevance' or 'date'")
-
         try:
             logger.info(f"Searching PubMed for: '{query}' (max: {max_results}, sort: {sort_by})")
 
-            # Build search query with filters
-            search_query = query
-
-            if journal:
-                search_query += f" AND {journal}[Journal]"
-
-            if date_range:
-                search_query += f" AND {date_range}[Date - Publication]"
-
             # Step 1: Search for IDs
-            search_params = self._add_api_params({
-                "db": "pubmed",
-                "term": search_query,
-                "retmax": max_results,
-                "retmode": "json",
-                "sort": "relevance" if sort_by == "relevance" else "pub date"
-            })
-
-            search_response = self.session.get(PUBMED_SEARCH_URL, params=search_params, timeout=30)
-            search_response.raise_for_status()
-
-            search_data = search_response.json()
-            id_list = search_data.get("esearchresult", {}).get("idlist", [])
+            search_result = self._esearch(query, max_results, sort_by, date_range, journal)
+            id_list = search_result.get("idlist", [])
 
             if not id_list:
                 logger.info(f"No results found for PubMed query: {query}")
@@ -178,21 +346,84 @@ class PubMedClient:
             logger.info(f"Found {len(id_list)} article IDs, fetching summaries...")
 
             # Step 2: Get summaries for the IDs
-            articles = self._get_summaries(id_list)
+            articles = self._get_summaries(id_list, _history(search_result))
 
             logger.info(f"Retrieved {len(articles)} articles for query: '{query}'")
             return articles
 
-        except requests.RequestException as e:
+        except HTTP_ERRORS as e:
             logger.error(f"Error searching PubMed: {e}")
             raise
 
-    def _get_summaries(self, pmids: List[str]) -> List[PubMedArticle]:
+    def iter_search(
+        self,
+        query: str,
+        max_results: int = 10,
+        sort_by: str = "relevance",
+        date_range: Optional[str] = None,
+        journal: Optional[str] = None
+    ) -> Iterator[PubMedArticle]:
+        """
+        Search PubMed, yielding articles as their summaries arrive.
+
+        Unlike search, ESummary batches are fetched one at a time as the
+        results are consumed, so only one batch is held in memory (and, with
+        ijson installed, each batch is parsed as it downloads).
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return (default: 10)
+            sort_by: Sort order - "relevance" or "date" (default: "relevance")
+            date_range: Optional date filter (e.g., "2020/01/01:2024/01/01")
+            journal: Optional journal name filter
+
+        Yields:
+            PubMedArticle objects in search order
+
+        Raises:
+            ValueError: If sort_by is invalid
+            requests.RequestException: If API request fails (httpx.HTTPError
+                when using HTTP/2)
+        """
+        search_result = self._esearch(query, max_results, sort_by, date_range, journal)
+        id_list = search_result.get("idlist", [])
+        history = _history(search_result)
+        for batch, start in zip(_batches(id_list), _batch_starts(id_list)):
+            yield from self._get_summary_batch(batch, history, start)
+
+    def _esearch(
+        self,
+        query: str,
+        max_results: int,
+        sort_by: str,
+        date_range: Optional[str],
+        journal: Optional[str]
+    ) -> Dict[str, Any]:
+        """Run ESearch and return its "esearchresult" (PMIDs, WebEnv, ...)."""
+        search_params = _esearch_params(
+            self._base_params, query, max_results, sort_by, date_range, journal
+        )
+        # History-server sessions expire on NCBI's side, so those aren't cached
+        ttl = 0 if "usehistory" in search_params else SEARCH_CACHE_TTL
+        search_data = self._get_cached_json(PUBMED_SEARCH_URL, params=search_params, ttl=ttl)
+        return search_data.get("esearchresult", {})
+
+    def _get_summaries(
+        self,
+        pmids: List[str],
+        history: Optional[Dict[str, str]] = None
+    ) -> List[PubMedArticle]:
         """
         Get article summaries for a list of PMIDs.
 
+        Lists longer than SUMMARY_BATCH_SIZE are split into chunks fetched in
+        parallel (within NCBI's rate limit); results keep the input order.
+
         Args:
             pmids: List of PubMed IDs
+            history: WebEnv/query_key of the search that produced pmids; batches
+                     are then requested as retstart/retmax pages of that result
+                     set instead of as comma-joined ID lists
 
         Returns:
             List of PubMedArticle objects
@@ -200,28 +431,65 @@ class PubMedClient:
         if not pmids:
             return []
 
-        summary_params = self._add_api_params({
-            "db": "pubmed",
-            "id": ",".join(pmids),
-            "retmode": "json"
-        })
+        batches = _batches(pmids)
+        if len(batches) == 1:
+            return self._get_summary_batch(pmids)
 
-        summary_response = self.session.get(PUBMED_SUMMARY_URL, params=summary_params, timeout=30)
-        summary_response.raise_for_status()
+        workers = min(len(batches), _max_parallel_requests(self.api_key))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = executor.map(
+                self._get_summary_batch, batches, repeat(history), _batch_starts(pmids)
+            )
+            return [article for articles in pages for article in articles]
 
-        summary_data = summary_response.json()
-        result_list = summary_data.get("result", {})
+    def _get_summary_batch(
+        self,
+        pmids: List[str],
+        history: Optional[Dict[str, str]] = None,
+        retstart: int = 0
+    ) -> List[PubMedArticle]:
+        """Fetch one ESummary request's worth of PMIDs."""
+        summary_params = _summary_params(self._base_params, pmids, history, retstart)
+        ttl = 0 if history is not None else SUMMARY_CACHE_TTL
+        if IJSON_AVAILABLE and isinstance(self.session, requests.Session):
+            return self._stream_summary_batch(summary_params, pmids, ttl)
 
-        # Get ordered UIDs
-        uids = result_list.pop("uids", pmids) if "uids" in result_list else pmids
+        summary_data = self._get_cached_json(PUBMED_SUMMARY_URL, params=summary_params, ttl=ttl)
+        return _articles_from_summary(summary_data, pmids)
 
-        # Build article list
-        articles = []
-        for uid in uids:
-            if uid in result_list:
-                article = PubMedArticle.from_summary(uid, result_list[uid])
-                articles.append(article)
+    def _stream_summary_batch(
+        self,
+        params: Dict[str, Any],
+        pmids: List[str],
+        ttl: float = 0
+    ) -> List[PubMedArticle]:
+        """
+        Fetch one ESummary batch, parsing the body with ijson as it downloads.
 
+        Only the parsed articles are cached, not the raw payload.
+        """
+        key = None
+        if ttl and self.cache is not None:
+            key = self._cache_key(PUBMED_SUMMARY_URL, {**params, "stream": "articles"})
+            cached = self.cache.get(key)
+            if cached is not None:
+                return [PubMedArticle(**fields) for fields in cached]
+
+        self.rate_limiter.acquire()
+        response = self.session.get(
+            PUBMED_SUMMARY_URL,
+            params=params,
+            headers=self.headers,
+            timeout=30,
+            stream=True
+        )
+        with response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            articles = _stream_articles(response.raw, pmids)
+
+        if key is not None:
+            self.cache.set(key, [asdict(article) for article in articles], ttl)
         return articles
 
     def get_by_id(self, pmid: str) -> Optional[PubMedArticle]:
@@ -235,11 +503,12 @@ class PubMedClient:
             PubMedArticle object if found, None otherwise
 
         Raises:
-            requests.RequestException: If API request fails
+            requests.RequestException: If API request fails (httpx.HTTPError
+                when using HTTP/2)
         """
         try:
             # Clean PMID
-            clean_pmid = pmid.strip().replace("PMID:", "").replace("pmid:", "")
+            clean_pmid = _clean_pmid(pmid)
 
             logger.info(f"Fetching PubMed article: {clean_pmid}")
 
@@ -251,7 +520,7 @@ class PubMedClient:
 
             return articles[0]
 
-        except requests.RequestException as e:
+        except HTTP_ERRORS as e:
             logger.error(f"Error fetching PubMed article {pmid}: {e}")
             raise
 
@@ -266,11 +535,12 @@ class PubMedClient:
             List of PubMedArticle objects (may be shorter than input if some not found)
 
         Raises:
-            requests.RequestException: If API request fails
+            requests.RequestException: If API request fails (httpx.HTTPError
+                when using HTTP/2)
         """
         try:
             # Clean PMIDs
-            clean_ids = [p.strip().replace("PMID:", "").replace("pmid:", "") for p in pmids]
+            clean_ids = [_clean_pmid(p) for p in pmids]
 
             logger.info(f"Fetching {len(clean_ids)} PubMed articles")
 
@@ -279,7 +549,7 @@ class PubMedClient:
             logger.info(f"Retrieved {len(articles)}/{len(clean_ids)} articles")
             return articles
 
-        except requests.RequestException as e:
+        except HTTP_ERRORS as e:
             logger.error(f"Error fetching PubMed articles: {e}")
             raise
 
@@ -400,6 +670,158 @@ class PubMedClient:
         return '\n'.join(output)
 
 
+class AsyncPubMedClient(AsyncHTTPClient):
+    """
+    Asynchronous client for the PubMed API.
+
+    Search and lookup methods of PubMedClient as coroutines sharing one
+    aiohttp session.
+
+    Example:
+        >>> async with AsyncPubMedClient() as client:  # doctest: +SKIP
+        ...     diabetes, asthma = await asyncio.gather(
+        ...         client.search("diabetes"), client.search("asthma")
+        ...     )
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        email: Optional[str] = None,
+        concurrency: int = 10,
+        max_concurrency: Optional[int] = None,
+        session: Optional['aiohttp.ClientSession'] = None
+    ):
+        """
+        Initialize the async PubMed client.
+
+        Args:
+            api_key: Optional NCBI API key for higher rate limits
+            email: Optional email for NCBI to contact about usage
+            concurrency: Maximum number of simultaneous connections
+            max_concurrency: Maximum in-flight requests for batch helpers
+                             (default: NCBI's 10/s with an API key, 3/s without)
+            session: aiohttp session shared with other clients (see
+                     utils.create_async_session); left open by close()
+
+        Raises:
+            ImportError: If aiohttp library not available
+        """
+        requests_per_second = _max_parallel_requests(api_key)
+        if max_concurrency is None:
+            max_concurrency = requests_per_second
+        super().__init__(
+            headers=HEADERS,
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+            # Every E-utilities call counts against NCBI's per-second allowance
+            rate_limiter=TokenBucket(requests_per_second, burst=requests_per_second),
+            session=session
+        )
+        self.api_key = api_key
+        self.email = email
+        self._base_params = _base_params(api_key, email)
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        sort_by: str = "relevance",
+        date_range: Optional[str] = None,
+        journal: Optional[str] = None
+    ) -> List[PubMedArticle]:
+        """
+        Async version of PubMedClient.search.
+
+        Raises:
+            ValueError: If sort_by is invalid
+            aiohttp.ClientError: If API request fails
+        """
+        search_params = _esearch_params(
+            self._base_params, query, max_results, sort_by, date_range, journal
+        )
+        search_data = await self._get_json(PUBMED_SEARCH_URL, params=search_params)
+        search_result = search_data.get("esearchresult", {})
+        id_list = search_result.get("idlist", [])
+
+        if not id_list:
+            logger.info(f"No results found for PubMed query: {query}")
+            return []
+
+        return await self._get_summaries(id_list, _history(search_result))
+
+    async def search_many(
+        self,
+        queries: List[str],
+        max_results: int = 10,
+        sort_by: str = "relevance"
+    ) -> List[Any]:
+        """
+        Run several searches concurrently.
+
+        Each query's ESummary requests start as soon as its own ESearch
+        returns, so total time is roughly the slowest search plus the slowest
+        summary fetch rather than their sum. Requests are paced to NCBI's
+        per-second limit.
+
+        Args:
+            queries: Search query strings
+            max_results: Maximum number of results per query (default: 10)
+            sort_by: Sort order - "relevance" or "date" (default: "relevance")
+
+        Returns:
+            One list of PubMedArticle objects per query, in input order
+            ({"error": ...} for a query that failed)
+        """
+        return await self._gather_bounded(
+            self.search(query, max_results, sort_by) for query in queries
+        )
+
+    async def _get_summaries(
+        self,
+        pmids: List[str],
+        history: Optional[Dict[str, str]] = None
+    ) -> List[PubMedArticle]:
+        """Async version of PubMedClient._get_summaries."""
+        if not pmids:
+            return []
+
+        batches = _batches(pmids)
+        if len(batches) == 1:
+            return await self._get_summary_batch(pmids)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(batch: List[str], retstart: int) -> List[PubMedArticle]:
+            async with semaphore:
+                return await self._get_summary_batch(batch, history, retstart)
+
+        results = await asyncio.gather(
+            *(fetch(batch, start) for batch, start in zip(batches, _batch_starts(pmids)))
+        )
+        return [article for articles in results for article in articles]
+
+    async def _get_summary_batch(
+        self,
+        pmids: List[str],
+        history: Optional[Dict[str, str]] = None,
+        retstart: int = 0
+    ) -> List[PubMedArticle]:
+        """Async version of PubMedClient._get_summary_batch."""
+        summary_params = _summary_params(self._base_params, pmids, history, retstart)
+        summary_data = await self._get_json(PUBMED_SUMMARY_URL, params=summary_params)
+        return _articles_from_summary(summary_data, pmids)
+
+    async def get_by_id(self, pmid: str) -> Optional[PubMedArticle]:
+        """Async version of PubMedClient.get_by_id."""
+        articles = await self._get_summaries([_clean_pmid(pmid)])
+        return articles[0] if articles else None
+
+    async def get_by_ids(self, pmids: List[str]) -> List[PubMedArticle]:
+        """Async version of PubMedClient.get_by_ids."""
+        return await self._get_summaries([_clean_pmid(p) for p in pmids])
+
+
 # Convenience functions for backward compatibility and ease of use
 def search_pubmed(query: str, max_results: int = 10, sort_by: str = "relevance") -> List[Dict]:
     """
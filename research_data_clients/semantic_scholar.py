@@ -5,10 +5,25 @@ Access to academic paper metadata from Semantic Scholar.
 Extracted from schollama for reuse across projects.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, Iterator, List, Optional, Union
 from dataclasses import dataclass
 
+from .utils import (
+    DATACLASS_SLOTS,
+    HTTP_ERRORS,
+    CachedSessionMixin,
+    ResponseCache,
+    TokenBucket,
+    create_async_session,
+    create_session,
+    get_shared_session,
+    json_loads,
+    resolve_cache,
+)
+
 try:
     import aiohttp
     AIOHTTP_AVAILABLE = True
@@ -24,8 +39,38 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Requests per second Semantic Scholar allows without and with an API key
+ANONYMOUS_RATE_PER_SECOND = 1
+API_KEY_RATE_PER_SECOND = 10
+
+# Paper metadata looked up by ID changes rarely
+PAPER_CACHE_TTL = 24 * 3600
+
+# "arxiv:" prefix in any case, stripped before the canonical "arXiv:" is added
+_ARXIV_PREFIX = re.compile(r"^arxiv:", re.IGNORECASE)
+
+# Most IDs the /paper/batch endpoint accepts in one request
+PAPER_BATCH_SIZE = 500
+
+
+def _rate_limiter(api_key: Optional[str]) -> TokenBucket:
+    """Pace requests to the per-second allowance, one at a time without a key."""
+    rate = API_KEY_RATE_PER_SECOND if api_key else ANONYMOUS_RATE_PER_SECOND
+    return TokenBucket(rate, burst=rate)
+
+
+async def _gather_limited(coros: Iterable[Awaitable[Any]], max_concurrency: int) -> List[Any]:
+    """Await coroutines with at most max_concurrency in flight; exceptions are returned."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
 
-@dataclass
+    return await asyncio.gather(*(bounded(c) for c in coros), return_exceptions=True)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SemanticScholarPaper:
     """Represents a paper from Semantic Scholar"""
     title: str
@@ -44,33 +89,20 @@ class SemanticScholarPaper:
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> 'SemanticScholarPaper':
         """Create SemanticScholarPaper from API response"""
-        # Extract authors
-        authors = []
-        for author in data.get('authors', []):
-            name = author.get('name')
-            if name:
-                authors.append(name)
-
-        # Extract keywords from topics
-        keywords = []
-        for topic in data.get('topics', []):
-            topic_name = topic.get('topic')
-            if topic_name:
-                keywords.append(topic_name)
-
+        get = data.get
         return cls(
-            title=data.get('title', ''),
-            authors=authors,
-            year=data.get('year'),
-            abstract=data.get('abstract'),
-            doi=data.get('doi'),
-            keywords=keywords,
-            venue=data.get('venue'),
-            url=data.get('url'),
-            paper_id=data.get('paperId'),
-            citation_count=data.get('citationCount'),
-            reference_count=data.get('referenceCount'),
-            influential_citation_count=data.get('influentialCitationCount')
+            title=get('title', ''),
+            authors=[name for author in get('authors') or () if (name := author.get('name'))],
+            year=get('year'),
+            abstract=get('abstract'),
+            doi=get('doi'),
+            keywords=[name for topic in get('topics') or () if (name := topic.get('topic'))],
+            venue=get('venue'),
+            url=get('url'),
+            paper_id=get('paperId'),
+            citation_count=get('citationCount'),
+            reference_count=get('referenceCount'),
+            influential_citation_count=get('influentialCitationCount')
         )
 
     def to_dict(self) -> Dict:
@@ -92,8 +124,22 @@ class SemanticScholarPaper:
         }
 
 
-class SemanticScholarClient:
-    """Client for interacting with Semantic Scholar API"""
+def _papers(data: Dict[str, Any]) -> Iterator[SemanticScholarPaper]:
+    """Papers from a search response, skipping entries without a title."""
+    for paper in data.get('data', ()):
+        if paper.get('title'):
+            yield SemanticScholarPaper.from_api_response(paper)
+
+
+class SemanticScholarClient(CachedSessionMixin):
+    """
+    Client for interacting with Semantic Scholar API
+
+    Sync methods share one pooled session; use the client as a context
+    manager (or call close()) to release its connections. Async methods
+    likewise share one aiohttp session, released by ``async with`` or
+    aclose().
+    """
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
 
@@ -111,16 +157,45 @@ class SemanticScholarClient:
         "influentialCitationCount"
     ]
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional['requests.Session'] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        http2: bool = False
+    ):
         """
         Initialize Semantic Scholar client.
 
         Args:
             api_key: Optional API key for higher rate limits
                     (not required for basic usage)
+            session: Session to use (default: a pooled, retrying requests.Session)
+            cache: Cache for DOI/arXiv lookups (default: in-memory TTLCache)
+            use_cache: Whether to cache lookups
+            http2: Use the shared HTTP/2 httpx client instead of requests (needs httpx[http2])
         """
         self.api_key = api_key
         self.base_url = self.BASE_URL
+        self.cache = resolve_cache(cache, use_cache)
+        # Sent per request, so a caller-supplied session needs no setup
+        self.headers = self._get_headers()
+        # Shared by sync and async calls, so mixed use is paced together
+        self.rate_limiter = _rate_limiter(api_key)
+        self._owns_session = session is None and not http2
+        if session is not None:
+            self.session = session
+        elif http2:
+            self.session = get_shared_session(http2=True)
+        else:
+            self.session = create_session(pool_maxsize=20)
+        self._aio_session: Optional['aiohttp.ClientSession'] = None
+        self._default_fields = ",".join(self.DEFAULT_FIELDS)
+
+    def _fields_param(self, fields: Optional[List[str]]) -> str:
+        """The "fields" query value; the default list is joined once, in __init__."""
+        return ",".join(fields) if fields else self._default_fields
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
@@ -129,6 +204,24 @@ class SemanticScholarClient:
             headers["x-api-key"] = self.api_key
         return headers
 
+    async def _get_aio_session(self) -> 'aiohttp.ClientSession':
+        """Create the aiohttp session on first async use (inside the running loop)."""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = create_async_session(limit=20, headers=self.headers)
+        return self._aio_session
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session used by the async methods."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+
+    async def __aenter__(self) -> 'SemanticScholarClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
     def search(
         self,
         query: str,
@@ -156,43 +249,58 @@ class SemanticScholarClient:
             >>> len(papers)  # doctest: +SKIP
             5
         """
+        papers = list(self.iter_search(query, limit, fields))
+        logger.info(f"Found {len(papers)} papers")
+        return papers
+
+    def iter_search(
+        self,
+        query: str,
+        limit: int = 10,
+        fields: Optional[List[str]] = None
+    ) -> Iterator[SemanticScholarPaper]:
+        """
+        Search for papers, yielding each as it is built (synchronous).
+
+        Same results as search; papers are constructed as they are consumed
+        rather than collected into a list first.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results (default: 10)
+            fields: Fields to retrieve (default: DEFAULT_FIELDS)
+
+        Yields:
+            SemanticScholarPaper objects
+
+        Raises:
+            ImportError: If requests library not available
+            Exception: If API request fails
+        """
         if not REQUESTS_AVAILABLE:
             raise ImportError("requests library required. Install with: pip install requests")
 
-        fields = fields or self.DEFAULT_FIELDS
-
         try:
             url = f"{self.base_url}/paper/search"
             params = {
                 "query": query,
                 "limit": limit,
-                "fields": ",".join(fields)
+                "fields": self._fields_param(fields)
             }
 
             logger.info(f"Searching Semantic Scholar: '{query}' (limit={limit})")
 
-            response = requests.get(
-                url,
-                params=params,
-                headers=self._get_headers(),
-                timeout=30
-            )
+            self.rate_limiter.acquire()
+            response = self.session.get(url, params=params, headers=self.headers, timeout=30)
             response.raise_for_status()
-
-            data = response.json()
-            papers = [
-                SemanticScholarPaper.from_api_response(paper)
-                for paper in data.get('data', [])
-                if paper.get('title')
-            ]
-
-            logger.info(f"Found {len(papers)} papers")
-            return papers
+            data = json_loads(response.content)
 
         except Exception as e:
             logger.error(f"Error searching Semantic Scholar: {e}")
             raise
 
+        yield from _papers(data)
+
     def get_by_doi(
         self,
         doi: str,
@@ -215,28 +323,21 @@ class SemanticScholarClient:
         if not REQUESTS_AVAILABLE:
             raise ImportError("requests library required. Install with: pip install requests")
 
-        fields = fields or self.DEFAULT_FIELDS
-
         try:
             url = f"{self.base_url}/paper/{doi}"
-            params = {"fields": ",".join(fields)}
+            params = {"fields": self._fields_param(fields)}
 
             logger.info(f"Fetching paper by DOI: {doi}")
 
-            response = requests.get(
-                url,
-                params=params,
-                headers=self._get_headers(),
-                timeout=30
-            )
+            try:
+                data = self._get_cached_json(url, params=params, ttl=PAPER_CACHE_TTL)
+            except HTTP_ERRORS as e:
+                response = getattr(e, "response", None)
+                if response is not None and response.status_code == 404:
+                    logger.info(f"Paper not found: {doi}")
+                    return None
+                raise
 
-            if response.status_code == 404:
-                logger.info(f"Paper not found: {doi}")
-                return None
-
-            response.raise_for_status()
-
-            data = response.json()
             paper = SemanticScholarPaper.from_api_response(data)
 
             logger.info(f"Retrieved paper: {paper.title}")
@@ -266,9 +367,63 @@ class SemanticScholarClient:
             >>> paper = client.get_by_arxiv_id("2301.07041")  # doctest: +SKIP
         """
         # Clean arXiv ID
-        clean_id = arxiv_id.replace('arxiv:', '').replace('arXiv:', '')
+        clean_id = _ARXIV_PREFIX.sub('', arxiv_id)
         return self.get_by_doi(f"arXiv:{clean_id}", fields)
 
+    def get_batch_by_ids(
+        self,
+        ids: List[str],
+        fields: Optional[List[str]] = None
+    ) -> List[Optional[SemanticScholarPaper]]:
+        """
+        Get many papers with the /paper/batch endpoint (synchronous).
+
+        Each request carries up to PAPER_BATCH_SIZE IDs, replacing one GET
+        per paper with one POST per batch.
+
+        Args:
+            ids: Paper IDs in any form the API accepts (e.g. a Semantic
+                Scholar paper ID, "DOI:10.1234/example", "arXiv:2301.07041")
+            fields: Fields to retrieve (default: DEFAULT_FIELDS)
+
+        Returns:
+            One entry per ID, in input order: the paper, or None if not found
+
+        Example:
+            >>> client = SemanticScholarClient()
+            >>> papers = client.get_batch_by_ids(["arXiv:2301.07041"])  # doctest: +SKIP
+        """
+        if not REQUESTS_AVAILABLE:
+            raise ImportError("requests library required. Install with: pip install requests")
+
+        url = f"{self.base_url}/paper/batch"
+        params = {"fields": self._fields_param(fields)}
+        papers: List[Optional[SemanticScholarPaper]] = []
+        try:
+            for start in range(0, len(ids), PAPER_BATCH_SIZE):
+                batch = ids[start:start + PAPER_BATCH_SIZE]
+                logger.info(f"Fetching batch of {len(batch)} papers")
+
+                self.rate_limiter.acquire()
+                response = self.session.post(
+                    url,
+                    params=params,
+                    json={"ids": batch},
+                    headers=self.headers,
+                    timeout=60
+                )
+                response.raise_for_status()
+
+                papers.extend(
+                    SemanticScholarPaper.from_api_response(data) if data else None
+                    for data in json_loads(response.content)
+                )
+            return papers
+
+        except Exception as e:
+            logger.error(f"Error fetching paper batch: {e}")
+            raise
+
     async def search_async(
         self,
         query: str,
@@ -286,42 +441,146 @@ class SemanticScholarClient:
         Returns:
             List of SemanticScholarPaper objects
 
+        Raises:
+            ImportError: If aiohttp library not available
+        """
+        papers = [paper async for paper in self.iter_search_async(query, limit, fields)]
+        logger.info(f"Found {len(papers)} papers")
+        return papers
+
+    async def iter_search_async(
+        self,
+        query: str,
+        limit: int = 10,
+        fields: Optional[List[str]] = None
+    ) -> AsyncIterator[SemanticScholarPaper]:
+        """
+        Search for papers, yielding each as it is built (asynchronous).
+
+        Args:
+            query: Search query
+            limit: Maximum number of results (default: 10)
+            fields: Fields to retrieve (default: DEFAULT_FIELDS)
+
+        Yields:
+            SemanticScholarPaper objects
+
         Raises:
             ImportError: If aiohttp library not available
         """
         if not AIOHTTP_AVAILABLE:
             raise ImportError("aiohttp library required. Install with: pip install aiohttp")
 
-        fields = fields or self.DEFAULT_FIELDS
-
         try:
             url = f"{self.base_url}/paper/search"
             params = {
                 "query": query,
                 "limit": limit,
-                "fields": ",".join(fields)
+                "fields": self._fields_param(fields)
             }
 
             logger.info(f"Searching Semantic Scholar (async): '{query}' (limit={limit})")
 
-            async with aiohttp.ClientSession(headers=self._get_headers()) as session:
-                async with session.get(url, params=params, timeout=30) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    papers = [
-                        SemanticScholarPaper.from_api_response(paper)
-                        for paper in data.get('data', [])
-                        if paper.get('title')
-                    ]
-
-                    logger.info(f"Found {len(papers)} papers")
-                    return papers
+            session = await self._get_aio_session()
+            await self.rate_limiter.acquire_async()
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                data = json_loads(await response.read())
 
         except Exception as e:
             logger.error(f"Error searching Semantic Scholar (async): {e}")
             raise
 
+        for paper in _papers(data):
+            yield paper
+
+    async def get_by_doi_async(
+        self,
+        doi: str,
+        fields: Optional[List[str]] = None
+    ) -> Optional[SemanticScholarPaper]:
+        """
+        Get paper by DOI (asynchronous).
+
+        Args:
+            doi: Paper DOI
+            fields: Fields to retrieve (default: DEFAULT_FIELDS)
+
+        Returns:
+            SemanticScholarPaper or None if not found
+
+        Raises:
+            ImportError: If aiohttp library not available
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp library required. Install with: pip install aiohttp")
+
+        url = f"{self.base_url}/paper/{doi}"
+        params = {"fields": self._fields_param(fields)}
+
+        # Same cache as get_by_doi
+        key = self._cache_key(url, params) if self.cache is not None else None
+        data = self.cache.get(key) if key is not None else None
+        if data is None:
+            session = await self._get_aio_session()
+            await self.rate_limiter.acquire_async()
+            async with session.get(url, params=params) as response:
+                if response.status == 404:
+                    logger.info(f"Paper not found: {doi}")
+                    return None
+                response.raise_for_status()
+                data = json_loads(await response.read())
+            if key is not None:
+                self.cache.set(key, data, PAPER_CACHE_TTL)
+
+        return SemanticScholarPaper.from_api_response(data)
+
+    async def get_many_by_doi_async(
+        self,
+        dois: List[str],
+        fields: Optional[List[str]] = None,
+        max_concurrency: int = 10
+    ) -> List[Union[Optional[SemanticScholarPaper], BaseException]]:
+        """
+        Look up several DOIs concurrently over the shared aiohttp session.
+
+        Args:
+            dois: Paper DOIs
+            fields: Fields to retrieve (default: DEFAULT_FIELDS)
+            max_concurrency: Maximum lookups in flight at once
+
+        Returns:
+            One entry per DOI, in input order: the paper, None if not found,
+            or the exception raised for that lookup
+        """
+        return await _gather_limited(
+            (self.get_by_doi_async(doi, fields) for doi in dois), max_concurrency
+        )
+
+    async def search_many_async(
+        self,
+        queries: List[str],
+        limit: int = 10,
+        fields: Optional[List[str]] = None,
+        max_concurrency: int = 10
+    ) -> List[Union[List[SemanticScholarPaper], BaseException]]:
+        """
+        Run several searches concurrently over the shared aiohttp session.
+
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query (default: 10)
+            fields: Fields to retrieve (default: DEFAULT_FIELDS)
+            max_concurrency: Maximum searches in flight at once
+
+        Returns:
+            One entry per query, in input order: its papers, or the exception
+            raised for that search
+        """
+        return await _gather_limited(
+            (self.search_async(query, limit, fields) for query in queries), max_concurrency
+        )
+
 
 # Convenience functions
 def search_papers(query: str, limit: int = 10) -> List[Dict]:
@@ -0,0 +1,778 @@
+"""
+Shared helpers for the data fetching clients.
+
+Author: Luke Steuber
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import aiodns  # noqa: F401 - enables aiohttp.AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Transport errors raised by either kind of sync session
+HTTP_ERRORS = (requests.exceptions.RequestException,) + (
+    (httpx.HTTPError,) if HTTPX_AVAILABLE else ()
+)
+
+# dataclass(slots=True) needs Python 3.10+; on 3.9 fall back to a regular dataclass
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Decode JSON from bytes or str; orjson is several times faster on large payloads
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Encode an object to UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+_get_name = itemgetter("name")
+
+
+def dig(data: Any, *keys: Hashable) -> Any:
+    """Follow keys into nested JSON; None if any level is missing or null."""
+    try:
+        for key in keys:
+            data = data[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return data
+
+
+def names(items: Optional[Iterable[Dict[str, Any]]]) -> List[Any]:
+    """The "name" of each object in a JSON list (empty for a missing list)."""
+    if not items:
+        return []
+    try:
+        return list(map(_get_name, items))
+    except KeyError:
+        return [item.get("name") for item in items]
+
+
+def record_mapper(
+    fields: Dict[str, str],
+    defaults: Optional[Dict[str, Callable[[], Any]]] = None
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a function reshaping a JSON object into {output_key: obj[source_key]}.
+
+    Objects carrying every source key are read with a single itemgetter call;
+    others fall back to per-key lookups, where a missing key becomes
+    defaults[source_key]() (e.g. list for a fresh []) or None.
+
+    Args:
+        fields: Output key -> source key, in output order
+        defaults: Source key -> factory for its value when missing
+    """
+    out_keys = tuple(fields)
+    src_keys = tuple(fields.values())
+    factories = tuple((defaults or {}).get(key) for key in src_keys)
+    getter = itemgetter(*src_keys)
+    if len(src_keys) == 1:
+        single = getter
+        getter = lambda item: (single(item),)  # noqa: E731
+
+    def mapper(item: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return dict(zip(out_keys, getter(item)))
+        except KeyError:
+            return {
+                out: item[key] if key in item else (factory() if factory else None)
+                for out, key, factory in zip(out_keys, src_keys, factories)
+            }
+
+    return mapper
+
+
+# Every content coding urllib3 can decode here; "br"/"zstd" only when their
+# decoders are installed, so servers never send something we can't read
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+def create_http2_session(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20
+) -> 'httpx.Client':
+    """
+    Build an HTTP/2 httpx client usable in place of a requests.Session.
+
+    Requests to the same host are multiplexed over one connection. Redirects
+    are followed, as requests does by default.
+
+    Raises:
+        ImportError: If httpx (with the http2 extra) is not installed
+    """
+    if not HTTPX_AVAILABLE:
+        raise ImportError("httpx library required. Install with: pip install 'httpx[http2]'")
+    return httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+    )
+
+
+# Transient statuses that are safe to retry for idempotent requests
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    headers: Optional[Dict[str, str]] = None
+) -> requests.Session:
+    """
+    Build a requests session with connection pooling and retry on transient errors.
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept per host
+        retries: Total retries for connection errors and retryable statuses
+        backoff_factor: Exponential backoff factor between retries
+        headers: Default headers to set on the session
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+_shared_sessions: Dict[bool, Any] = {}
+_shared_sessions_lock = threading.Lock()
+
+
+def get_shared_session(http2: bool = False) -> Union[requests.Session, 'httpx.Client']:
+    """
+    Return the process-wide session shared by clients not given their own.
+
+    Built on first use; clients that share it reuse one connection pool (and
+    TLS connections) per host. Client-specific headers such as API keys must
+    be sent per request, never set on this session.
+
+    Args:
+        http2: Return the shared HTTP/2 httpx client instead of a requests.Session
+    """
+    with _shared_sessions_lock:
+        session = _shared_sessions.get(http2)
+        if session is None:
+            if http2:
+                session = create_http2_session(max_connections=200, max_keepalive_connections=50)
+            else:
+                session = create_session(
+                    pool_connections=20,
+                    pool_maxsize=50,
+                    headers={"Accept-Encoding": ACCEPT_ENCODING}
+                )
+            _shared_sessions[http2] = session
+        return session
+
+
+def run_many(tasks: Iterable[Callable[[], Any]], max_workers: int = 10) -> List[Any]:
+    """
+    Run zero-argument callables on a thread pool, returning results in input order.
+
+    Overlaps blocking calls to different APIs, e.g.
+    run_many([partial(wolfram.query, "2+2"), partial(youtube.search_videos, "jazz")]).
+    Sync clients may be shared between tasks: their sessions are safe for
+    concurrent GET requests. An exception raised by a task is re-raised.
+
+    Args:
+        tasks: Callables taking no arguments
+        max_workers: Maximum number of tasks running at once
+    """
+    tasks = list(tasks)
+    if len(tasks) <= 1:
+        return [task() for task in tasks]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+# TTL for responses that never change (e.g. data for a past date)
+FOREVER = float("inf")
+
+
+def _hexdigest(text: str) -> str:
+    """Fast non-cryptographic digest (xxh3 when available, else md5)."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(text.encode())
+    return hashlib.md5(text.encode()).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _memo_cache_key(url: str, items: tuple) -> str:
+    return _hexdigest(f"{url}|{items!r}")
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Stable cache key for a GET request, independent of param order.
+
+    Keys for hashable params are memoized, so batch calls that repeat the
+    same parameters skip re-hashing.
+    """
+    items = tuple(sorted((params or {}).items()))
+    try:
+        hash(items)
+    except TypeError:
+        # Unhashable param values (lists, dicts) - hash a JSON rendering instead
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return _hexdigest(f"{url}|{payload}")
+    return _memo_cache_key(url, items)
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Args:
+        maxsize: Maximum number of entries; least recently used are evicted
+        ttl: Seconds an entry stays valid; 0 disables caching
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key, evicting the least recently used entries.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds this entry stays valid (default: the cache's ttl;
+                 FOREVER never expires)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove the entry for key, if any."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class FileCache:
+    """
+    On-disk response cache with per-entry TTLs, for data that should
+    survive restarts.
+
+    Each entry is a gzipped JSON file named after its key. Has the same
+    get/set/delete/clear interface as TTLCache, but keys must be strings
+    (see cache_key) and values JSON-serializable.
+
+    Args:
+        directory: Cache directory (default: ~/.research_data_clients/cache)
+        ttl: Default seconds an entry stays valid; 0 disables caching
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, ttl: float = 300):
+        if directory is None:
+            directory = Path.home() / ".research_data_clients" / "cache"
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json.gz"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        path = self._path(key)
+        try:
+            entry = json_loads(gzip.decompress(path.read_bytes()))
+        except (OSError, ValueError):
+            return default
+
+        expires = entry.get("expires")
+        if expires is not None and expires <= time.time():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return default
+        return entry.get("value", default)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key; see TTLCache.set."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        expires = None if ttl == FOREVER else time.time() + ttl
+        path = self._path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(gzip.compress(json_dumps({"expires": expires, "value": value})))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError):
+            # Unwritable directory or value that can't be encoded: just don't cache
+            pass
+
+    def delete(self, key: str) -> None:
+        """Remove the entry for key, if any."""
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob("*.json.gz"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+# Either backend can be passed to a client's cache argument
+ResponseCache = Union[TTLCache, FileCache]
+
+
+def resolve_cache(cache: Optional[ResponseCache], use_cache: bool) -> Optional[ResponseCache]:
+    """Pick a client's cache: the given backend, a fresh in-memory one, or None."""
+    if not use_cache:
+        return None
+    return cache if cache is not None else TTLCache()
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter shared by sync and async callers.
+
+    Each request takes one token; tokens refill continuously at rate per
+    second up to burst. A caller that finds the bucket empty reserves the
+    next token and sleeps until it is due, so concurrent callers are spaced
+    out at the provider's rate instead of being rejected.
+
+    Args:
+        rate: Tokens added per second
+        burst: Bucket capacity (requests allowed back to back)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: Optional[int] = None) -> 'TokenBucket':
+        """Bucket allowing requests_per_minute, bursting to that many by default."""
+        return cls(requests_per_minute / 60, burst or max(1, int(requests_per_minute)))
+
+    @classmethod
+    def per_hour(cls, requests_per_hour: float, burst: Optional[int] = None) -> 'TokenBucket':
+        """Bucket allowing requests_per_hour, bursting to that many by default."""
+        return cls(requests_per_hour / 3600, burst or max(1, int(requests_per_hour)))
+
+    def _reserve(self) -> float:
+        """Take a token (possibly one not yet refilled); return the wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class CachedSessionMixin:
+    """
+    Cached JSON GETs for synchronous clients.
+
+    Expects self.session (a requests.Session, or an httpx.Client from
+    create_http2_session) and self.cache (a ResponseCache, or None to
+    disable caching). Headers in self.headers are sent with every request,
+    so the session itself can be shared between clients.
+
+    Clients whose API supports ETags set CONDITIONAL_REQUESTS; expired
+    entries are then revalidated with If-None-Match, and a 304 reuses the
+    cached body. Query params named in UNCACHED_PARAMS (API keys and other
+    credentials) are sent but left out of cache keys.
+
+    Clients that build a session of their own set _owns_session so close()
+    (or leaving a with block) releases its pooled connections; shared and
+    caller-supplied sessions are left open.
+    """
+
+    CONDITIONAL_REQUESTS = False
+    UNCACHED_PARAMS: Tuple[str, ...] = ()
+
+    session: Union[requests.Session, 'httpx.Client']
+    cache: Optional[ResponseCache]
+    headers: Optional[Dict[str, str]] = None
+    # Paces network requests (cache hits are free); None disables throttling
+    rate_limiter: Optional[TokenBucket] = None
+    _owns_session = False
+
+    def close(self) -> None:
+        """Close the client's own HTTP session and release pooled connections."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _get_cached_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: float = 0,
+        timeout: float = 30,
+        rate_limiter: Optional[TokenBucket] = None
+    ) -> Any:
+        """
+        GET a URL and decode the JSON body, serving repeats from the cache.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            ttl: Seconds to cache the response; 0 skips the cache
+            timeout: Request timeout in seconds
+            rate_limiter: Bucket for an endpoint with its own limit
+                (default: self.rate_limiter)
+
+        Raises:
+            requests.RequestException: On network or HTTP errors or a non-JSON
+                body (not cached); httpx.HTTPError when using an HTTP/2 session
+        """
+        key = None
+        if ttl and self.cache is not None:
+            key = self._cache_key(url, params)
+            data = self.cache.get(key)
+            if data is not None:
+                return data
+
+        headers = self.headers
+        validated = None
+        if key is not None and self.CONDITIONAL_REQUESTS:
+            # [etag, body] from the last full response, kept past the TTL
+            validated = self.cache.get(f"{key}:etag")
+            if validated is not None:
+                headers = {**(headers or {}), "If-None-Match": validated[0]}
+
+        rate_limiter = rate_limiter or self.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        self._after_response(response)
+        if validated is not None and response.status_code == 304:
+            data = validated[1]
+        else:
+            response.raise_for_status()
+            try:
+                data = json_loads(response.content)
+            except ValueError as e:
+                # A RequestException, as response.json() raised, so callers'
+                # HTTP_ERRORS handlers still turn a non-JSON body into an error
+                raise requests.exceptions.InvalidJSONError(
+                    f"Invalid JSON in response from {url}: {e}", response=response
+                ) from e
+            etag = response.headers.get("ETag")
+            if etag and key is not None and self.CONDITIONAL_REQUESTS:
+                self.cache.set(f"{key}:etag", [etag, data], FOREVER)
+
+        if key is not None:
+            self.cache.set(key, data, ttl)
+        return data
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """cache_key() for a request, ignoring UNCACHED_PARAMS."""
+        if params and self.UNCACHED_PARAMS:
+            params = {k: v for k, v in params.items() if k not in self.UNCACHED_PARAMS}
+        return cache_key(url, params)
+
+    def _after_response(self, response: Any) -> None:
+        """Hook for inspecting every response (e.g. rate-limit headers)."""
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        if self.cache is not None:
+            self.cache.clear()
+
+
+# Seconds aiohttp connectors keep resolved addresses
+DNS_CACHE_TTL = 3600
+
+
+def create_async_session(
+    limit: int = 200,
+    limit_per_host: int = 32,
+    timeout: float = 30,
+    headers: Optional[Dict[str, str]] = None
+) -> 'aiohttp.ClientSession':
+    """
+    Create an aiohttp session with a cached-DNS connection pool.
+
+    Must be called inside a running event loop. Pass the result as session=
+    to several async clients so they share one pool, DNS cache and TLS
+    sessions; the caller owns it and closes it when done.
+
+    Args:
+        limit: Maximum simultaneous connections overall
+        limit_per_host: Maximum simultaneous connections to any one host (0 = no limit)
+        timeout: Total request timeout in seconds
+        headers: Default headers sent with every request
+
+    Raises:
+        ImportError: If aiohttp library not available
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise ImportError("aiohttp library required. Install with: pip install aiohttp")
+    # c-ares (aiodns) resolves without tying up the default executor's threads
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+    )
+    return aiohttp.ClientSession(
+        headers=headers,
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout)
+    )
+
+
+class AsyncHTTPClient:
+    """
+    Base class for asynchronous clients.
+
+    Holds one aiohttp session per instance, created lazily because
+    ClientSession must be built inside a running event loop. Use subclasses
+    as async context managers or call close() when done.
+
+    Args:
+        headers: Default headers sent with every request
+        timeout: Total request timeout in seconds
+        concurrency: Maximum number of simultaneous connections
+        max_concurrency: Maximum in-flight requests for the *_many batch helpers
+        cache: Response cache backend, or None to disable caching
+        rate_limiter: Paces network requests, or None to disable throttling
+        session: Session shared with other clients (see create_async_session);
+            headers are then sent per request and close() leaves it open
+
+    Raises:
+        ImportError: If aiohttp library not available
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+        concurrency: int = 20,
+        max_concurrency: int = 10,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        session: Optional['aiohttp.ClientSession'] = None
+    ):
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp library required. Install with: pip install aiohttp")
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self._session: Optional['aiohttp.ClientSession'] = session
+        self._owns_session = session is None
+
+    async def _get_session(self) -> 'aiohttp.ClientSession':
+        """Create the client's own session on first use."""
+        if self._owns_session and (self._session is None or self._session.closed):
+            # Each client talks to one host, so no per-host cap beyond the total
+            self._session = create_async_session(
+                limit=self.concurrency,
+                limit_per_host=0,
+                timeout=self.timeout,
+                headers=self.headers
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session, unless it was passed in."""
+        if not self._owns_session:
+            return
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: float = 0,
+        rate_limiter: Optional[TokenBucket] = None
+    ) -> Any:
+        """
+        GET a URL and decode the JSON body, serving repeats from the cache.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            ttl: Seconds to cache the response; 0 skips the cache
+            rate_limiter: Bucket for an endpoint with its own limit
+                (default: self.rate_limiter)
+
+        Raises:
+            aiohttp.ClientError: On network or HTTP errors (not cached)
+        """
+        key = cache_key(url, params) if ttl and self.cache is not None else None
+        if key is not None:
+            data = self.cache.get(key)
+            if data is not None:
+                return data
+
+        rate_limiter = rate_limiter or self.rate_limiter
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+        session = await self._get_session()
+        headers = None if self._owns_session else self.headers
+        async with session.get(url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            data = json_loads(await response.read())
+
+        if key is not None:
+            self.cache.set(key, data, ttl)
+        return data
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    async def _gather_bounded(self, coros: Iterable[Awaitable[Any]]) -> List[Any]:
+        """
+        Await coroutines concurrently, at most max_concurrency at a time.
+
+        Results keep the input order; an exception becomes {"error": str(e)}
+        so one failure does not sink the whole batch.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        results = await asyncio.gather(*(bounded(c) for c in coros), return_exceptions=True)
+        return [
+            {"error": str(r)} if isinstance(r, Exception) else r
+            for r in results
+        ]
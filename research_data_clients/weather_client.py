@@ -12,25 +12,111 @@ No API key required for basic access.
 Author: Luke Steuber
 """
 
-import requests
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 import logging
 
+from .utils import AsyncHTTPClient, create_session, get_shared_session, json_loads
+
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 
+def _period(period: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a NOAA forecast period."""
+    return {
+        "name": period.get("name"),
+        "temperature": period.get("temperature"),
+        "temperature_unit": period.get("temperatureUnit"),
+        "wind_speed": period.get("windSpeed"),
+        "wind_direction": period.get("windDirection"),
+        "icon": period.get("icon"),
+        "short_forecast": period.get("shortForecast"),
+        "detailed_forecast": period.get("detailedForecast")
+    }
+
+
+def _periods(data: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+    return [_period(period) for period in data.get('properties', {}).get('periods', [])[:limit]]
+
+
+def _alert(feature: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a NOAA alert feature."""
+    props = feature.get('properties', {})
+    return {
+        "event": props.get("event"),
+        "headline": props.get("headline"),
+        "severity": props.get("severity"),
+        "urgency": props.get("urgency"),
+        "areas": props.get("areaDesc"),
+        "effective": props.get("effective"),
+        "expires": props.get("expires"),
+        "description": props.get("description")
+    }
+
+
+def _state_alerts(state: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    alerts = [_alert(feature) for feature in data.get('features', [])]
+    return {
+        "state": state,
+        "alerts": alerts,
+        "count": len(alerts)
+    }
+
+
 class WeatherClient:
     """Client for NOAA Weather API."""
 
     BASE_URL = "https://api.weather.gov"
 
-    def __init__(self):
-        """Initialize NOAA Weather client."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'SharedLibraryWeatherClient/1.0',
-            'Accept': 'application/geo+json'
-        })
+    HEADERS = {
+        'User-Agent': 'SharedLibraryWeatherClient/1.0',
+        'Accept': 'application/geo+json'
+    }
+
+    def __init__(self, http2: bool = False):
+        """
+        Initialize NOAA Weather client.
+
+        Args:
+            http2: Use the shared HTTP/2 httpx client instead of requests (needs httpx[http2])
+        """
+        # Sent per request so the shared HTTP/2 client needs no setup
+        self.headers = self.HEADERS
+        if http2:
+            self.session = get_shared_session(http2=True)
+        else:
+            self.session = create_session(pool_maxsize=50)
+        self._points_cache: Dict[Tuple[float, float], Dict[str, Any]] = {}
+
+    def _resolve_points(self, latitude: float, longitude: float) -> Dict[str, Any]:
+        """
+        Resolve a coordinate to its NOAA grid point metadata.
+
+        The points-to-grid mapping rarely changes, so results are memoized
+        per coordinate rounded to 3 decimals (well inside NOAA's ~2.5km grid).
+
+        Args:
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
+
+        Returns:
+            The ``properties`` object of the ``/points`` response
+        """
+        key = (round(latitude, 3), round(longitude, 3))
+        properties = self._points_cache.get(key)
+        if properties is None:
+            data = self._get_json(f"{self.BASE_URL}/points/{key[0]},{key[1]}")
+            properties = data.get('properties', {})
+            self._points_cache[key] = properties
+        return properties
+
+    def _get_json(self, url: str) -> Dict[str, Any]:
+        response = self.session.get(url, headers=self.headers, timeout=30)
+        response.raise_for_status()
+        return json_loads(response.content)
 
     def get_current_weather(self, latitude: float, longitude: float) -> Dict[str, Any]:
         """
@@ -45,33 +131,27 @@ class WeatherClient:
         """
         try:
             # First, get the forecast office and grid point
-            points_response = self.session.get(
-                f"{self.BASE_URL}/points/{latitude},{longitude}",
-                timeout=30
-            )
-            points_response.raise_for_status()
-            points_data = points_response.json()
+            points = self._resolve_points(latitude, longitude)
 
             # Get the forecast URL
-            forecast_url = points_data.get('properties', {}).get('forecast')
+            forecast_url = points.get('forecast')
             if not forecast_url:
                 return {"error": "Could not get forecast URL for location"}
 
             # Get the forecast
-            forecast_response = self.session.get(forecast_url, timeout=30)
-            forecast_response.raise_for_status()
-            forecast_data = forecast_response.json()
+            forecast_data = self._get_json(forecast_url)
 
             # Get current period (usually first period)
             periods = forecast_data.get('properties', {}).get('periods', [])
             if periods:
                 current = periods[0]
+                place = points.get('relativeLocation', {}).get('properties', {})
                 return {
                     "location": {
                         "latitude": latitude,
                         "longitude": longitude,
-                        "city": points_data.get('properties', {}).get('relativeLocation', {}).get('properties', {}).get('city'),
-                        "state": points_data.get('properties', {}).get('relativeLocation', {}).get('properties', {}).get('state')
+                        "city": place.get('city'),
+                        "state": place.get('state')
                     },
                     "current": {
                         "name": current.get("name"),
@@ -103,31 +183,13 @@ class WeatherClient:
         """
         try:
             # Get points data
-            points_response = self.session.get(
-                f"{self.BASE_URL}/points/{latitude},{longitude}",
-                timeout=30
-            )
-            points_response.raise_for_status()
-            points_data = points_response.json()
+            points = self._resolve_points(latitude, longitude)
 
             # Get forecast
-            forecast_url = points_data.get('properties', {}).get('forecast')
-            forecast_response = self.session.get(forecast_url, timeout=30)
-            forecast_response.raise_for_status()
-            forecast_data = forecast_response.json()
-
-            forecast_periods = []
-            for period in forecast_data.get('properties', {}).get('periods', [])[:periods]:
-                forecast_periods.append({
-                    "name": period.get("name"),
-                    "temperature": period.get("temperature"),
-                    "temperature_unit": period.get("temperatureUnit"),
-                    "wind_speed": period.get("windSpeed"),
-                    "wind_direction": period.get("windDirection"),
-                    "icon": period.get("icon"),
-                    "short_forecast": period.get("shortForecast"),
-                    "detailed_forecast": period.get("detailedForecast")
-                })
+            forecast_url = points.get('forecast')
+            forecast_data = self._get_json(forecast_url)
+
+            forecast_periods = _periods(forecast_data, periods)
 
             return {
                 "location": {
@@ -151,33 +213,130 @@ class WeatherClient:
             Dict with active alerts
         """
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/alerts/active/area/{state}",
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            alerts = []
-            for feature in data.get('features', []):
-                props = feature.get('properties', {})
-                alerts.append({
-                    "event": props.get("event"),
-                    "headline": props.get("headline"),
-                    "severity": props.get("severity"),
-                    "urgency": props.get("urgency"),
-                    "areas": props.get("areaDesc"),
-                    "effective": props.get("effective"),
-                    "expires": props.get("expires"),
-                    "description": props.get("description")
-                })
+            data = self._get_json(f"{self.BASE_URL}/alerts/active/area/{state}")
 
+            return _state_alerts(state, data)
+        except Exception as e:
+            logger.error(f"Weather alerts error: {e}")
+            return {"error": str(e)}
+
+    def get_full_report(
+        self,
+        latitude: float,
+        longitude: float,
+        state: str,
+        periods: int = 7,
+        hourly_periods: int = 24
+    ) -> Dict[str, Any]:
+        """
+        Get forecast, hourly forecast and state alerts in one call.
+
+        The three follow-up requests are independent once the grid point is
+        known, so they run concurrently over the session's connection pool.
+
+        Args:
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
+            state: State code for alerts (e.g., CA, NY)
+            periods: Number of forecast periods
+            hourly_periods: Number of hourly forecast periods
+
+        Returns:
+            Dict with location, current conditions, forecast, hourly and alerts
+        """
+        try:
+            points = self._resolve_points(latitude, longitude)
+            forecast_url = points.get('forecast')
+            hourly_url = points.get('forecastHourly')
+            if not forecast_url or not hourly_url:
+                return {"error": "Could not get forecast URL for location"}
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                forecast = executor.submit(self._get_json, forecast_url)
+                hourly = executor.submit(self._get_json, hourly_url)
+                alerts = executor.submit(
+                    self._get_json, f"{self.BASE_URL}/alerts/active/area/{state}"
+                )
+                forecast_data = forecast.result()
+                hourly_data = hourly.result()
+                alerts_data = alerts.result()
+
+            forecast_periods = _periods(forecast_data, periods)
+            alert_list = [_alert(feature) for feature in alerts_data.get('features', [])]
+            place = points.get('relativeLocation', {}).get('properties', {})
             return {
-                "state": state,
-                "alerts": alerts,
-                "count": len(alerts)
+                "location": {
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "city": place.get('city'),
+                    "state": place.get('state')
+                },
+                "current": forecast_periods[0] if forecast_periods else None,
+                "forecast": forecast_periods,
+                "hourly": _periods(hourly_data, hourly_periods),
+                "alerts": alert_list,
+                "alert_count": len(alert_list)
             }
+        except Exception as e:
+            logger.error(f"Weather report error: {e}")
+            return {"error": str(e)}
+
+
+class AsyncWeatherClient(AsyncHTTPClient):
+    """
+    Asynchronous client for NOAA weather alerts.
+
+    Fans alert lookups for many states out over one aiohttp session.
+
+    Example:
+        >>> async with AsyncWeatherClient() as client:  # doctest: +SKIP
+        ...     reports = await client.get_alerts_many(["CA", "NY", "TX"])
+    """
+
+    BASE_URL = WeatherClient.BASE_URL
+
+    def __init__(
+        self,
+        concurrency: int = 20,
+        max_concurrency: int = 10,
+        session: Optional['aiohttp.ClientSession'] = None
+    ):
+        """
+        Initialize async NOAA Weather client.
+
+        Args:
+            concurrency: Maximum number of simultaneous connections
+            max_concurrency: Maximum in-flight requests for batch helpers
+            session: aiohttp session shared with other clients (see
+                     utils.create_async_session); left open by close()
+
+        Raises:
+            ImportError: If aiohttp library not available
+        """
+        super().__init__(
+            headers=WeatherClient.HEADERS,
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+            session=session
+        )
+
+    async def get_alerts(self, state: str) -> Dict[str, Any]:
+        """Async version of WeatherClient.get_alerts."""
+        try:
+            data = await self._get_json(f"{self.BASE_URL}/alerts/active/area/{state}")
+            return _state_alerts(state, data)
         except Exception as e:
             logger.error(f"Weather alerts error: {e}")
             return {"error": str(e)}
 
+    async def get_alerts_many(self, states: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get active alerts for several states concurrently.
+
+        Args:
+            states: State codes (e.g., ["CA", "NY"])
+
+        Returns:
+            One get_alerts result per state, in input order
+        """
+        return await self._gather_bounded(self.get_alerts(state) for state in states)
@@ -11,30 +11,120 @@ Author: Luke Steuber
 """
 
 import requests
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 import logging
 
+from .utils import (
+    CachedSessionMixin,
+    ResponseCache,
+    create_session,
+    get_shared_session,
+    json_loads,
+    resolve_cache,
+)
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Article summaries and extracts; expired entries are revalidated by ETag
+ARTICLE_CACHE_TTL = 3600
+
 
-class WikipediaClient:
+class WikipediaClient(CachedSessionMixin):
     """Client for Wikipedia API."""
 
+    CONDITIONAL_REQUESTS = True
+
     BASE_URL = "https://en.wikipedia.org/w/api.php"
 
-    def __init__(self, language: str = "en"):
+    # Fixed query params per method; calls only add the varying keys
+    _SEARCH_PARAMS = {'action': 'opensearch', 'format': 'json'}
+    _SUMMARY_PARAMS = {
+        'action': 'query',
+        'prop': 'extracts|pageimages',
+        'exintro': True,
+        'explaintext': True,
+        'format': 'json',
+        'piprop': 'original'
+    }
+    _CONTENT_PARAMS = {
+        'action': 'query',
+        'prop': 'extracts',
+        'explaintext': True,
+        'exlimit': 1,
+        'redirects': 1,
+        'format': 'json'
+    }
+    _RANDOM_PARAMS = {
+        'action': 'query',
+        'list': 'random',
+        'rnnamespace': 0,  # Main articles only
+        'format': 'json'
+    }
+
+    HEADERS = {'User-Agent': 'SharedLibraryWikipediaClient/1.0'}
+
+    def __init__(
+        self,
+        language: str = "en",
+        http2: bool = False,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True
+    ):
         """
         Initialize Wikipedia client.
 
         Args:
             language: Wikipedia language code (en, es, fr, etc.)
+            http2: Use the shared HTTP/2 httpx client instead of requests (needs httpx[http2])
+            cache: Cache for article lookups (default: in-memory TTLCache)
+            use_cache: Whether to cache article lookups
         """
         self.language = language
         self.base_url = f"https://{language}.wikipedia.org/w/api.php"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'SharedLibraryWikipediaClient/1.0'
-        })
+        # Sent per request so the shared HTTP/2 client needs no setup
+        self.headers = self.HEADERS
+        self._owns_session = not http2
+        if http2:
+            self.session = get_shared_session(http2=True)
+        else:
+            self.session = create_session(pool_maxsize=50)
+        self.cache = resolve_cache(cache, use_cache)
+
+    def _get_page(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run a titles query and return the first page object.
+
+        With caching on, responses are kept for ARTICLE_CACHE_TTL and then
+        revalidated with If-None-Match, so unchanged articles come back as a
+        bodiless 304. With caching off, ijson installed and a requests
+        session, the body is instead parsed as it downloads and reading stops
+        after the first page, so long extracts are never held twice (once as
+        raw bytes, once decoded).
+        """
+        if self.cache is None and IJSON_AVAILABLE and isinstance(self.session, requests.Session):
+            response = self.session.get(
+                self.base_url,
+                params=params,
+                headers=self.headers,
+                timeout=30,
+                stream=True
+            )
+            with response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                for _, page in ijson.kvitems(response.raw, 'query.pages'):
+                    return page
+                return None
+
+        data = self._get_cached_json(self.base_url, params=params, ttl=ARTICLE_CACHE_TTL)
+        pages = data.get('query', {}).get('pages', {})
+        return next(iter(pages.values()), None)
 
     def search(self, query: str, limit: int = 10) -> Dict[str, Any]:
         """
@@ -50,16 +140,12 @@ class WikipediaClient:
         try:
             response = self.session.get(
                 self.base_url,
-                params={
-                    'action': 'opensearch',
-                    'search': query,
-                    'limit': limit,
-                    'format': 'json'
-                },
+                params={**self._SEARCH_PARAMS, 'search': query, 'limit': limit},
+                headers=self.headers,
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             # OpenSearch returns [query, titles, descriptions, urls]
             if len(data) >= 4:
@@ -93,26 +179,8 @@ class WikipediaClient:
             Dict with summary and metadata
         """
         try:
-            response = self.session.get(
-                self.base_url,
-                params={
-                    'action': 'query',
-                    'prop': 'extracts|pageimages',
-                    'exintro': True,
-                    'explaintext': True,
-                    'titles': title,
-                    'format': 'json',
-                    'piprop': 'original'
-                },
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            pages = data.get('query', {}).get('pages', {})
-            if pages:
-                page = list(pages.values())[0]
-
+            page = self._get_page({**self._SUMMARY_PARAMS, 'titles': title})
+            if page:
                 return {
                     "title": page.get("title"),
                     "summary": page.get("extract"),
@@ -126,40 +194,30 @@ class WikipediaClient:
             logger.error(f"Wikipedia summary error: {e}")
             return {"error": str(e)}
 
-    def get_full_content(self, title: str) -> Dict[str, Any]:
+    def get_full_content(self, title: str, max_chars: Optional[int] = None) -> Dict[str, Any]:
         """
         Get full article content.
 
         Args:
             title: Article title
+            max_chars: Truncate the extract server-side to roughly this many
+                characters (long articles run to hundreds of KB otherwise)
 
         Returns:
             Dict with full content
         """
-        try:
-            response = self.session.get(
-                self.base_url,
-                params={
-                    'action': 'query',
-                    'prop': 'extracts',
-                    'explaintext': True,
-                    'titles': title,
-                    'format': 'json'
-                },
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            pages = data.get('query', {}).get('pages', {})
-            if pages:
-                page = list(pages.values())[0]
+        params = {**self._CONTENT_PARAMS, 'titles': title}
+        if max_chars:
+            params['exchars'] = max_chars
 
+        try:
+            page = self._get_page(params)
+            if page:
                 return {
                     "title": page.get("title"),
                     "content": page.get("extract"),
                     "page_id": page.get("pageid"),
-                    "word_count": len(page.get("extract", "").split()),
+                    "word_count": len((page.get("extract") or "").split()),
                     "url": f"https://{self.language}.wikipedia.org/wiki/{title.replace(' ', '_')}"
                 }
 
@@ -181,17 +239,12 @@ class WikipediaClient:
         try:
             response = self.session.get(
                 self.base_url,
-                params={
-                    'action': 'query',
-                    'list': 'random',
-                    'rnnamespace': 0,  # Main articles only
-                    'rnlimit': limit,
-                    'format': 'json'
-                },
+                params={**self._RANDOM_PARAMS, 'rnlimit': limit},
+                headers=self.headers,
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             articles = []
             for item in data.get('query', {}).get('random', []):
@@ -7,11 +7,34 @@ Author: Luke Steuber
 
 import os
 import logging
+import re
 import urllib.parse
 import requests
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Set, Tuple
 from dataclasses import dataclass
 
+from .utils import (
+    ACCEPT_ENCODING,
+    DATACLASS_SLOTS,
+    AsyncHTTPClient,
+    HTTP_ERRORS,
+    CachedSessionMixin,
+    ResponseCache,
+    create_session,
+    get_shared_session,
+    json_loads,
+    resolve_cache,
+)
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 # API URLs
@@ -20,8 +43,34 @@ WOLFRAM_SHORT_URL = "http://api.wolframalpha.com/v1/result"
 WOLFRAM_FULL_URL = "http://api.wolframalpha.com/v2/query"
 WOLFRAM_SPOKEN_URL = "http://api.wolframalpha.com/v1/spoken"
 
+# Fixed query params per endpoint; calls add the input and appid
+_SHORT_PARAMS = {"format": "plaintext"}
+_FULL_PARAMS = {"output": "json", "format": "plaintext"}
+
+# Queries needing no percent-encoding beyond spaces (the common image-link case)
+_PLAIN_QUERY = re.compile(r"[A-Za-z0-9 ]+")
+
+# Case, whitespace runs and spaces around operators, ignored by normalized cache keys
+_SPACES = re.compile(r"\s+")
+_SPACED_OPERATOR = re.compile(r"\s*([-+*/^=<>(),])\s*")
+
+# Successful answers are reused for this long; some (times, prices) drift
+RESULT_CACHE_TTL = 3600
+# 501 "not understood" answers are reused briefly so retried bad queries stay local
+NOT_UNDERSTOOD_CACHE_TTL = 300
 
-@dataclass
+# Queries longer than this are failed locally instead of being sent
+MAX_QUERY_LENGTH = 2000
+_CONTROL_ONLY = re.compile(r"[\x00-\x1f\x7f]*")
+
+# Errors a full query turns into a failed result: transport errors, or a
+# body that is not valid JSON (ijson's errors are not ValueErrors)
+_FULL_QUERY_ERRORS = HTTP_ERRORS + (ValueError,) + (
+    (ijson.JSONError,) if IJSON_AVAILABLE else ()
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class WolframResult:
     """Result from Wolfram Alpha query"""
     success: bool
@@ -43,23 +92,162 @@ class WolframResult:
         }
 
 
-class WolframAlphaClient:
+def _normalize_query(query: str) -> str:
+    """Casefold a query and drop spacing differences, e.g. "2 + 2" -> "2+2"."""
+    return _SPACED_OPERATOR.sub(r"\1", _SPACES.sub(" ", query.strip().casefold()))
+
+
+def _not_understood(query: str) -> WolframResult:
+    """Result for a 501 from the short/spoken endpoints (input not understood)."""
+    return WolframResult(
+        success=False,
+        query=query,
+        error="Wolfram Alpha couldn't understand the query"
+    )
+
+
+def _query_error(query: str) -> Optional[str]:
+    """Why a query can't be answered, or None if it is worth sending."""
+    stripped = query.strip()
+    if not stripped:
+        return "Query is empty"
+    if len(query) > MAX_QUERY_LENGTH:
+        return f"Query exceeds {MAX_QUERY_LENGTH} characters"
+    if _CONTROL_ONLY.fullmatch(stripped):
+        return "Query contains only control characters"
+    return None
+
+
+def _stream_query_result(stream: Any) -> Dict[str, Any]:
+    """
+    Read a full-query body with ijson, keeping only what _full_result uses.
+
+    The raw body is never held whole, and the other queryresult members
+    (timings, assumptions, sources) are dropped as soon as they are parsed.
+    """
+    query_result = {
+        key: value
+        for key, value in ijson.kvitems(stream, "queryresult", use_float=True)
+        if key in ("success", "error", "pods")
+    }
+    return {"queryresult": query_result}
+
+
+def _full_result(query: str, data: Dict[str, Any]) -> WolframResult:
+    """Build a WolframResult from a full (v2/query) JSON response."""
+    query_result = data.get("queryresult", {})
+
+    if not query_result.get("success"):
+        return WolframResult(
+            success=False,
+            query=query,
+            # "error" is false (not an object) when the input simply had no results
+            error=(query_result.get("error") or {}).get("msg", "Query failed")
+        )
+
+    pods = [
+        {
+            "title": pod.get("title"),
+            "id": pod.get("id"),
+            "position": pod.get("position"),
+            "subpods": [
+                {"title": subpod.get("title", ""), "plaintext": subpod.get("plaintext", "")}
+                for subpod in pod.get("subpods", ())
+            ]
+        }
+        for pod in query_result.get("pods", ())
+    ]
+
+    # Primary result: first subpod of the "Result" pod, if there is one
+    primary_result = next(
+        (
+            pod["subpods"][0].get("plaintext")
+            for pod in pods
+            if (pod["id"] == "Result" or pod["title"] == "Result") and pod["subpods"]
+        ),
+        None
+    )
+
+    return WolframResult(
+        success=True,
+        query=query,
+        result=primary_result,
+        result_type="full",
+        pods=pods
+    )
+
+
+class WolframAlphaClient(CachedSessionMixin):
     """Client for interacting with Wolfram Alpha API"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    UNCACHED_PARAMS = ("appid",)
+    HEADERS = {
+        'User-Agent': 'SharedLibraryWolframClient/1.0',
+        'Accept-Encoding': ACCEPT_ENCODING
+    }
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        normalize_queries: bool = False,
+        http2: bool = False,
+        input_validation: bool = True
+    ):
         """
         Initialize Wolfram Alpha client.
 
         Args:
             api_key: Wolfram Alpha App ID. If not provided, uses
                      WOLFRAMALPHA_APP_ID environment variable.
+            cache: Cache for successful results (default: in-memory TTLCache)
+            use_cache: Whether to cache results
+            normalize_queries: Let queries differing only in case or spacing
+                ("2 + 2", "2+2") share a cache entry
+            http2: Use the shared HTTP/2 httpx client instead of requests (needs httpx[http2]),
+                multiplexing concurrent short/spoken queries over one connection
+            input_validation: Fail empty, over-long or control-character-only
+                queries without a request (saving a round trip and quota)
         """
         self.api_key = api_key or os.environ.get('WOLFRAMALPHA_APP_ID', '')
-        self.session = requests.Session()
+        self.normalize_queries = normalize_queries
+        self.input_validation = input_validation
+        # Sent per request so the shared HTTP/2 client needs no setup
+        self.headers = self.HEADERS
+        self._owns_session = not http2
+        if http2:
+            self.session = get_shared_session(http2=True)
+        else:
+            self.session = create_session(
+                pool_connections=20,
+                pool_maxsize=50,
+                backoff_factor=0.25
+            )
+        self.cache = resolve_cache(cache, use_cache)
+        # Keys of cached 501 results, for clear_negative_cache()
+        self._negative_keys: Set[str] = set()
 
         if not self.api_key:
             logger.warning("No Wolfram Alpha API key provided")
 
+    def preconnect(self) -> bool:
+        """
+        Open a pooled connection to Wolfram Alpha ahead of a burst of queries.
+
+        The first query then reuses it instead of paying for connection
+        setup. Failures are ignored; queries connect as usual.
+
+        Returns:
+            True if the connection was established
+        """
+        try:
+            self.session.head(WOLFRAM_SHORT_URL, headers=self.headers, timeout=5)
+            return True
+        except HTTP_ERRORS as e:
+            logger.debug("Wolfram Alpha preconnect failed: %s", e)
+            return False
+
     def _check_api_key(self) -> None:
         """Raise error if no API key"""
         if not self.api_key:
@@ -68,6 +256,62 @@ class WolframAlphaClient:
                 "Set WOLFRAMALPHA_APP_ID environment variable or pass api_key parameter."
             )
 
+    def _rejected(self, query: str) -> Optional[WolframResult]:
+        """Failed result for a query not worth sending, when validation is on."""
+        if not self.input_validation:
+            return None
+        error = _query_error(query)
+        if error is None:
+            return None
+        logger.debug("Wolfram Alpha query rejected: %s", error)
+        return WolframResult(success=False, query=query, error=error)
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """cache_key() for a request, ignoring the appid (and, optionally, input spacing)."""
+        if self.normalize_queries and params:
+            params = {
+                name: _normalize_query(value) if name in ("i", "input") else value
+                for name, value in params.items()
+            }
+        return super()._cache_key(url, params)
+
+    def _cached_result(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        query: str
+    ) -> Tuple[Optional[str], Optional[WolframResult]]:
+        """Cache key for a request (None when caching is off) and any cached result."""
+        if self.cache is None:
+            return None, None
+        key = self._cache_key(url, params)
+        cached = self.cache.get(key)
+        if cached is None:
+            return key, None
+        # A fresh WolframResult per hit, echoing this caller's own phrasing
+        return key, WolframResult(**{**cached, "query": query})
+
+    def _cache_result(self, key: Optional[str], result: WolframResult) -> WolframResult:
+        """Store a successful result under key; errors other than 501s are never cached."""
+        if key is not None and result.success:
+            self.cache.set(key, result.to_dict(), RESULT_CACHE_TTL)
+        return result
+
+    def _cache_not_understood(self, key: Optional[str], query: str) -> WolframResult:
+        """Failed result for a 501, cached for NOT_UNDERSTOOD_CACHE_TTL under key."""
+        result = _not_understood(query)
+        if key is not None:
+            self.cache.set(key, result.to_dict(), NOT_UNDERSTOOD_CACHE_TTL)
+            self._negative_keys.add(key)
+        return result
+
+    def clear_negative_cache(self) -> None:
+        """Drop cached "not understood" results, keeping cached answers."""
+        keys, self._negative_keys = self._negative_keys, set()
+        if self.cache is not None:
+            for key in keys:
+                self.cache.delete(key)
+
     def query(self, query: str, timeout: int = 30) -> WolframResult:
         """
         Query Wolfram Alpha and get a short text answer.
@@ -81,39 +325,39 @@ class WolframAlphaClient:
         """
         self._check_api_key()
 
-        try:
-            logger.info(f"Wolfram Alpha query: {query}")
+        rejected = self._rejected(query)
+        if rejected is not None:
+            return rejected
 
-            params = {
-                "i": query,
-                "appid": self.api_key,
-                "format": "plaintext"
-            }
+        params = {**_SHORT_PARAMS, "i": query, "appid": self.api_key}
+        key, cached = self._cached_result(WOLFRAM_SHORT_URL, params, query)
+        if cached is not None:
+            return cached
+
+        try:
+            logger.info("Wolfram Alpha query: %s", query)
 
             response = self.session.get(
                 WOLFRAM_SHORT_URL,
                 params=params,
+                headers=self.headers,
                 timeout=timeout
             )
 
             if response.status_code == 501:
-                return WolframResult(
-                    success=False,
-                    query=query,
-                    error="Wolfram Alpha couldn't understand the query"
-                )
+                return self._cache_not_understood(key, query)
 
             response.raise_for_status()
 
-            return WolframResult(
+            return self._cache_result(key, WolframResult(
                 success=True,
                 query=query,
                 result=response.text,
                 result_type="text"
-            )
+            ))
 
-        except requests.RequestException as e:
-            logger.error(f"Wolfram Alpha query error: {e}")
+        except HTTP_ERRORS as e:
+            logger.error("Wolfram Alpha query error: %s", e)
             return WolframResult(
                 success=False,
                 query=query,
@@ -133,30 +377,39 @@ class WolframAlphaClient:
         """
         self._check_api_key()
 
-        try:
-            logger.info(f"Wolfram Alpha spoken query: {query}")
+        rejected = self._rejected(query)
+        if rejected is not None:
+            return rejected
 
-            params = {
-                "i": query,
-                "appid": self.api_key
-            }
+        params = {"i": query, "appid": self.api_key}
+        key, cached = self._cached_result(WOLFRAM_SPOKEN_URL, params, query)
+        if cached is not None:
+            return cached
+
+        try:
+            logger.info("Wolfram Alpha spoken query: %s", query)
 
             response = self.session.get(
                 WOLFRAM_SPOKEN_URL,
                 params=params,
+                headers=self.headers,
                 timeout=timeout
             )
+
+            if response.status_code == 501:
+                return self._cache_not_understood(key, query)
+
             response.raise_for_status()
 
-            return WolframResult(
+            return self._cache_result(key, WolframResult(
                 success=True,
                 query=query,
                 result=response.text,
                 result_type="spoken"
-            )
+            ))
 
-        except requests.RequestException as e:
-            logger.error(f"Wolfram Alpha spoken query error: {e}")
+        except HTTP_ERRORS as e:
+            logger.error("Wolfram Alpha spoken query error: %s", e)
             return WolframResult(
                 success=False,
                 query=query,
@@ -175,8 +428,13 @@ class WolframAlphaClient:
         """
         self._check_api_key()
 
-        params = {"i": query, "appid": self.api_key}
-        image_url = f"{WOLFRAM_SIMPLE_URL}?{urllib.parse.urlencode(params)}"
+        if _PLAIN_QUERY.fullmatch(query):
+            # Same URL urlencode would build, without the generic encoding pass
+            appid = urllib.parse.quote_plus(self.api_key)
+            image_url = f"{WOLFRAM_SIMPLE_URL}?i={query.replace(' ', '+')}&appid={appid}"
+        else:
+            params = {"i": query, "appid": self.api_key}
+            image_url = f"{WOLFRAM_SIMPLE_URL}?{urllib.parse.urlencode(params)}"
 
         return WolframResult(
             success=True,
@@ -198,69 +456,44 @@ class WolframAlphaClient:
         """
         self._check_api_key()
 
-        try:
-            logger.info(f"Wolfram Alpha full query: {query}")
+        rejected = self._rejected(query)
+        if rejected is not None:
+            return rejected
 
-            params = {
-                "input": query,
-                "appid": self.api_key,
-                "output": "json",
-                "format": "plaintext"
-            }
+        params = {**_FULL_PARAMS, "input": query, "appid": self.api_key}
+        key, cached = self._cached_result(WOLFRAM_FULL_URL, params, query)
+        if cached is not None:
+            return cached
 
-            response = self.session.get(
-                WOLFRAM_FULL_URL,
-                params=params,
-                timeout=timeout
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            query_result = data.get("queryresult", {})
-
-            if not query_result.get("success"):
-                return WolframResult(
-                    success=False,
-                    query=query,
-                    error=query_result.get("error", {}).get("msg", "Query failed")
+        try:
+            logger.info("Wolfram Alpha full query: %s", query)
+
+            if IJSON_AVAILABLE and isinstance(self.session, requests.Session):
+                response = self.session.get(
+                    WOLFRAM_FULL_URL,
+                    params=params,
+                    headers=self.headers,
+                    timeout=timeout,
+                    stream=True
                 )
+                with response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    data = _stream_query_result(response.raw)
+            else:
+                response = self.session.get(
+                    WOLFRAM_FULL_URL,
+                    params=params,
+                    headers=self.headers,
+                    timeout=timeout
+                )
+                response.raise_for_status()
+                data = json_loads(response.content)
 
-            # Extract pods
-            pods = []
-            for pod in query_result.get("pods", []):
-                pod_data = {
-                    "title": pod.get("title"),
-                    "id": pod.get("id"),
-                    "position": pod.get("position"),
-                    "subpods": []
-                }
-
-                for subpod in pod.get("subpods", []):
-                    pod_data["subpods"].append({
-                        "title": subpod.get("title", ""),
-                        "plaintext": subpod.get("plaintext", "")
-                    })
-
-                pods.append(pod_data)
-
-            # Get primary result
-            primary_result = None
-            for pod in pods:
-                if pod["id"] == "Result" or pod["title"] == "Result":
-                    if pod["subpods"]:
-                        primary_result = pod["subpods"][0].get("plaintext")
-                    break
-
-            return WolframResult(
-                success=True,
-                query=query,
-                result=primary_result,
-                result_type="full",
-                pods=pods
-            )
+            return self._cache_result(key, _full_result(query, data))
 
-        except requests.RequestException as e:
-            logger.error(f"Wolfram Alpha full query error: {e}")
+        except _FULL_QUERY_ERRORS as e:
+            logger.error("Wolfram Alpha full query error: %s", e)
             return WolframResult(
                 success=False,
                 query=query,
@@ -308,6 +541,124 @@ class WolframAlphaClient:
         return self.query(query)
 
 
+class AsyncWolframAlphaClient(AsyncHTTPClient):
+    """
+    Asynchronous client for Wolfram Alpha.
+
+    Same query methods as WolframAlphaClient, as coroutines sharing one
+    aiohttp session, plus query_many to run several questions concurrently.
+
+    Example:
+        >>> async with AsyncWolframAlphaClient() as client:  # doctest: +SKIP
+        ...     results = await client.query_many(["2+2", "speed of light"])
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        concurrency: int = 20,
+        max_concurrency: int = 10,
+        session: Optional['aiohttp.ClientSession'] = None
+    ):
+        """
+        Initialize async Wolfram Alpha client.
+
+        Args:
+            api_key: Wolfram Alpha App ID. If not provided, uses
+                     WOLFRAMALPHA_APP_ID environment variable.
+            concurrency: Maximum number of simultaneous connections
+            max_concurrency: Maximum in-flight requests for query_many
+            session: aiohttp session shared with other clients (see
+                     utils.create_async_session); left open by close()
+
+        Raises:
+            ImportError: If aiohttp library not available
+        """
+        super().__init__(
+            concurrency=concurrency,
+            max_concurrency=max_concurrency,
+            session=session
+        )
+        self.api_key = api_key or os.environ.get('WOLFRAMALPHA_APP_ID', '')
+
+        if not self.api_key:
+            logger.warning("No Wolfram Alpha API key provided")
+
+    def _check_api_key(self) -> None:
+        """Raise error if no API key"""
+        if not self.api_key:
+            raise ValueError(
+                "Wolfram Alpha API key required. "
+                "Set WOLFRAMALPHA_APP_ID environment variable or pass api_key parameter."
+            )
+
+    async def _get_text(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        query: str,
+        result_type: str
+    ) -> WolframResult:
+        """GET a plain-text endpoint (short or spoken answer)."""
+        session = await self._get_session()
+        headers = None if self._owns_session else self.headers
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status == 501:
+                return _not_understood(query)
+            response.raise_for_status()
+            text = await response.text()
+        return WolframResult(success=True, query=query, result=text, result_type=result_type)
+
+    async def query(self, query: str) -> WolframResult:
+        """Async version of WolframAlphaClient.query."""
+        self._check_api_key()
+        try:
+            logger.info("Wolfram Alpha query (async): %s", query)
+            params = {**_SHORT_PARAMS, "i": query, "appid": self.api_key}
+            return await self._get_text(WOLFRAM_SHORT_URL, params, query, "text")
+        except Exception as e:
+            logger.error("Wolfram Alpha query error: %s", e)
+            return WolframResult(success=False, query=query, error=str(e))
+
+    async def query_spoken(self, query: str) -> WolframResult:
+        """Async version of WolframAlphaClient.query_spoken."""
+        self._check_api_key()
+        try:
+            logger.info("Wolfram Alpha spoken query (async): %s", query)
+            params = {"i": query, "appid": self.api_key}
+            return await self._get_text(WOLFRAM_SPOKEN_URL, params, query, "spoken")
+        except Exception as e:
+            logger.error("Wolfram Alpha spoken query error: %s", e)
+            return WolframResult(success=False, query=query, error=str(e))
+
+    async def query_full(self, query: str) -> WolframResult:
+        """Async version of WolframAlphaClient.query_full."""
+        self._check_api_key()
+        try:
+            logger.info("Wolfram Alpha full query (async): %s", query)
+            data = await self._get_json(
+                WOLFRAM_FULL_URL,
+                params={**_FULL_PARAMS, "input": query, "appid": self.api_key}
+            )
+            return _full_result(query, data)
+        except Exception as e:
+            logger.error("Wolfram Alpha full query error: %s", e)
+            return WolframResult(success=False, query=query, error=str(e))
+
+    async def query_many(self, queries: List[str]) -> List[WolframResult]:
+        """
+        Run several short-answer queries concurrently.
+
+        Args:
+            queries: Questions or problems to solve
+
+        Returns:
+            One WolframResult per query, in input order
+        """
+        self._check_api_key()
+        return await self._gather_bounded(self.query(query) for query in queries)
+
+
 # Convenience functions
 def wolfram_query(query: str, api_key: Optional[str] = None) -> str:
     """
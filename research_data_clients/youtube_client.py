@@ -11,21 +11,144 @@ The client focuses on JSON-friendly responses suitable for downstream tools.
 
 from __future__ import annotations
 
+import logging
 import os
-from typing import Any, Dict, List, Optional
-
-import requests
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+from .utils import (
+    ACCEPT_ENCODING,
+    HTTP_ERRORS,
+    create_session,
+    get_shared_session,
+    json_loads,
+    record_mapper,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fixed query params per endpoint; calls add the varying keys. The fields
+# masks have the API drop everything the shaping helpers below don't read.
+SEARCH_FIELDS = (
+    "items(id/videoId,snippet(title,description,channelTitle,channelId,publishTime,thumbnails)),"
+    "nextPageToken"
+)
+SEARCH_PARAMS = {"part": "snippet", "type": "video", "fields": SEARCH_FIELDS}
+CHANNEL_PARTS = "snippet,statistics,brandingSettings"
+CHANNEL_FIELDS = (
+    "items(id,snippet(title,description,publishedAt,customUrl,thumbnails,country),"
+    "statistics(viewCount,subscriberCount,hiddenSubscriberCount,videoCount),"
+    "brandingSettings/channel/keywords)"
+)
+PLAYLIST_PARTS = "snippet,contentDetails"
+PLAYLIST_FIELDS = (
+    "items(contentDetails/videoId,snippet(title,description,publishedAt,position,thumbnails)),"
+    "nextPageToken"
+)
+# Channel and playlist IDs; anything else is failed without a request
+_VALID_ID = re.compile(r"[A-Za-z0-9_-]{5,64}")
+# The channels endpoint accepts up to 50 comma-separated IDs per call
+CHANNEL_BATCH_SIZE = 50
+CHANNEL_BATCH_WORKERS = 8
+
+
+_video_snippet = record_mapper(
+    {
+        "title": "title",
+        "description": "description",
+        "channel_title": "channelTitle",
+        "channel_id": "channelId",
+        "publish_time": "publishTime",
+        "thumbnails": "thumbnails",
+    },
+    defaults={"thumbnails": dict},
+)
+
+_playlist_snippet = record_mapper(
+    {
+        "title": "title",
+        "description": "description",
+        "published_at": "publishedAt",
+        "position": "position",
+        "thumbnails": "thumbnails",
+    },
+    defaults={"thumbnails": dict},
+)
+
+
+def _video(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a search result."""
+    return {
+        "video_id": item.get("id", {}).get("videoId"),
+        **_video_snippet(item.get("snippet", {})),
+    }
+
+
+def _playlist_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a playlistItems resource."""
+    return {
+        "video_id": item.get("contentDetails", {}).get("videoId"),
+        **_playlist_snippet(item.get("snippet", {})),
+    }
+
+
+def _channel(channel_id: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a channels resource."""
+    snippet = item.get("snippet", {})
+    statistics = item.get("statistics", {})
+    branding = item.get("brandingSettings", {}).get("channel", {})
+
+    return {
+        "channel_id": channel_id,
+        "title": snippet.get("title"),
+        "description": snippet.get("description"),
+        "published_at": snippet.get("publishedAt"),
+        "custom_url": snippet.get("customUrl"),
+        "thumbnails": snippet.get("thumbnails", {}),
+        "country": snippet.get("country"),
+        "view_count": int(statistics.get("viewCount", 0)),
+        "subscriber_count": int(statistics.get("subscriberCount", 0))
+        if statistics.get("hiddenSubscriberCount") is not True
+        else None,
+        "video_count": int(statistics.get("videoCount", 0)),
+        "keywords": branding.get("keywords"),
+    }
+
+
+def _channel_results(data: Dict[str, Any], channel_ids: List[str]) -> List[Dict[str, Any]]:
+    """One shaped channel (or not-found error) per requested ID."""
+    items = {item.get("id"): item for item in data.get("items", [])}
+    return [
+        _channel(channel_id, items[channel_id])
+        if channel_id in items
+        else _missing_channel(channel_id)
+        for channel_id in channel_ids
+    ]
+
+
+def _missing_channel(channel_id: str) -> Dict[str, Any]:
+    """Error entry for a channel ID that is malformed or was not found."""
+    if not _VALID_ID.fullmatch(channel_id):
+        return {"error": f"Invalid channel ID: {channel_id!r}"}
+    return {"error": f"Channel {channel_id} not found"}
 
 
 class YouTubeClient:
     """Client for interacting with the YouTube Data API v3."""
 
     BASE_URL = "https://www.googleapis.com/youtube/v3"
+    HEADERS = {
+        "User-Agent": "SharedLibraryYouTubeClient/1.0",
+        # Advertises br (with brotli installed) as well as gzip/deflate
+        "Accept-Encoding": ACCEPT_ENCODING,
+    }
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         timeout: int = 30,
+        http2: bool = False,
     ) -> None:
         """
         Initialize YouTube client.
@@ -33,6 +156,9 @@ class YouTubeClient:
         Args:
             api_key: YouTube Data API key. Falls back to YOUTUBE_API_KEY env var.
             timeout: HTTP request timeout in seconds.
+            http2: Use the shared HTTP/2 httpx client instead of requests
+                (needs httpx[http2]); concurrent channel batches then share
+                one multiplexed connection.
 
         Raises:
             RuntimeError: If the API key is missing.
@@ -45,18 +171,50 @@ class YouTubeClient:
             )
 
         self.timeout = timeout
-        self.session = requests.Session()
+        # Sent per request so the shared HTTP/2 client needs no setup
+        self.headers = self.HEADERS
+        if http2:
+            self.session = get_shared_session(http2=True)
+        else:
+            self.session = create_session(
+                pool_connections=20,
+                pool_maxsize=50,
+                backoff_factor=0.25,
+            )
+
+    def preconnect(self) -> bool:
+        """
+        Open a pooled connection to the API ahead of a burst of requests.
+
+        The first request then reuses it instead of paying for the TCP and
+        TLS handshakes. Failures are ignored; requests connect as usual.
+
+        Returns:
+            True if the connection was established.
+        """
+        try:
+            self.session.head(self.BASE_URL, headers=self.headers, timeout=5)
+            return True
+        except HTTP_ERRORS as e:
+            logger.debug(f"YouTube preconnect failed: {e}")
+            return False
 
     def _request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Internal helper to perform a GET request against the API."""
-        params = {**params, "key": self.api_key}
+        """
+        Internal helper to perform a GET request against the API.
+
+        Adds the API key to params in place; callers pass a dict they own.
+        """
+        params["key"] = self.api_key
         response = self.session.get(
             f"{self.BASE_URL}/{endpoint}",
             params=params,
+            headers=self.headers,
             timeout=self.timeout,
         )
         response.raise_for_status()
-        return response.json()
+        # Straight from bytes: orjson (when installed) skips decoding to str first
+        return json_loads(response.content)
 
     def search_videos(
         self,
@@ -80,8 +238,7 @@ class YouTubeClient:
             Dict containing the search metadata and simplified video records.
         """
         params: Dict[str, Any] = {
-            "part": "snippet",
-            "type": "video",
+            **SEARCH_PARAMS,
             "q": query,
             "maxResults": max(1, min(max_results, 50)),
             "order": order,
@@ -92,20 +249,7 @@ class YouTubeClient:
             params["videoDuration"] = video_duration
 
         data = self._request("search", params)
-        videos: List[Dict[str, Any]] = []
-        for item in data.get("items", []):
-            snippet = item.get("snippet", {})
-            videos.append(
-                {
-                    "video_id": item.get("id", {}).get("videoId"),
-                    "title": snippet.get("title"),
-                    "description": snippet.get("description"),
-                    "channel_title": snippet.get("channelTitle"),
-                    "channel_id": snippet.get("channelId"),
-                    "publish_time": snippet.get("publishTime"),
-                    "thumbnails": snippet.get("thumbnails", {}),
-                }
-            )
+        videos = [_video(item) for item in data.get("items", [])]
 
         return {
             "query": query,
@@ -114,6 +258,63 @@ class YouTubeClient:
             "next_page_token": data.get("nextPageToken"),
         }
 
+    def iter_search_videos(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        order: str = "relevance",
+        safe_search: str = "moderate",
+        video_duration: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield search results across pages, fetching 50 per request.
+
+        The next page is fetched on a background thread while the caller
+        consumes the current one. The API stops paging after roughly 500
+        results for any query.
+
+        Args:
+            query: Search query string.
+            max_results: Stop after this many videos (default: every page).
+            order: Sorting order (e.g., relevance, viewCount, date).
+            safe_search: Safety filtering (none, moderate, strict).
+            video_duration: Optional duration filter (any, short, medium, long).
+
+        Yields:
+            Video dicts shaped as in search_videos.
+        """
+        params: Dict[str, Any] = {
+            **SEARCH_PARAMS,
+            "q": query,
+            "maxResults": 50,
+            "order": order,
+            "safeSearch": safe_search,
+        }
+        if video_duration:
+            params["videoDuration"] = video_duration
+
+        remaining = max_results
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            # Each request gets its own params dict, as _request adds the key to it
+            future = executor.submit(self._request, "search", dict(params))
+            while future is not None and (remaining is None or remaining > 0):
+                data = future.result()
+                items = data.get("items", [])
+                token = data.get("nextPageToken")
+                future = None
+                if items and token and (remaining is None or remaining > len(items)):
+                    future = executor.submit(
+                        self._request, "search", {**params, "pageToken": token}
+                    )
+
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+                yield from map(_video, items)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_channel_statistics(
         self,
         channel_id: str,
@@ -127,37 +328,57 @@ class YouTubeClient:
         Returns:
             Dict containing channel metadata and statistics.
         """
+        if not _VALID_ID.fullmatch(channel_id):
+            return _missing_channel(channel_id)
         data = self._request(
             "channels",
-            {
-                "part": "snippet,statistics,brandingSettings",
-                "id": channel_id,
-            },
+            {"part": CHANNEL_PARTS, "fields": CHANNEL_FIELDS, "id": channel_id},
         )
+        return _channel_results(data, [channel_id])[0]
 
-        if not data.get("items"):
-            return {"error": f"Channel {channel_id} not found"}
+    def get_channel_statistics_many(
+        self,
+        channel_ids: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch statistics for several channels, up to 50 IDs per request.
 
-        item = data["items"][0]
-        snippet = item.get("snippet", {})
-        statistics = item.get("statistics", {})
-        branding = item.get("brandingSettings", {}).get("channel", {})
+        Batches are fetched in parallel over the client's session.
 
-        return {
-            "channel_id": channel_id,
-            "title": snippet.get("title"),
-            "description": snippet.get("description"),
-            "published_at": snippet.get("publishedAt"),
-            "custom_url": snippet.get("customUrl"),
-            "thumbnails": snippet.get("thumbnails", {}),
-            "country": snippet.get("country"),
-            "view_count": int(statistics.get("viewCount", 0)),
-            "subscriber_count": int(statistics.get("subscriberCount", 0))
-            if statistics.get("hiddenSubscriberCount") is not True
-            else None,
-            "video_count": int(statistics.get("videoCount", 0)),
-            "keywords": branding.get("keywords"),
-        }
+        Args:
+            channel_ids: YouTube channel IDs.
+
+        Returns:
+            One get_channel_statistics result per ID, in input order.
+        """
+        batches = [
+            channel_ids[i:i + CHANNEL_BATCH_SIZE]
+            for i in range(0, len(channel_ids), CHANNEL_BATCH_SIZE)
+        ]
+        if len(batches) <= 1:
+            return self._get_channel_batch(channel_ids) if channel_ids else []
+
+        with ThreadPoolExecutor(max_workers=min(len(batches), CHANNEL_BATCH_WORKERS)) as executor:
+            return [
+                channel
+                for channels in executor.map(self._get_channel_batch, batches)
+                for channel in channels
+            ]
+
+    def _get_channel_batch(self, channel_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch one channels request's worth of IDs, skipping malformed ones."""
+        valid_ids = [channel_id for channel_id in channel_ids if _VALID_ID.fullmatch(channel_id)]
+        if not valid_ids:
+            return [_missing_channel(channel_id) for channel_id in channel_ids]
+        try:
+            data = self._request(
+                "channels",
+                {"part": CHANNEL_PARTS, "fields": CHANNEL_FIELDS, "id": ",".join(valid_ids)},
+            )
+            return _channel_results(data, channel_ids)
+        except HTTP_ERRORS as e:
+            logger.error(f"YouTube channels error: {e}")
+            return [{"error": str(e)} for _ in channel_ids]
 
     def get_playlist_items(
         self,
@@ -174,29 +395,19 @@ class YouTubeClient:
         Returns:
             Dict with playlist metadata and list of videos.
         """
+        if not _VALID_ID.fullmatch(playlist_id):
+            return {"error": f"Invalid playlist ID: {playlist_id!r}"}
         data = self._request(
             "playlistItems",
             {
-                "part": "snippet,contentDetails",
+                "part": PLAYLIST_PARTS,
+                "fields": PLAYLIST_FIELDS,
                 "playlistId": playlist_id,
                 "maxResults": max(1, min(max_results, 50)),
             },
         )
 
-        items: List[Dict[str, Any]] = []
-        for item in data.get("items", []):
-            snippet = item.get("snippet", {})
-            content_details = item.get("contentDetails", {})
-            items.append(
-                {
-                    "video_id": content_details.get("videoId"),
-                    "title": snippet.get("title"),
-                    "description": snippet.get("description"),
-                    "published_at": snippet.get("publishedAt"),
-                    "position": snippet.get("position"),
-                    "thumbnails": snippet.get("thumbnails", {}),
-                }
-            )
+        items = [_playlist_item(item) for item in data.get("items", [])]
 
         return {
             "playlist_id": playlist_id,
@@ -205,6 +416,47 @@ class YouTubeClient:
             "next_page_token": data.get("nextPageToken"),
         }
 
+    def iter_playlist_items(
+        self,
+        playlist_id: str,
+        max_results: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a playlist's items across pages, fetching 50 per request.
+
+        Pages are requested only as the items are consumed, so very large
+        playlists can be processed without holding them in memory.
+
+        Args:
+            playlist_id: YouTube playlist ID.
+            max_results: Stop after this many items (default: the whole playlist).
+
+        Yields:
+            Item dicts shaped as in get_playlist_items; none for a malformed ID.
+        """
+        if not _VALID_ID.fullmatch(playlist_id):
+            logger.warning(f"Invalid YouTube playlist ID: {playlist_id!r}")
+            return
+        params: Dict[str, Any] = {
+            "part": PLAYLIST_PARTS,
+            "fields": PLAYLIST_FIELDS,
+            "playlistId": playlist_id,
+            "maxResults": 50,
+        }
+        remaining = max_results
+        while remaining is None or remaining > 0:
+            data = self._request("playlistItems", params)
+            items = data.get("items", [])
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            yield from map(_playlist_item, items)
+
+            token = data.get("nextPageToken")
+            if not token:
+                return
+            params["pageToken"] = token
+
 
 __all__ = ["YouTubeClient"]
 